@@ -0,0 +1,257 @@
+"""Time the stages of an auto eda run on synthetic data and write the results to json, no network access needed.
+
+Run from the project root, optionally comparing against an earlier results file:
+    python -m benchmark.run_benchmarks --rows 100000 --columns 20 --output results.json --baseline old_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Optional
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import scipy
+import seaborn as sns
+
+import edatk
+import edatk._core as core
+import edatk._single_variable._summary_statistics as sst
+import edatk._multi_variable._auto_eda_multi_variable as mv
+import edatk._multi_variable._visuals as mviz
+import edatk._html_report._report_builder as html_build
+from edatk._html_report._template_ops import _build_template
+from edatk._multi_variable._correlation import CorrelationEngine
+from benchmark.synthetic_data import make_synthetic_frame
+
+
+def _stage_type_inference(df: pd.DataFrame, context: dict):
+    """Infer the data type of every column."""
+    sst._get_column_type_index(df)
+
+
+def _stage_fused_stats(df: pd.DataFrame, context: dict):
+    """Profile every column in one fused pass each."""
+    for col in df.columns:
+        sst._op_column_profile(df, col, data_type=context['column_types'][col])
+        sst._clear_column_cache()
+
+
+def _stage_distribution_fits(df: pd.DataFrame, context: dict):
+    """Fit the registered distributions to every numeric column."""
+    for col in df.columns:
+        if context['column_types'][col] == 'numeric':
+            sst._get_theoritical_distributions(df, col)
+            sst._clear_column_cache()
+
+
+def _stage_pair_charts(df: pd.DataFrame, context: dict):
+    """Draw the first max_pairs relationship charts without saving them."""
+    column_combinations = mv._get_column_combinations(df)[:context['max_pairs']]
+    relationship_ops = mv._get_relationship_ops(column_combinations, column_types=context['column_types'], render_mode=context['render_mode'])
+    core._bind_to_console_html(section='multi_variable', run_type='charts', run_dict=relationship_ops, html_report=None, show_chart=False, df=df)
+
+
+def _stage_heatmap(df: pd.DataFrame, context: dict):
+    """Compute correlations and draw the correlation heatmap."""
+    fig, axs, _ = core.get_fig_ax(1)
+    mviz._plot_heatmap(df, axs[0, 0], correlation_engine=CorrelationEngine(df))
+    plt.close('all')
+
+
+def _stage_png_writing(df: pd.DataFrame, context: dict):
+    """Save one drawn page of charts as a png, drawing happens in the untimed setup."""
+    context['html_report'].save_chart_to_image(context['page_fig'], f'edatk_benchmark_{time.perf_counter_ns()}', section='single_variable')
+
+
+def _stage_template_rendering(df: pd.DataFrame, context: dict):
+    """Render the html template for components shaped like a report of the frame."""
+    # One title, table and page of charts per column
+    single_variable_charts = []
+    for col in df.columns:
+        single_variable_charts.append({'render_type': 'title', 'render_value': col})
+        single_variable_charts.append({'render_type': 'table', 'render_value': [{'metric': f'Metric {i}', 'value': i} for i in range(16)]})
+        single_variable_charts.append({'render_type': 'png', 'render_value': f'edatk_charts_{col}.png'})
+        single_variable_charts.append({'render_type': 'lb', 'render_value': 'None'})
+    multi_variable_charts = [{'render_type': 'png', 'render_value': f'edatk_charts_pairs_{i}.png'} for i in range(context['max_pairs'])]
+    _build_template(single_variable_charts=single_variable_charts, multi_variable_charts=multi_variable_charts, performance_charts=[])
+
+
+# Stage name -> timed function, in run order
+_STAGES = {
+    'type_inference': _stage_type_inference,
+    'fused_stats': _stage_fused_stats,
+    'distribution_fits': _stage_distribution_fits,
+    'pair_charts': _stage_pair_charts,
+    'heatmap': _stage_heatmap,
+    'png_writing': _stage_png_writing,
+    'template_rendering': _stage_template_rendering
+}
+
+
+def _draw_page(df: pd.DataFrame) -> object:
+    """Draw one full page of histograms for the png writing stage.
+
+    Args:
+        df (pd.DataFrame): synthetic frame
+
+    Returns:
+        matplotlib fig: drawn page
+    """
+    numeric_columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])] or [None]
+    fig, axs, row_col_dict = core.get_fig_ax(core._CHARTS_PER_PAGE, 2)
+    for i in range(core._CHARTS_PER_PAGE):
+        row, col = row_col_dict[i]
+        column_name = numeric_columns[i % len(numeric_columns)]
+        if column_name is not None:
+            axs[row, col].hist(df[column_name].dropna(), bins=50)
+    fig.canvas.draw()
+    return fig
+
+
+def _get_environment() -> dict:
+    """Return the versions and machine details a result was measured on.
+
+    Returns:
+        dict: versions and machine details
+    """
+    return {
+        'edatk': edatk.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__,
+        'seaborn': sns.__version__,
+        'scipy': scipy.__version__
+    }
+
+
+def run_benchmarks(
+        rows: int = 100000,
+        columns: int = 10,
+        dtype_mix: Optional[dict[str, float]] = None,
+        cardinality: int = 20,
+        null_rate: float = 0.05,
+        skew: float = 1.0,
+        random_state: int = 0,
+        repeats: int = 3,
+        max_pairs: int = 10,
+        render_mode: str = 'default',
+        stages: Optional[list[str]] = None
+    ) -> dict:
+    """Time each stage on a synthetic frame, repeats times.
+
+    Args:
+        rows (int, optional): synthetic rows. Defaults to 100000.
+        columns (int, optional): synthetic columns. Defaults to 10.
+        dtype_mix (dict[str, float], optional): relative share of 'numeric', 'integer', 'string' and 'bool' columns. Defaults to None.
+        cardinality (int, optional): distinct values of integer and string columns. Defaults to 20.
+        null_rate (float, optional): share of missing values per column. Defaults to 0.05.
+        skew (float, optional): skew of numeric values and categorical frequencies. Defaults to 1.0.
+        random_state (int, optional): synthetic data seed. Defaults to 0.
+        repeats (int, optional): timed runs per stage. Defaults to 3.
+        max_pairs (int, optional): column pairs charted by the pair chart stage. Defaults to 10.
+        render_mode (str, optional): 'default' or 'fast' charts. Defaults to 'default'.
+        stages (list[str], optional): stages to run, all if not passed. Defaults to None.
+
+    Returns:
+        dict: environment, parameters and per stage seconds (every run, min and median)
+    """
+    if stages is None:
+        stages = list(_STAGES)
+    assert set(stages) <= set(_STAGES), f"stages must be in {list(_STAGES)}"
+    assert repeats > 0, "repeats must be positive"
+    parameters = {
+        'rows': rows, 'columns': columns, 'dtype_mix': dtype_mix, 'cardinality': cardinality, 'null_rate': null_rate,
+        'skew': skew, 'random_state': random_state, 'repeats': repeats, 'max_pairs': max_pairs, 'render_mode': render_mode
+    }
+    df = make_synthetic_frame(rows, columns, dtype_mix, cardinality, null_rate, skew, random_state)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as report_dir:
+        # Untimed inputs shared by the stages
+        context = {
+            'column_types': dict(sst._get_column_type_index(df)),
+            'render_mode': render_mode,
+            'max_pairs': max_pairs,
+            'html_report': html_build.HTMLReport(report_dir),
+            'page_fig': _draw_page(df) if 'png_writing' in stages else None
+        }
+        for stage in stages:
+            run_seconds = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                _STAGES[stage](df, context)
+                run_seconds.append(time.perf_counter() - start)
+            results[stage] = {'min_seconds': min(run_seconds), 'median_seconds': statistics.median(run_seconds), 'run_seconds': run_seconds}
+        plt.close('all')
+
+    return {
+        'timestamp': datetime.utcnow().isoformat(),
+        'environment': _get_environment(),
+        'parameters': parameters,
+        'stages': results
+    }
+
+
+def compare_results(current: dict, baseline: dict) -> dict[str, float]:
+    """Return the median time ratio (current / baseline) of every stage in both results, above 1 is slower.
+
+    Args:
+        current (dict): results of run_benchmarks
+        baseline (dict): earlier results of run_benchmarks, ideally with the same parameters
+
+    Returns:
+        dict[str, float]: stage -> median seconds ratio
+    """
+    ratios = {}
+    for stage, stage_results in current['stages'].items():
+        if stage in baseline['stages'] and baseline['stages'][stage]['median_seconds'] > 0:
+            ratios[stage] = stage_results['median_seconds'] / baseline['stages'][stage]['median_seconds']
+    return ratios
+
+
+def _main():
+    parser = argparse.ArgumentParser(description='Time edatk stages on synthetic data.')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--cardinality', type=int, default=20)
+    parser.add_argument('--null-rate', type=float, default=0.05)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--random-state', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--max-pairs', type=int, default=10)
+    parser.add_argument('--render-mode', default='default', choices=['default', 'fast'])
+    parser.add_argument('--stages', nargs='+', choices=list(_STAGES), default=None)
+    parser.add_argument('--output', default='benchmark_results.json', help='json file to write results to')
+    parser.add_argument('--baseline', default=None, help='earlier json results to compare against')
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        rows=args.rows, columns=args.columns, cardinality=args.cardinality, null_rate=args.null_rate, skew=args.skew,
+        random_state=args.random_state, repeats=args.repeats, max_pairs=args.max_pairs, render_mode=args.render_mode, stages=args.stages
+    )
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    # Print stage medians and ratios against the baseline
+    ratios = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            ratios = compare_results(results, json.load(f))
+    for stage, stage_results in results['stages'].items():
+        ratio_str = f'  x{ratios[stage]:.2f} vs baseline' if stage in ratios else ''
+        print(f'{stage:20}: {stage_results["median_seconds"]:.3f}s{ratio_str}')
+    print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,101 @@
+from typing import Mapping, Optional
+import numpy as np
+import pandas as pd
+
+
+# Share of columns per data type when no mix is passed
+_DEFAULT_DTYPE_MIX = {
+    'numeric': 0.6,
+    'integer': 0.1,
+    'string': 0.2,
+    'bool': 0.1
+}
+
+
+def _get_dtype_column_counts(columns: int, dtype_mix: Mapping[str, float]) -> dict[str, int]:
+    """Split a column count across data types by share, largest remainders get the leftover columns.
+
+    Args:
+        columns (int): total number of columns
+        dtype_mix (Mapping[str, float]): data type -> relative share
+
+    Returns:
+        dict[str, int]: data type -> number of columns, in dtype_mix order
+    """
+    assert all(share >= 0 for share in dtype_mix.values()) and sum(dtype_mix.values()) > 0, "dtype_mix shares must be non negative with a positive sum"
+    total_share = sum(dtype_mix.values())
+    exact_counts = {dtype: columns * share / total_share for dtype, share in dtype_mix.items()}
+    counts = {dtype: int(np.floor(exact)) for dtype, exact in exact_counts.items()}
+    leftover = columns - sum(counts.values())
+    for dtype in sorted(exact_counts, key=lambda dtype: counts[dtype] - exact_counts[dtype])[:leftover]:
+        counts[dtype] += 1
+    return counts
+
+
+def _get_level_probabilities(cardinality: int, skew: float) -> np.ndarray:
+    """Return Zipf like level probabilities, uniform when skew is 0.
+
+    Args:
+        cardinality (int): number of levels
+        skew (float): exponent of the rank decay
+
+    Returns:
+        np.ndarray: probability per level, summing to 1
+    """
+    weights = 1.0 / np.arange(1, cardinality + 1) ** skew
+    return weights / weights.sum()
+
+
+def make_synthetic_frame(
+        rows: int = 10000,
+        columns: int = 10,
+        dtype_mix: Optional[Mapping[str, float]] = None,
+        cardinality: int = 20,
+        null_rate: float = 0.0,
+        skew: float = 0.0,
+        random_state: int = 0
+    ) -> pd.DataFrame:
+    """Return a deterministic synthetic dataframe for benchmarks and offline tests.
+
+    Numeric columns are normal (skew 0) or lognormal with sigma = skew. Integer and string columns draw from cardinality levels with Zipf like frequencies decaying with skew. Bool columns are 0/1 floats so they can hold missing values.
+
+    Args:
+        rows (int, optional): number of rows. Defaults to 10000.
+        columns (int, optional): number of columns. Defaults to 10.
+        dtype_mix (Mapping[str, float], optional): relative share of 'numeric', 'integer', 'string' and 'bool' columns. Defaults to None (60% numeric, 10% integer, 20% string, 10% bool).
+        cardinality (int, optional): distinct values of integer and string columns. Defaults to 20.
+        null_rate (float, optional): share of missing values in every column (0 to 1). Defaults to 0.0.
+        skew (float, optional): skew of numeric values and categorical frequencies, 0 for none. Defaults to 0.0.
+        random_state (int, optional): seed, the same arguments always return the same frame. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: synthetic frame with columns named by data type, e.g. numeric_0, string_1
+    """
+    if dtype_mix is None:
+        dtype_mix = _DEFAULT_DTYPE_MIX
+    assert set(dtype_mix) <= set(_DEFAULT_DTYPE_MIX), f"dtype_mix keys must be in {list(_DEFAULT_DTYPE_MIX)}"
+    assert 0.0 <= null_rate <= 1.0, "null_rate must be between 0 and 1"
+    assert cardinality > 0, "cardinality must be positive"
+    rng = np.random.default_rng(random_state)
+    level_probabilities = _get_level_probabilities(cardinality, skew)
+    string_levels = np.array([f'level_{i}' for i in range(cardinality)], dtype=object)
+
+    data = {}
+    for dtype, dtype_columns in _get_dtype_column_counts(columns, dtype_mix).items():
+        for i in range(dtype_columns):
+            if dtype == 'numeric':
+                values = rng.lognormal(sigma=skew, size=rows) if skew > 0 else rng.normal(size=rows)
+            elif dtype == 'integer':
+                values = rng.choice(cardinality, size=rows, p=level_probabilities)
+            elif dtype == 'string':
+                values = string_levels[rng.choice(cardinality, size=rows, p=level_probabilities)]
+            else:
+                values = (rng.random(rows) < 0.5).astype(np.float64)
+
+            # Missing values at random positions, integer columns become floats
+            if null_rate > 0:
+                missing = rng.random(rows) < null_rate
+                values = values.astype(object if dtype == 'string' else np.float64)
+                values[missing] = None if dtype == 'string' else np.nan
+            data[f'{dtype}_{i}'] = values
+    return pd.DataFrame(data)
@@ -1,18 +1,63 @@
+import importlib
 import warnings
+from typing import TYPE_CHECKING
 warnings.filterwarnings("ignore", module = "matplotlib\..*" )
 warnings.filterwarnings("ignore", module = "seaborn\..*" )
 warnings.filterwarnings("ignore", message="FixedFormatter should only be used together with FixedLocator")
 warnings.filterwarnings("ignore", message="Converting input from bool to <class 'numpy.uint8'> for compatibility.")
 
-from ._core import get_fig_ax
-from ._auto_eda import auto_eda
-from ._modeling._cross_val_custom import cross_validate_custom
+# Static imports for type checkers and IDEs only, at runtime names load on first access below
+if TYPE_CHECKING:
+    from ._core import get_fig_ax
+    from ._auto_eda import auto_eda
+    from ._streaming._auto_eda_streaming import auto_eda_from_path
+    from ._modeling._cross_val_custom import cross_validate_custom
+    from ._single_variable._distributions import register_distribution, unregister_distribution, list_distributions
+    from ._run_stats import RunStats
+
+
+# Public name -> defining module, imported on first access so plotting and stats stacks only load when used
+_lazy_exports = {
+    "auto_eda": "._auto_eda",
+    "auto_eda_from_path": "._streaming._auto_eda_streaming",
+    "get_fig_ax": "._core",
+    "cross_validate_custom": "._modeling._cross_val_custom",
+    "register_distribution": "._single_variable._distributions",
+    "unregister_distribution": "._single_variable._distributions",
+    "list_distributions": "._single_variable._distributions",
+    "RunStats": "._run_stats"
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name from its module on first access (PEP 562), then cache it on the package.
+
+    Args:
+        name (str): attribute name
+
+    Returns:
+        object: the public function or class
+    """
+    if name in _lazy_exports:
+        value = getattr(importlib.import_module(_lazy_exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_exports))
 
 
 __all__ = [
     "auto_eda",
+    "auto_eda_from_path",
     "get_fig_ax",
-    "cross_validate_custom"
+    "cross_validate_custom",
+    "register_distribution",
+    "unregister_distribution",
+    "list_distributions",
+    "RunStats"
 ]
 
 
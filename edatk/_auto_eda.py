@@ -1,11 +1,15 @@
 import pandas as pd
 from typing import Optional
 
-from edatk._single_variable._auto_eda_single_variable import _auto_eda_columns
-from edatk._multi_variable._auto_eda_multi_variable import _auto_eda_mutli_variable
+from edatk._single_variable._auto_eda_single_variable import _auto_eda_columns, _auto_eda_column_visuals, _get_column_visuals
+from edatk._multi_variable._auto_eda_multi_variable import _auto_eda_mutli_variable, _get_relationship_sections, _get_heatmap_ops
+from edatk._multi_variable._correlation import CorrelationEngine
 from edatk._single_variable._cardinality_reduction import _add_low_cardinality_target_column
-from edatk._core import _check_for_pandas_df
+from edatk._core import _check_for_pandas_df, _measure_op
+import edatk._single_variable._summary_statistics as sst
 import edatk._html_report._report_builder as html_build
+import edatk._scheduler as scheduler
+from edatk._run_stats import RunStats, _report_run_stats
 
 
 def auto_eda(
@@ -15,8 +19,21 @@ def auto_eda(
         target_low_cardinality_visuals: int = 3, 
         save_path: Optional[str] = None, 
         ignore_errors: bool = True, 
-        show_chart: bool = True):
-    """Run auto eda on a dataframe
+        show_chart: bool = True,
+        n_jobs: int = 1,
+        approximate: bool = False,
+        hll_precision: int = 14,
+        quantile_sketch_k: int = 200,
+        distribution_fit_timeout: Optional[float] = None,
+        correlation_method: str = 'pearson',
+        max_pairs: Optional[int] = None,
+        pair_threshold: Optional[float] = None,
+        top_non_target_pairs: int = 0,
+        render_mode: str = 'default',
+        time_budget: Optional[float] = None,
+        trace_memory: bool = False,
+        performance_section: bool = False) -> RunStats:
+    """Run auto eda on a dataframe, printing or saving the report, and return the run's performance stats.
 
     Args:
         df (pd.DataFrame): input dataframe
@@ -26,7 +43,26 @@ def auto_eda(
         save_path (str, optional): Directory to save html report to. If none then results printed to console instead. Defaults to None.
         ignore_errors (bool, optional): Ignores errors and runs as much as possible. Defaults to True.
         show_chart (bool, optional): Display charts, likely always want this as True unless testing or working with very large datasets. Defaults to True.
+        n_jobs (int, optional): Number of worker processes used to profile columns and render pair chart pages when saving an html report, -1 uses all cpus. Console output always runs serially. Defaults to 1.
+        approximate (bool, optional): Estimate distinct counts (used for statistics and column type inference) with HyperLogLog sketches, and draw box plots and ECDFs from quantile sketches instead of every row. Quantile statistics stay exact, one partition of in memory rows is cheaper than sketching them. Defaults to False.
+        hll_precision (int, optional): HyperLogLog precision (4 to 18) when approximate, higher is more accurate and uses 2**precision bytes per column. Defaults to 14.
+        quantile_sketch_k (int, optional): Quantile sketch size when approximate, used for the box plot and ECDF. Rank error shrinks roughly as 1/k. Defaults to 200.
+        distribution_fit_timeout (float, optional): Seconds allowed for the distribution fits of a numeric column. When set, each candidate distribution (see register_distribution) fit is limited to this many seconds, in one process pool shared by the run or inside the column workers when n_jobs > 1. Fits still running at the limit are dropped from the rankings, noted in the report and listed in the returned RunStats skipped_ops. Defaults to None (fits run serially with no limit).
+        correlation_method (str, optional): Correlation used by the heatmaps, 'pearson' or rank based 'spearman'. Computed once per run over the numeric columns. Defaults to 'pearson'.
+        max_pairs (int, optional): Only chart this many column relationships, the most associated first. Pairs are scored from 0 to 1 with absolute correlation (numeric pairs), correlation ratio (numeric and categorical) or Cramér's V (categorical pairs). Defaults to None (all pairs).
+        pair_threshold (float, optional): Only chart column relationships scoring at least this (0 to 1), can be combined with max_pairs. Defaults to None.
+        top_non_target_pairs (int, optional): When target_column is passed, also chart this many of the most associated pairs not involving the target in their own section. Defaults to 0.
+        render_mode (str, optional): 'fast' draws box plots, histograms, ECDFs and KDEs with matplotlib from aggregates computed once per column (bins, box statistics, a ranked ECDF grid and a binned KDE), so drawing time does not grow with row count. Swarm plots become strip plots of ranked points. Defaults to 'default' (seaborn charts from rows).
+        time_budget (float, optional): Seconds the run should finish in. Every chart's cost is estimated from the row count, column types and render mode, and charts are planned in order of value (histograms, box plots, count plots and heatmaps, then ECDFs, best fits and relationships, then swarms and distribution fits) with the cheapest first within each tier. Charts left out of the plan, or still waiting when their estimate no longer fits the time left, are skipped and listed at the end of the report. Summary tables always run. Each swarm layout gets 2% of the budget (at most 0.5s), swarms that do not fit are drawn as strip plots. Defaults to None (no limit).
+        trace_memory (bool, optional): Record the peak memory allocated by every op with tracemalloc in the returned run stats. Tracing slows allocation heavy ops. Defaults to False.
+        performance_section (bool, optional): Add a Performance section (run totals, time per column and the slowest ops) to the end of the report or console output. Defaults to False.
+
+    Returns:
+        RunStats: wall time, cpu time and (if traced) peak memory of every op, column profile, chart, pair and page save, plus any ops skipped by the time budget or distribution fit timeout. Export with to_json or to_dataframe. The report itself is still printed or saved, so the return value can be ignored.
     """
+    # Run clock starts before any work
+    run_stats = RunStats(trace_memory=trace_memory)
+
      # Initiate html file ops if needed
     if save_path:
         html_report = html_build.HTMLReport(save_path)
@@ -34,6 +70,8 @@ def auto_eda(
         html_report = None
 
     # Error checking
+    assert render_mode in ['default', 'fast'], "render_mode must be 'default' or 'fast'"
+    budget = scheduler.TimeBudget(time_budget) if time_budget is not None else None
     df2 = df.copy()
     _check_for_pandas_df(df2)
 
@@ -41,26 +79,58 @@ def auto_eda(
     if column_list is None:
         column_list = list(df2.columns)
 
+    # Check that target is in column list
+    if (target_column is not None) and (target_column not in column_list):
+        column_list.append(target_column)
+
+    # Infer column types once, shared by every stage below
+    if not approximate:
+        hll_precision = None
+        quantile_sketch_k = None
+    with _measure_op(run_stats, 'setup', None, 'Type Inference'):
+        column_types = sst._get_column_type_index(df2, column_list, hll_precision=hll_precision)
+
     # Add new target column for large cardinality
     if target_column is not None:
 
         # Add an additional target column that is low cardinality for visualization
-        _add_low_cardinality_target_column(df=df2, target_column=target_column, desired_cardinality=target_low_cardinality_visuals)
-            
-        # Check that target is in column list
-        if target_column not in column_list:
-            column_list.append(target_column)
+        with _measure_op(run_stats, 'setup', target_column, 'Low Cardinality Target'):
+            _add_low_cardinality_target_column(df=df2, target_column=target_column, desired_cardinality=target_low_cardinality_visuals, column_types=column_types, hll_precision=hll_precision)
+
+    # Plan every chart against the time budget, pairs are selected up front so the plan knows them
+    correlation_engine = None
+    relationship_sections = None
+    if budget is not None:
+        correlation_engine = CorrelationEngine(df2, column_list)
+        with _measure_op(run_stats, 'multi_variable', None, 'Pair Selection'):
+            relationship_sections = _get_relationship_sections(df2, column_list, target_column, column_types, correlation_engine, max_pairs, pair_threshold, top_non_target_pairs)
+        column_visuals = {col: list(_get_column_visuals(column_types[col], render_mode, quantile_sketch_k, distribution_fit_timeout)) for col in column_list if column_types.get(col) in _auto_eda_column_visuals}
+        relationship_combinations = [combo for _, section_combinations in relationship_sections for combo in section_combinations]
+        heatmap_names = list(_get_heatmap_ops(df2, correlation_engine, target_column, correlation_method))
+        budget.plan(scheduler._get_op_costs(df2, column_visuals, relationship_combinations, heatmap_names, column_types, render_mode, distribution_fit_timeout, budget.swarm_seconds))
 
     # Run single column to console and bind to html if needed
-    _auto_eda_columns(df=df2, column_list=column_list, html_report=html_report, ignore_errors=ignore_errors, show_chart=show_chart)
+    _auto_eda_columns(df=df2, column_list=column_list, html_report=html_report, ignore_errors=ignore_errors, show_chart=show_chart, column_types=column_types, n_jobs=n_jobs, hll_precision=hll_precision, quantile_sketch_k=quantile_sketch_k, distribution_fit_timeout=distribution_fit_timeout, render_mode=render_mode, time_budget=budget, run_stats=run_stats)
 
     # Run multi column
-    df2.head()
-    _auto_eda_mutli_variable(df=df2, column_list=column_list, target_column=target_column, html_report=html_report, ignore_errors=ignore_errors, show_chart=show_chart)
+    _auto_eda_mutli_variable(df=df2, column_list=column_list, target_column=target_column, html_report=html_report, ignore_errors=ignore_errors, show_chart=show_chart, column_types=column_types, n_jobs=n_jobs, correlation_method=correlation_method, max_pairs=max_pairs, pair_threshold=pair_threshold, top_non_target_pairs=top_non_target_pairs, render_mode=render_mode, correlation_engine=correlation_engine, relationship_sections=relationship_sections, time_budget=budget, run_stats=run_stats)
+
+    # List charts the time budget skipped
+    if budget is not None:
+        scheduler._report_skipped_ops(budget, html_report, show_chart)
+        run_stats.skipped_ops.extend(budget.skipped_ops)
+
+    # Performance section
+    if performance_section:
+        _report_run_stats(run_stats, html_report, show_chart)
 
     # Save off final html template
     if html_report:
-        html_report.build_final_template()
+        with _measure_op(run_stats, 'report', None, 'Report Template'):
+            html_report.build_final_template()
 
     # Clean up
+    sst._clear_run_cache()
     del df2
+    run_stats.finish()
+    return run_stats
@@ -1,11 +1,33 @@
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Optional
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 import seaborn as sns
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import pandas as pd
 import math
+import numpy as np
 from datetime import datetime
 
+# Lives in a module without plotting imports so modeling code can share it
+from edatk._parallel import _resolve_n_jobs
+
+
+# Max charts drawn on one figure, larger run dicts are split into pages flushed one at a time
+_CHARTS_PER_PAGE = 10
+
+
+# Swarm layout cost model, seconds per squared point count within one swarm (category), and per chart time budget
+_SWARM_SECONDS_PER_POINT_PAIR = 4e-6
+_SWARM_TIME_BUDGET = 0.5
+
+# Share of a run's time budget each swarm chart may spend on layout, capped at _SWARM_TIME_BUDGET
+_SWARM_RUN_BUDGET_SHARE = 0.02
+
+# Fewest sampled points worth drawing as a swarm, strip plots are drawn below this
+_MIN_SWARM_POINTS = 50
+
 
 def _check_for_pandas_df(df: pd.DataFrame):
     """Check that input is a pandas dataframe
@@ -16,6 +38,89 @@ def _check_for_pandas_df(df: pd.DataFrame):
     assert isinstance(df, pd.DataFrame), "df must be a pandas dataframe"
 
 
+def _init_headless_worker():
+    """Process pool initializer, forces a non interactive matplotlib backend in workers.
+    """
+    plt.switch_backend('Agg')
+
+
+def _parallel_map_ordered(func: Callable, args_iterable: Iterable[tuple], n_jobs: int) -> Iterator:
+    """Run func over argument tuples in a process pool and yield results in submission order.
+
+    Only a bounded number of tasks are in flight at once, so arguments are not all materialized up front.
+
+    Args:
+        func (Callable): module level (picklable) function to run in workers.
+        args_iterable (Iterable[tuple]): positional argument tuples, one per task.
+        n_jobs (int): number of worker processes.
+
+    Yields:
+        object: result of func for each argument tuple, in order.
+    """
+    max_pending = 2 * n_jobs
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_headless_worker) as executor:
+        pending = deque()
+        for args in args_iterable:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _get_swarm_sample_size(category_counts: Iterable[int], max_sample: int, time_budget: float = _SWARM_TIME_BUDGET) -> int:
+    """Return the largest swarm sample whose estimated layout time fits the budget.
+
+    Layout time grows with the square of the points in each swarm, so a uniform sample of n rows is estimated at n**2 * sum(category share**2) point pairs.
+
+    Args:
+        category_counts (Iterable[int]): rows per swarm (x axis category), one entry for a single swarm
+        max_sample (int): most points wanted regardless of budget
+        time_budget (float, optional): seconds allowed for the swarm layout. Defaults to _SWARM_TIME_BUDGET.
+
+    Returns:
+        int: sample size, below _MIN_SWARM_POINTS means a swarm does not fit and a strip plot should be drawn
+    """
+    counts = np.asarray(list(category_counts), dtype=np.float64)
+    total = counts.sum()
+    if total == 0:
+        return 0
+    share_squares = np.sum((counts / total) ** 2)
+    budget_sample = math.floor(math.sqrt(time_budget / (_SWARM_SECONDS_PER_POINT_PAIR * share_squares)))
+    return int(min(max_sample, budget_sample, total))
+
+
+def _get_swarm_time_budget(run_seconds: Optional[float] = None) -> float:
+    """Return the seconds one swarm chart may spend on layout.
+
+    Args:
+        run_seconds (float, optional): wall clock seconds allowed for the whole run, None for no limit. Defaults to None.
+
+    Returns:
+        float: per chart swarm layout budget, a share of the run budget capped at _SWARM_TIME_BUDGET
+    """
+    if run_seconds is None:
+        return _SWARM_TIME_BUDGET
+    return min(_SWARM_TIME_BUDGET, run_seconds * _SWARM_RUN_BUDGET_SHARE)
+
+
+def _measure_op(run_stats: object, section: str, column_name: Optional[str], op_name: str) -> object:
+    """Return a context that records an op into run stats, or does nothing without them.
+
+    Args:
+        run_stats (RunStats): run stats to record into, or None
+        section (str): section grouping
+        column_name (str, optional): column the op summarizes, None for multi column ops
+        op_name (str): op, chart or pair name
+
+    Returns:
+        context manager: measuring context
+    """
+    if run_stats is None:
+        return nullcontext()
+    return run_stats.measure(section, column_name, op_name)
+
+
 def _get_fig_size_dynamic(num_plots: int, columns: int) -> tuple[float, float]:
     """Calculate x and y figure size based on plots and columns.
 
@@ -87,6 +192,42 @@ def get_fig_ax(total_num_plots: int, columns: int = 2) -> tuple[object, object,
     return fig, axs, row_col_dict
 
 
+def _get_chart_pages(run_dict: dict[str, Callable], page_size: int = _CHARTS_PER_PAGE) -> list[dict[str, Callable]]:
+    """Split a run dict into ordered pages of at most page_size charts.
+
+    Args:
+        run_dict (dict): dictionary of chart names and functions
+        page_size (int, optional): max charts per page. Defaults to _CHARTS_PER_PAGE.
+
+    Returns:
+        list[dict]: run dict pages, in order
+    """
+    assert page_size > 0, "page_size must be positive"
+    items = list(run_dict.items())
+    return [dict(items[i:i + page_size]) for i in range(0, len(items), page_size)]
+
+
+def _flush_figure(fig: object, run_type: str, section: str, html_report: object, show_chart: bool):
+    """Save a figure to the html report or show it in console mode, then close all figures.
+
+    Args:
+        fig (matplotlib fig): figure to flush
+        run_type (string): 'chart' or 'charts', used in the image name
+        section (string): section grouping, used for html partitioning
+        html_report (HTMLReport class): html report instance or None if should just print to console
+        show_chart (bool): Whether to show chart or not when running in console mode
+    """
+    # Save figure if needed
+    if html_report and fig:
+        html_report.save_chart_to_image(fig, f'edatk_{run_type}_{section}_{datetime.utcnow().strftime("%m_%d_%Y_%H_%M_%S_%f")}', section=section)
+    else:
+        if show_chart and fig:
+            plt.show()
+    
+    # Cleanup    
+    plt.close('all')
+
+
 def _rotate_x_axis_labels(ax: object):
     """Rotate the x axis labels slightly to prevent overlapping.
 
@@ -112,6 +253,9 @@ def _bind_to_console_html(
         html_report: object, 
         show_chart: bool = True, 
         header_text: str = None, 
+        page_size: int = _CHARTS_PER_PAGE,
+        time_budget: object = None,
+        run_stats: object = None,
         **kwargs
     ):
     """Bind result of a run dict to consule or html
@@ -123,12 +267,24 @@ def _bind_to_console_html(
         html_report (HTMLReport class): html report instance or None if should just print to console
         show_chart (bool): Whether to show chart or not when running in console mode
         header_text (string): If not none, will print or title with a header text
+        page_size (int): max charts per figure, each page is drawn, flushed and closed before the next starts
+        time_budget (TimeBudget, optional): if set, charts it does not admit are skipped (tables always run)
+        run_stats (RunStats, optional): if set, records the cost of every op and page save
         **kwargs: any arguments that should be passed into each row in run_dict
     """
     
     # Check for only valid run types
     assert run_type in ['table', 'chart', 'charts'], "Invalid run type, must be table or charts"
 
+    # Column the ops summarize, None for multi column ops
+    column_name = kwargs.get('column_name', getattr(kwargs.get('profile'), 'column_name', None))
+
+    # Drop charts over the time budget, nothing (not even the header) is output if all are dropped
+    if time_budget is not None and run_type != 'table':
+        run_dict = time_budget.filter_run_dict(run_dict, column_name)
+        if len(run_dict) == 0:
+            return None
+
     # Operation header
     if header_text:
         if html_report:
@@ -151,7 +307,8 @@ def _bind_to_console_html(
         for k, op in run_dict.items():
             
             # Execute op
-            op_result = op(**kwargs)
+            with _measure_op(run_stats, section, column_name, k):
+                op_result = op(**kwargs)
             
             # Dynamic format bind
             if isinstance(op_result, str):
@@ -193,34 +350,29 @@ def _bind_to_console_html(
 
 
     elif run_type in['chart', 'charts']:
-       
-        # Visual layout
-        fig, axs, row_col_dict = get_fig_ax(len(run_dict), 2)
 
-        # Build visuals
-        for i, (k, visual) in enumerate(run_dict.items()):
-            # Find chart placement
-            row, col = row_col_dict[i]
-            ax = axs[row, col]
+        # One figure per page so only one page of artists is held in memory
+        for page in _get_chart_pages(run_dict, page_size):
 
-            # Plot chart
-            visual(**kwargs, ax=ax)
+            # Visual layout
+            fig, axs, row_col_dict = get_fig_ax(len(page), 2)
+
+            # Build visuals
+            for i, (k, visual) in enumerate(page.items()):
+                # Find chart placement
+                row, col = row_col_dict[i]
+                ax = axs[row, col]
+
+                # Plot chart
+                with _measure_op(run_stats, section, column_name, k):
+                    visual(**kwargs, ax=ax)
+
+            with _measure_op(run_stats, section, column_name, 'Page Save'):
+                _flush_figure(fig, run_type, section, html_report, show_chart)
 
     elif run_type == 'chartx':
 
         # Single chart bind to fig
         for i, (k, visual) in enumerate(run_dict.items()):
             fig = visual(**kwargs)
-
-
-    if run_type in ['chart', 'charts']:
-
-        # Save figure if needed
-        if html_report and fig:
-            html_report.save_chart_to_image(fig, f'edatk_{run_type}_{section}_{datetime.utcnow().strftime("%m_%d_%Y_%H_%M_%S_%f")}', section=section)
-        else:
-            if show_chart and fig:
-                plt.show()
-        
-        # Cleanup    
-        plt.close('all')
+        _flush_figure(fig, run_type, section, html_report, show_chart)
@@ -1,5 +1,6 @@
 import pathlib
 import os
+import io
 from typing import Optional
 import webbrowser
 import glob
@@ -17,6 +18,7 @@ class HTMLReport:
         self._create_report_directory(save_path)
         self._single_variable_charts = []
         self._multi_variable_charts = []
+        self._performance_charts = []
 
 
     def _create_report_directory(self, save_path: str, remove_old_files: bool = True):
@@ -62,6 +64,8 @@ class HTMLReport:
             self._single_variable_charts.append({'render_type':'title', 'render_value': title})
         elif section == 'multi_variable':
             self._multi_variable_charts.append({'render_type':'title', 'render_value': title})
+        elif section == 'performance':
+            self._performance_charts.append({'render_type':'title', 'render_value': title})
         
 
     def save_text(self, text: str, section: str):
@@ -76,6 +80,8 @@ class HTMLReport:
             self._single_variable_charts.append({'render_type':'text', 'render_value': text})
         elif section == 'multi_variable':
             self._multi_variable_charts.append({'render_type':'text', 'render_value': text})
+        elif section == 'performance':
+            self._performance_charts.append({'render_type':'text', 'render_value': text})
 
 
     def save_chart_to_image(self, fig: object, chart_name: str, section: str):
@@ -92,6 +98,30 @@ class HTMLReport:
         fig.savefig(os.path.join(self.asset_path, image_file_name))
 
         # Add to render pipeline
+        self._add_image(image_file_name, section)
+
+
+    def save_image_bytes(self, image_bytes: bytes, chart_name: str, section: str):
+        """Save already rendered png bytes to html rendering.
+
+        Args:
+            image_bytes (bytes): Png file contents.
+            chart_name (string): Chart name to use as file name.
+            section (string): Section to bind to.
+        """
+        image_file_name = f'{chart_name}.png'
+        with open(os.path.join(self.asset_path, image_file_name), 'wb') as f:
+            f.write(image_bytes)
+        self._add_image(image_file_name, section)
+
+
+    def _add_image(self, image_file_name: str, section: str):
+        """Add a saved image file to the render pipeline.
+
+        Args:
+            image_file_name (string): File name of the png in the assets directory.
+            section (string): Section to bind to.
+        """
         if section == 'single_variable':
             self._single_variable_charts.append({'render_type': 'png', 'render_value': image_file_name})
             self._single_variable_charts.append({'render_type': 'lb', 'render_value': 'None'})
@@ -111,6 +141,26 @@ class HTMLReport:
             self._single_variable_charts.append({'render_type':'table', 'render_value': table_list_of_dict})
         elif section == 'multi_variable':
             self._multi_variable_charts.append({'render_type':'table', 'render_value': table_list_of_dict})
+        elif section == 'performance':
+            self._performance_charts.append({'render_type':'table', 'render_value': table_list_of_dict})
+
+
+    def merge_buffered_report(self, buffered_report: 'BufferedReport'):
+        """Append components captured by a BufferedReport, in the order they were captured.
+
+        Args:
+            buffered_report (BufferedReport): report captured in memory, typically by a worker process.
+        """
+        for render_type, section, render_value in buffered_report.components:
+            if render_type == 'title':
+                self.save_title(render_value, section=section)
+            elif render_type == 'text':
+                self.save_text(render_value, section=section)
+            elif render_type == 'table':
+                self.save_table(render_value, section=section)
+            elif render_type == 'png':
+                chart_name, image_bytes = render_value
+                self.save_image_bytes(image_bytes, chart_name, section=section)
 
     
     def build_final_template(self, open_template: bool = True):
@@ -119,7 +169,7 @@ class HTMLReport:
         Args:
             open_template (bool): Whether final html template file should be opened after building.
         """
-        template = _build_template(single_variable_charts=self._single_variable_charts, multi_variable_charts=self._multi_variable_charts)
+        template = _build_template(single_variable_charts=self._single_variable_charts, multi_variable_charts=self._multi_variable_charts, performance_charts=self._performance_charts)
         write_path = os.path.join(self.root_path, 'report.html')
         with open(write_path, 'w') as f:
             f.write(template)
@@ -127,3 +177,61 @@ class HTMLReport:
 
         if open_template:
             webbrowser.open_new_tab(write_path)
+
+
+
+class BufferedReport:
+    """Class for capturing html report components in memory so they can be shipped between processes and merged into an HTMLReport.
+    """
+    def __init__(self):
+        """Create new instance of Buffered Report
+        """
+        self.components = []
+        # Ops a time budget skipped, and op run stats and run stats skips (fit timeouts) recorded while capturing, merged into the run's by the caller
+        self.skipped_ops = []
+        self.run_stats_records = []
+        self.run_stats_skipped_ops = []
+
+
+    def save_title(self, title: str, section: str):
+        """Capture title.
+
+        Args:
+            title (string): Text to render as title.
+            section (string): Section to bind to.
+        """
+        self.components.append(('title', section, title))
+
+
+    def save_text(self, text: str, section: str):
+        """Capture text.
+
+        Args:
+            text (string): Text to render as paragraph.
+            section (string): Section to bind to.
+        """
+        self.components.append(('text', section, text))
+
+
+    def save_chart_to_image(self, fig: object, chart_name: str, section: str):
+        """Capture chart as png bytes.
+
+        Args:
+            fig (matplotlib fig): Fig to render as png.
+            chart_name (string): Chart name to use as file name.
+            section (string): Section to bind to.
+        """
+        # Process id keeps names unique when several workers render in the same instant
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        self.components.append(('png', section, (f'{chart_name}_{os.getpid()}', buffer.getvalue())))
+
+
+    def save_table(self, table_list_of_dict: list[dict], section: str):
+        """Capture table.
+
+        Args:
+            table_list_of_dict (list of dictionary objects): metric, value combination
+            section (string): Section to bind to.
+        """
+        self.components.append(('table', section, table_list_of_dict))
@@ -0,0 +1,126 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+
+def _linear_bin(values: np.ndarray, grid: np.ndarray, codes: Optional[np.ndarray] = None, n_groups: int = 1) -> np.ndarray:
+    """Spread each value over its two nearest grid points, weighted by distance, one row of weights per group.
+
+    Args:
+        values (np.ndarray): values inside the grid range
+        grid (np.ndarray): evenly spaced grid points
+        codes (np.ndarray, optional): group code (0 to n_groups - 1) per value, all one group if not passed. Defaults to None.
+        n_groups (int, optional): number of groups. Defaults to 1.
+
+    Returns:
+        np.ndarray: weights (groups x grid points), each row sums to the number of values in the group
+    """
+    gridsize = grid.shape[0]
+    if codes is None:
+        codes = np.zeros(values.shape[0], dtype=np.int64)
+    delta = grid[1] - grid[0]
+    position = np.clip((values - grid[0]) / delta, 0, gridsize - 1)
+    lower = np.minimum(np.floor(position).astype(np.int64), gridsize - 2)
+    fraction = position - lower
+    flat_lower = codes * gridsize + lower
+    weights = np.bincount(flat_lower, weights=1.0 - fraction, minlength=n_groups * gridsize)
+    weights += np.bincount(flat_lower + 1, weights=fraction, minlength=n_groups * gridsize)
+    return weights.reshape(n_groups, gridsize)
+
+
+def _fft_gaussian_smooth(binned: np.ndarray, bandwidths: np.ndarray, delta: float) -> np.ndarray:
+    """Convolve each row of binned weights with its own Gaussian kernel using FFTs.
+
+    Args:
+        binned (np.ndarray): weights (groups x grid points)
+        bandwidths (np.ndarray): kernel standard deviation per group
+        delta (float): grid spacing
+
+    Returns:
+        np.ndarray: smoothed weights (groups x grid points)
+    """
+    gridsize = binned.shape[1]
+
+    # Kernels sampled at grid spacing over every possible offset, zero padded so the circular convolution is linear
+    nfft = 1 << int(np.ceil(np.log2(2 * gridsize)))
+    offsets = np.arange(-(gridsize - 1), gridsize) * delta
+    kernels = np.exp(-0.5 * (offsets[np.newaxis, :] / bandwidths[:, np.newaxis]) ** 2) / (np.sqrt(2.0 * np.pi) * bandwidths[:, np.newaxis])
+    smoothed = np.fft.irfft(np.fft.rfft(binned, nfft, axis=1) * np.fft.rfft(kernels, nfft, axis=1), nfft, axis=1)
+    return np.maximum(smoothed[:, gridsize - 1:2 * gridsize - 1], 0.0)
+
+
+def _binned_kde_grouped(
+        values: np.ndarray,
+        codes: np.ndarray,
+        n_groups: int,
+        gridsize: int = 200,
+        bw_adjust: float = 1.0,
+        cut: float = 3.0
+    ) -> tuple[Optional[np.ndarray], np.ndarray]:
+    """Return Gaussian kernel density estimates per group on one shared grid, from a single binning pass over the values.
+
+    Each group keeps its own Scott's rule bandwidth and is normalized on its own. Grid points beyond cut bandwidths of a group's extremes are nan, as seaborn does not draw them.
+
+    Args:
+        values (np.ndarray): values without NAs
+        codes (np.ndarray): group code (0 to n_groups - 1) per value
+        n_groups (int): number of groups
+        gridsize (int, optional): number of grid points. Defaults to 200.
+        bw_adjust (float, optional): factor applied to the Scott's rule bandwidths. Defaults to 1.0.
+        cut (float, optional): bandwidths the density extends past each group's extremes. Defaults to 3.0.
+
+    Returns:
+        tuple: grid (None if no group can be estimated) and densities (groups x grid points), rows of groups that cannot be estimated are all nan
+    """
+    densities = np.full((n_groups, gridsize), np.nan)
+    counts = np.bincount(codes, minlength=n_groups)
+
+    # Per group moments and extremes from bincounts, no per group passes over the values
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    means = sums / np.maximum(counts, 1)
+    squared_deltas = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        bandwidths = np.sqrt(squared_deltas / (counts - 1)) * counts ** (-1.0 / 5.0) * bw_adjust
+    extremes = pd.Series(values).groupby(codes).agg(['min', 'max']).reindex(range(n_groups))
+    lows, highs = extremes['min'].to_numpy(dtype=np.float64), extremes['max'].to_numpy(dtype=np.float64)
+    valid = (counts >= 2) & np.isfinite(bandwidths) & (bandwidths > 0)
+    if not valid.any():
+        return None, densities
+
+    # Shared grid covering every group's support
+    support_low = lows - cut * bandwidths
+    support_high = highs + cut * bandwidths
+    grid = np.linspace(support_low[valid].min(), support_high[valid].max(), gridsize)
+    binned = _linear_bin(values, grid, codes, n_groups)
+
+    # Smooth and normalize the groups that can be estimated
+    smoothed = _fft_gaussian_smooth(binned[valid], bandwidths[valid], grid[1] - grid[0]) / counts[valid][:, np.newaxis]
+    outside = (grid[np.newaxis, :] < support_low[valid][:, np.newaxis]) | (grid[np.newaxis, :] > support_high[valid][:, np.newaxis])
+    smoothed[outside] = np.nan
+    densities[valid] = smoothed
+    return grid, densities
+
+
+def _binned_kde(
+        values: np.ndarray,
+        gridsize: int = 200,
+        bw_adjust: float = 1.0,
+        cut: float = 3.0
+    ) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Return a Gaussian kernel density estimate evaluated on a grid, from linearly binned values smoothed with an FFT convolution.
+
+    Cost is one pass over the values plus FFTs on the grid, instead of evaluating every value at every grid point.
+
+    Args:
+        values (np.ndarray): values without NAs
+        gridsize (int, optional): number of grid points. Defaults to 200.
+        bw_adjust (float, optional): factor applied to the Scott's rule bandwidth. Defaults to 1.0.
+        cut (float, optional): bandwidths the grid extends past the data extremes. Defaults to 3.0.
+
+    Returns:
+        tuple: grid and density arrays, both None if there are too few distinct values to estimate
+    """
+    grid, densities = _binned_kde_grouped(values, np.zeros(values.shape[0], dtype=np.int64), 1, gridsize, bw_adjust, cut)
+    if grid is None:
+        return None, None
+    return grid, densities[0]
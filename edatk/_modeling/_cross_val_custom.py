@@ -1,65 +1,282 @@
 from typing import Callable
-from sklearn.model_selection import KFold
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import tempfile
+import numpy as np
 import pandas as pd
-from typing import Callable
+from typing import Callable, Optional, Union
 
+from edatk._parallel import _resolve_n_jobs
+from edatk._modeling._fold_data import _get_shared_folder, _get_shared_nbytes, _share_data, _init_fold_worker, _run_fold, _run_shared_fold
+from edatk._modeling._fold_cache import _MISSING, _fingerprint_data, _fingerprint_model, _get_fold_key, _load_fold_result, _save_fold_result
 
-def cross_validate_custom(
-        X: pd.DataFrame, 
-        y: pd.Series, 
-        model: object, 
-        scorer: Callable[[float, float], float], 
-        fit_method_name: str = 'fit', 
-        predict_method_name: str ='predict'
+
+def _clone_model(model: object) -> object:
+    """Return an unfitted copy of a model, sklearn style estimators are cloned from their parameters and other models deep copied.
+
+    Args:
+        model (object): model to copy
+
+    Returns:
+        object: independent copy of the model
+    """
+    if hasattr(model, 'get_params'):
+        from sklearn.base import clone
+        try:
+            return clone(model)
+        except TypeError:
+            pass
+    return copy.deepcopy(model)
+
+
+def _fit_and_score_fold(
+        model: object,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        X_test: pd.DataFrame,
+        y_test: pd.Series,
+        scorer: Callable[[float, float], float],
+        fit_method_name: str,
+        predict_method_name: str
+    ) -> float:
+    """Fit a model on one fold's training rows and score it on the fold's test rows.
+
+    Args:
+        model (object): model to fit, modified in place
+        X_train (pd.DataFrame): training features
+        y_train (pd.Series): training target
+        X_test (pd.DataFrame): test features
+        y_test (pd.Series): test target
+        scorer (Callable[[float, float], float]): Scorer function (y_true, y_pred)
+        fit_method_name (str): Method name contained in model to use as fit.
+        predict_method_name (str): Method name contained in model used in predict/scoring.
+
+    Returns:
+        float: fold score
+    """
+    getattr(model, fit_method_name)(X_train, y_train)
+    preds = getattr(model, predict_method_name)(X_test)
+    return scorer(y_test, preds)
+
+
+def _get_splitter(splitter: Union[str, object], n_splits: int, n_repeats: int, random_state: Optional[int]) -> object:
+    """Return a sklearn style splitter for a splitter name, splitter objects are returned as is.
+
+    Args:
+        splitter (Union[str, object]): 'kfold', 'stratified', 'group', 'time_series', or an object with a split(X, y, groups) method
+        n_splits (int): folds per repeat
+        n_repeats (int): repeats with different shuffles, kfold and stratified only
+        random_state (Optional[int]): shuffle seed of kfold and stratified splits
+
+    Returns:
+        object: splitter
+    """
+    from sklearn.model_selection import KFold, StratifiedKFold, GroupKFold, TimeSeriesSplit, RepeatedKFold, RepeatedStratifiedKFold
+    if not isinstance(splitter, str):
+        assert hasattr(splitter, 'split'), "splitter must be a name or have a split method"
+        return splitter
+    assert splitter in ['kfold', 'stratified', 'group', 'time_series'], "splitter must be 'kfold', 'stratified', 'group' or 'time_series'"
+    assert n_repeats >= 1, "n_repeats must be at least 1"
+    assert n_repeats == 1 or splitter in ['kfold', 'stratified'], "only kfold and stratified splits can be repeated"
+    if splitter == 'kfold':
+        return KFold(n_splits, shuffle=True, random_state=random_state) if n_repeats == 1 else RepeatedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    if splitter == 'stratified':
+        return StratifiedKFold(n_splits, shuffle=True, random_state=random_state) if n_repeats == 1 else RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    if splitter == 'group':
+        return GroupKFold(n_splits)
+    return TimeSeriesSplit(n_splits)
+
+
+def _run_folds(
+        X: pd.DataFrame,
+        y: pd.Series,
+        tasks: list[tuple[object, tuple[np.ndarray, np.ndarray]]],
+        scorer: Callable[[float, float], float],
+        fit_method_name: str,
+        predict_method_name: str,
+        n_jobs: int,
+        backend: str
     ) -> list[float]:
+    """Fit and score (model, split) tasks serially, in threads or in processes.
+
+    Args:
+        X (pd.DataFrame): Features dataframe.
+        y (pd.Series): target series.
+        tasks (list[tuple[object, tuple[np.ndarray, np.ndarray]]]): (model, (train_idx, test_idx)) per fold to run
+        scorer (Callable[[float, float], float]): Scorer function (y_true, y_pred)
+        fit_method_name (str): Method name contained in model to use as fit.
+        predict_method_name (str): Method name contained in model used in predict/scoring.
+        n_jobs (int): Number of folds run at once.
+        backend (str): 'process' or 'thread'.
+
+    Returns:
+        list[float]: scores in tasks order
+    """
+    # Loop through splits and append scores
+    n_jobs = min(_resolve_n_jobs(n_jobs), len(tasks))
+    if n_jobs == 1:
+        return [_run_fold(_fit_and_score_fold, model, X, y, train_idx, test_idx, scorer, fit_method_name, predict_method_name) for model, (train_idx, test_idx) in tasks]
+
+    # One model clone per fold, scores gathered in fold order
+    if backend == 'thread':
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_run_fold, _fit_and_score_fold, _clone_model(model), X, y, train_idx, test_idx, scorer, fit_method_name, predict_method_name)
+                for model, (train_idx, test_idx) in tasks
+            ]
+            return [future.result() for future in futures]
+
+    # Processes map X and y from one shared copy, in memory when it has room, tasks carry only the fold positions
+    shared_root = _get_shared_folder(_get_shared_nbytes(X) + _get_shared_nbytes(y))
+    with tempfile.TemporaryDirectory(prefix='edatk_cv_', dir=shared_root) as shared_folder:
+        initargs = (_share_data(X, shared_folder, 'X'), _share_data(y, shared_folder, 'y'))
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_fold_worker, initargs=initargs) as executor:
+            futures = [
+                executor.submit(_run_shared_fold, _fit_and_score_fold, _clone_model(model), train_idx, test_idx, scorer, fit_method_name, predict_method_name)
+                for model, (train_idx, test_idx) in tasks
+            ]
+            return [future.result() for future in futures]
+
+
+def _get_abandoned_models(
+        model_scores: dict[int, list[float]],
+        threshold: Optional[float],
+        confidence: float,
+        greater_is_better: bool
+    ) -> set[int]:
+    """Return the candidates whose best plausible mean score cannot beat the threshold or the current leader's worst plausible mean.
+
+    Plausible means are one sided Student t bounds at confidence on each candidate's fold scores so far.
+
+    Args:
+        model_scores (dict[int, list[float]]): candidate index -> fold scores so far, at least two each
+        threshold (Optional[float]): score a candidate must be able to beat, None to only race candidates against each other
+        confidence (float): confidence of the bounds, between 0 and 1
+        greater_is_better (bool): whether higher scores are better
+
+    Returns:
+        set[int]: candidate indexes to abandon
+    """
+    from scipy.stats import t
+
+    # Work in losses so lower is always better
+    bounds = {}
+    for i, scores in model_scores.items():
+        losses = -np.asarray(scores, dtype=float) if greater_is_better else np.asarray(scores, dtype=float)
+        half_width = t.ppf(confidence, losses.shape[0] - 1) * losses.std(ddof=1) / np.sqrt(losses.shape[0])
+        bounds[i] = (losses.mean() - half_width, losses.mean(), losses.mean() + half_width)
+    threshold_loss = None if threshold is None else (-threshold if greater_is_better else threshold)
+
+    # Leader by mean, every candidate whose optimistic bound is behind its pessimistic bound drops out
+    leader = min(bounds, key=lambda i: bounds[i][1])
+    abandoned = set()
+    for i, (optimistic, _, _) in bounds.items():
+        if threshold_loss is not None and optimistic > threshold_loss:
+            abandoned.add(i)
+        elif i != leader and optimistic > bounds[leader][2]:
+            abandoned.add(i)
+    return abandoned
+
+
+def cross_validate_custom(
+        X: pd.DataFrame,
+        y: pd.Series,
+        model: Union[object, list[object]],
+        scorer: Callable[[float, float], float],
+        fit_method_name: str = 'fit',
+        predict_method_name: str ='predict',
+        n_jobs: int = 1,
+        backend: str = 'process',
+        splitter: Union[str, object] = 'kfold',
+        n_splits: int = 5,
+        n_repeats: int = 1,
+        groups: Optional[Union[pd.Series, np.ndarray]] = None,
+        random_state: Optional[int] = 42,
+        cache_dir: Optional[str] = None,
+        early_stopping: bool = False,
+        threshold: Optional[float] = None,
+        confidence: float = 0.95,
+        min_folds: int = 2,
+        greater_is_better: bool = False
+    ) -> Union[list[float], list[list[float]]]:
     """Run cross validate loop for given X, y, model, and methods.
 
     Args:
         X (pd.DataFrame): Features dataframe.
         y (pd.Series): target series.
-        model (object): Model to use in cv loop.
+        model (Union[object, list[object]]): Model to use in cv loop, or a list of candidate models scored on the same folds.
         scorer (Callable[[float, float], float]): Scorer function (y_true, y_pred)
         fit_method_name (str, optional): Method name contained in model to use as fit. Defaults to 'fit'.
         predict_method_name (str, optional): Method name contained in model used in predict/scoring. Defaults to 'predict'.
+        n_jobs (int, optional): Number of folds run at once, -1 uses all cpus. Above 1 every fold fits its own clone of the model (sklearn clone, or a deep copy for other models) and the passed model is left unfitted. Defaults to 1 (folds refit the passed model in place, one after another).
+        backend (str, optional): 'process' runs parallel folds in worker processes that memory map one shared copy of numeric X and y (model and scorer must be picklable), 'thread' in threads of this process, which suits models that release the GIL. Defaults to 'process'.
+        splitter (Union[str, object], optional): 'kfold', 'stratified' (class balanced folds of y), 'group' (no group in both train and test, needs groups), 'time_series' (train on earlier rows, test on the next block), or any sklearn style splitter object. Defaults to 'kfold'.
+        n_splits (int, optional): Folds per repeat of a named splitter. Defaults to 5.
+        n_repeats (int, optional): Repeats of kfold or stratified splits with different shuffles, scores of every repeat are returned. Defaults to 1.
+        groups (Union[pd.Series, np.ndarray], optional): Group label per row, passed to the splitter. Defaults to None.
+        random_state (int, optional): Shuffle seed of kfold and stratified splits. Defaults to 42.
+        cache_dir (str, optional): Folder caching each fold's score on disk, keyed by the data fingerprint, model parameters, scorer and fold rows, so reruns only fit new or changed folds. Defaults to None (no cache).
+        early_stopping (bool, optional): Race candidates fold by fold and abandon one once, with the given confidence, its mean score cannot beat threshold or the leading candidate. Abandoned candidates return the scores of the folds they ran. Defaults to False.
+        threshold (float, optional): Mean score a candidate must be able to beat to keep running, None to only race candidates against each other. Defaults to None.
+        confidence (float, optional): Confidence of the racing bounds, higher abandons later. Defaults to 0.95.
+        min_folds (int, optional): Folds every candidate runs before it can be abandoned, at least 2. Defaults to 2.
+        greater_is_better (bool, optional): Whether higher scores are better (accuracy) rather than lower (errors), used by early stopping. Defaults to False.
 
     Raises:
         Exception: No fit method.
         Exception: No predict method.
 
     Returns:
-        list[float]: List of cross val scores (typically floats).
+        Union[list[float], list[list[float]]]: List of cross val scores (typically floats), in fold order (repeat by repeat). A list of such lists, one per candidate, when model is a list.
     """
 
-    # Make sure model has fit and predict method
-    if not hasattr(model, fit_method_name):
-        raise Exception("Model must have fit method")
-    if not hasattr(model, predict_method_name):
-        raise Exception("Model must have predict method")
-    
-    # Bind functions
-    fit_method = getattr(model, fit_method_name)
-    predict_method = getattr(model, predict_method_name)
-
-    # Default KFold 5 split
-    kf = KFold(n_splits=5, shuffle=True, random_state=42)
-
-    # Loop through splits and append scores
-    score_list = []
-    for train_idx, test_idx in kf.split(X):
+    # Make sure every model has fit and predict method
+    models = model if isinstance(model, list) else [model]
+    for candidate in models:
+        if not hasattr(candidate, fit_method_name):
+            raise Exception("Model must have fit method")
+        if not hasattr(candidate, predict_method_name):
+            raise Exception("Model must have predict method")
+    assert backend in ['process', 'thread'], "backend must be 'process' or 'thread'"
+    assert 0 < confidence < 1, "confidence must be between 0 and 1"
+    assert min_folds >= 2, "min_folds must be at least 2"
 
-        # Split objects by idx
-        X_train = X.iloc[train_idx, :]
-        y_train = y.iloc[train_idx]
-        X_test = X.iloc[test_idx, :]
-        y_test = y.iloc[test_idx]
+    # Split positions only, fold rows are sliced when the fold runs so one fold copy is alive at a time
+    splits = list(_get_splitter(splitter, n_splits, n_repeats, random_state).split(X, y, groups))
 
-        # Fit model
-        fit_method(X_train, y_train)
+    # Reuse fold results cached by earlier runs, keys are fixed before any fold refits the model
+    scores = [[_MISSING] * len(splits) for _ in models]
+    if cache_dir is not None:
+        data_key = _fingerprint_data(X) + _fingerprint_data(y)
+        fold_keys = []
+        for i, candidate in enumerate(models):
+            model_key = _fingerprint_model(candidate)
+            fold_keys.append([_get_fold_key(data_key, model_key, scorer, (fit_method_name, predict_method_name), train_idx, test_idx) for train_idx, test_idx in splits])
+            scores[i] = [_load_fold_result(cache_dir, key) for key in fold_keys[i]]
 
-        # Score model
-        preds = predict_method(X_test)
-        score = scorer(y_test, preds)
-        score_list.append(score)
+    # Without early stopping every fold of every candidate runs in one batch, racing runs one fold of each remaining candidate per round
+    rounds = [range(len(splits))] if not early_stopping else [[fold] for fold in range(len(splits))]
+    remaining = set(range(len(models)))
+    model_folds = [len(splits)] * len(models)
+    folds_run = 0
+    for round_folds in rounds:
+        pending = [(i, fold) for i in sorted(remaining) for fold in round_folds if scores[i][fold] is _MISSING]
+        if pending:
+            pending_scores = _run_folds(X, y, [(models[i], splits[fold]) for i, fold in pending], scorer, fit_method_name, predict_method_name, n_jobs, backend)
+            for (i, fold), score in zip(pending, pending_scores):
+                scores[i][fold] = score
+                if cache_dir is not None:
+                    _save_fold_result(cache_dir, fold_keys[i][fold], score)
+        folds_run += len(round_folds)
 
-    return score_list
+        # Drop candidates that cannot win, stop once none are left
+        if early_stopping and min_folds <= folds_run < len(splits):
+            for i in _get_abandoned_models({i: scores[i][:folds_run] for i in remaining}, threshold, confidence, greater_is_better):
+                remaining.discard(i)
+                model_folds[i] = folds_run
+            if not remaining:
+                break
 
+    # Abandoned candidates keep only the folds they ran before dropping out
+    scores = [model_scores[:n_folds] for model_scores, n_folds in zip(scores, model_folds)]
+    return scores if isinstance(model, list) else scores[0]
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable, Union
+import numpy as np
+import pandas as pd
+
+
+# Marks a fold with no cached result, scores themselves may be None
+_MISSING = object()
+
+
+def _fingerprint_data(data: Union[pd.DataFrame, pd.Series, np.ndarray]) -> str:
+    """Return a hash of the values, labels and dtypes of features or target.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series, np.ndarray]): features or target
+
+    Returns:
+        str: sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        labels = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+        dtypes = list(data.dtypes) if isinstance(data, pd.DataFrame) else [data.dtype]
+        digest.update(repr((labels, [str(dtype) for dtype in dtypes])).encode())
+    else:
+        values = np.asarray(data)
+        if values.dtype.hasobject:
+            digest.update(pd.util.hash_pandas_object(pd.DataFrame(values.reshape(values.shape[0], -1)), index=False).to_numpy().tobytes())
+        else:
+            digest.update(np.ascontiguousarray(values).tobytes())
+        digest.update(repr((values.shape, str(values.dtype))).encode())
+    return digest.hexdigest()
+
+
+def _fingerprint_model(model: object) -> str:
+    """Return a hash of a model's class and parameters, taken before any fold is fit.
+
+    sklearn style models are keyed by get_params, other models by their pickled state, or their repr when they cannot be pickled.
+
+    Args:
+        model (object): model to key
+
+    Returns:
+        str: sha256 hex digest
+    """
+    model_class = f'{type(model).__module__}.{type(model).__qualname__}'
+    if hasattr(model, 'get_params'):
+        state = repr(sorted(model.get_params(deep=True).items())).encode()
+    else:
+        try:
+            state = pickle.dumps(model)
+        except Exception:
+            state = repr(model).encode()
+    return hashlib.sha256(model_class.encode() + state).hexdigest()
+
+
+def _get_fold_key(data_key: str, model_key: str, scorer: Callable, method_names: tuple[str, str], train_idx: np.ndarray, test_idx: np.ndarray) -> str:
+    """Return the cache key of one fold result.
+
+    Args:
+        data_key (str): fingerprint of X and y
+        model_key (str): fingerprint of the model
+        scorer (Callable): scorer function, keyed by module, name and bytecode so differing lambdas do not collide
+        method_names (tuple[str, str]): fit and predict method names
+        train_idx (np.ndarray): training row positions
+        test_idx (np.ndarray): test row positions
+
+    Returns:
+        str: sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    scorer_name = f'{getattr(scorer, "__module__", "")}.{getattr(scorer, "__qualname__", repr(scorer))}'
+    scorer_code = getattr(scorer, '__code__', None)
+    scorer_body = (scorer_code.co_code, repr(scorer_code.co_consts)) if scorer_code is not None else None
+    digest.update(repr((data_key, model_key, scorer_name, scorer_body, method_names)).encode())
+    digest.update(np.asarray(train_idx, dtype=np.int64).tobytes())
+    digest.update(b'|')
+    digest.update(np.asarray(test_idx, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def _load_fold_result(cache_dir: str, key: str) -> object:
+    """Return a cached fold result, or _MISSING when the fold has not been run or its file is unreadable.
+
+    Args:
+        cache_dir (str): cache folder
+        key (str): fold key from _get_fold_key
+
+    Returns:
+        object: cached result or _MISSING
+    """
+    path = os.path.join(cache_dir, f'{key}.pkl')
+    if not os.path.exists(path):
+        return _MISSING
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return _MISSING
+
+
+def _save_fold_result(cache_dir: str, key: str, result: object):
+    """Write a fold result to the cache, through a temporary file so readers never see a partial file.
+
+    Args:
+        cache_dir (str): cache folder, created if missing
+        key (str): fold key from _get_fold_key
+        result (object): picklable fold result
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.tmp', delete=False) as f:
+        pickle.dump(result, f)
+    os.replace(f.name, os.path.join(cache_dir, f'{key}.pkl'))
+
@@ -0,0 +1,220 @@
+import os
+import shutil
+import tempfile
+from typing import Callable, Union
+import numpy as np
+import pandas as pd
+
+
+# Memory backed tmpfs where available so memory maps never touch disk, joblib uses the same folder
+_SHARED_FOLDER = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Space left free in the memory backed folder, writing past a full tmpfs through a memory map faults (SIGBUS) instead of raising
+_SHARED_FOLDER_HEADROOM_BYTES = 16 << 20
+
+# Features and target attached once per fold worker process by _init_fold_worker
+_worker_data = {}
+
+
+def _take_rows(data: Union[pd.DataFrame, pd.Series, np.ndarray], row_idx: np.ndarray) -> Union[pd.DataFrame, pd.Series, np.ndarray]:
+    """Return the rows at positions row_idx, only these rows are copied.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series, np.ndarray]): features or target
+        row_idx (np.ndarray): row positions
+
+    Returns:
+        Union[pd.DataFrame, pd.Series, np.ndarray]: rows of data, same type as data
+    """
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[row_idx]
+    return data[row_idx]
+
+
+def _can_map(dtype: object) -> bool:
+    """Check whether values of a dtype can be written to a .npy memory map.
+
+    Args:
+        dtype (object): numpy or pandas dtype
+
+    Returns:
+        bool: True for numpy dtypes without python objects
+    """
+    return isinstance(dtype, np.dtype) and not dtype.hasobject
+
+
+def _get_dtype_runs(df: pd.DataFrame) -> list[slice]:
+    """Return column position slices of consecutive columns sharing a dtype, so frames rebuilt from them keep the column order.
+
+    Args:
+        df (pd.DataFrame): features
+
+    Returns:
+        list[slice]: column position runs, in column order
+    """
+    runs = []
+    start = 0
+    for i in range(1, df.shape[1] + 1):
+        if i == df.shape[1] or df.dtypes.iloc[i] != df.dtypes.iloc[start]:
+            runs.append(slice(start, i))
+            start = i
+    return runs
+
+
+def _get_shared_nbytes(data: Union[pd.DataFrame, pd.Series, np.ndarray]) -> int:
+    """Return the bytes _share_data would write to memory maps.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series, np.ndarray]): features or target
+
+    Returns:
+        int: bytes of the mappable values
+    """
+    if isinstance(data, pd.DataFrame):
+        return int(sum(data.shape[0] * dtype.itemsize for dtype in data.dtypes if _can_map(dtype)))
+    return int(data.nbytes) if _can_map(data.dtype) else 0
+
+
+def _get_shared_folder(nbytes: int) -> str:
+    """Return the folder to write memory maps to, the memory backed folder when it has room for them and the temp folder otherwise.
+
+    Args:
+        nbytes (int): bytes that will be written
+
+    Returns:
+        str: folder path
+    """
+    if _SHARED_FOLDER is not None and shutil.disk_usage(_SHARED_FOLDER).free >= nbytes + _SHARED_FOLDER_HEADROOM_BYTES:
+        return _SHARED_FOLDER
+    return tempfile.gettempdir()
+
+
+def _write_memmap(values: np.ndarray, path: str) -> str:
+    """Copy values once into a contiguous .npy memory map.
+
+    Args:
+        values (np.ndarray): values to write
+        path (str): file path
+
+    Returns:
+        str: file path
+    """
+    shared_values = np.lib.format.open_memmap(path, mode='w+', dtype=values.dtype, shape=values.shape)
+    shared_values[...] = values
+    shared_values.flush()
+    del shared_values
+    return path
+
+
+def _share_data(data: Union[pd.DataFrame, pd.Series, np.ndarray], folder: str, name: str) -> dict:
+    """Write data once to contiguous memory mapped .npy files and return a small picklable handle to them.
+
+    Frames are written one file per run of consecutive columns sharing a dtype, so mixed int and float features are still mapped. The handle keeps pandas labels so workers rebuild the same frame or series. Object and extension dtype columns cannot be mapped and are carried in the handle itself, so they are pickled once per worker instead of once per fold.
+
+    Args:
+        data (Union[pd.DataFrame, pd.Series, np.ndarray]): features or target
+        folder (str): folder to write the memory maps to
+        name (str): file name stem
+
+    Returns:
+        dict: handle for _load_shared_data
+    """
+    if isinstance(data, pd.DataFrame):
+        blocks = []
+        for i, run in enumerate(_get_dtype_runs(data)):
+            block = data.iloc[:, run]
+            if _can_map(block.dtypes.iloc[0]):
+                path = _write_memmap(block.to_numpy(), os.path.join(folder, f'{name}_{i}.npy'))
+                blocks.append({'path': path, 'columns': block.columns})
+            else:
+                blocks.append({'data': block})
+        return {'type': 'frame', 'index': data.index, 'columns': data.columns, 'blocks': blocks}
+    if not _can_map(data.dtype):
+        return {'data': data}
+
+    # One contiguous copy into the map, workers read pages straight from it
+    handle = {'path': _write_memmap(np.asarray(data), os.path.join(folder, f'{name}.npy'))}
+    if isinstance(data, pd.Series):
+        handle.update({'type': 'series', 'index': data.index, 'name': data.name})
+    else:
+        handle.update({'type': 'array'})
+    return handle
+
+
+def _load_shared_data(handle: dict) -> Union[pd.DataFrame, pd.Series, np.ndarray]:
+    """Open a handle from _share_data without copying the mapped values.
+
+    Args:
+        handle (dict): handle from _share_data
+
+    Returns:
+        Union[pd.DataFrame, pd.Series, np.ndarray]: read only view of the shared data
+    """
+    if 'data' in handle:
+        return handle['data']
+    if handle['type'] == 'frame':
+        # Each mapped run stays its own block, concat without copy keeps them mapped
+        blocks = []
+        for block in handle['blocks']:
+            if 'data' in block:
+                blocks.append(block['data'])
+            else:
+                blocks.append(pd.DataFrame(np.load(block['path'], mmap_mode='r'), index=handle['index'], columns=block['columns'], copy=False))
+        if len(blocks) == 0:
+            return pd.DataFrame(index=handle['index'], columns=handle['columns'])
+        return pd.concat(blocks, axis=1, copy=False)
+    values = np.load(handle['path'], mmap_mode='r')
+    if handle['type'] == 'series':
+        return pd.Series(values, index=handle['index'], name=handle['name'], copy=False)
+    return values
+
+
+def _init_fold_worker(X_handle: dict, y_handle: dict):
+    """Process pool initializer, attach the shared features and target once per worker.
+
+    Args:
+        X_handle (dict): features handle from _share_data
+        y_handle (dict): target handle from _share_data
+    """
+    _worker_data['X'] = _load_shared_data(X_handle)
+    _worker_data['y'] = _load_shared_data(y_handle)
+
+
+def _run_fold(
+        fold_function: Callable[..., float],
+        model: object,
+        X: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray],
+        train_idx: np.ndarray,
+        test_idx: np.ndarray,
+        *args
+    ) -> float:
+    """Slice one fold and pass it to fold_function, rows are copied inside the worker so only running folds hold a copy.
+
+    Args:
+        fold_function (Callable[..., float]): called as fold_function(model, X_train, y_train, X_test, y_test, *args)
+        model (object): model for this fold
+        X (Union[pd.DataFrame, np.ndarray]): features
+        y (Union[pd.Series, np.ndarray]): target
+        train_idx (np.ndarray): training row positions
+        test_idx (np.ndarray): test row positions
+
+    Returns:
+        float: result of fold_function
+    """
+    return fold_function(model, _take_rows(X, train_idx), _take_rows(y, train_idx), _take_rows(X, test_idx), _take_rows(y, test_idx), *args)
+
+
+def _run_shared_fold(fold_function: Callable[..., float], model: object, train_idx: np.ndarray, test_idx: np.ndarray, *args) -> float:
+    """Run one fold on the worker's shared data, only the row positions cross the process boundary.
+
+    Args:
+        fold_function (Callable[..., float]): called as fold_function(model, X_train, y_train, X_test, y_test, *args)
+        model (object): model for this fold
+        train_idx (np.ndarray): training row positions
+        test_idx (np.ndarray): test row positions
+
+    Returns:
+        float: result of fold_function
+    """
+    return _run_fold(fold_function, model, _worker_data['X'], _worker_data['y'], train_idx, test_idx, *args)
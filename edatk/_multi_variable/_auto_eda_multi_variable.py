@@ -1,10 +1,20 @@
 from itertools import combinations
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
 import edatk._core as core
 import edatk._multi_variable._visuals as viz
+from edatk._multi_variable._correlation import CorrelationEngine
+from edatk._multi_variable._pair_selection import _select_column_pairs
+import edatk._single_variable._summary_statistics as sst
+import edatk._html_report._report_builder as html_build
+from edatk._scheduler import TimeBudget
+from edatk._run_stats import RunStats
+
+
+# Number of pair charts drawn per figure, also the unit of work sent to worker processes
+_PAIRS_PER_PAGE = core._CHARTS_PER_PAGE
 
 
 def _get_column_combinations(
@@ -57,44 +67,252 @@ def _bind_chart_function(arg_func: Callable, **kwargs):
     return inner_func
 
 
-def _auto_eda_mutli_variable(
-        df: pd.DataFrame, 
-        column_list: Optional[list[str]] = None, 
+def _get_relationship_ops(
+        column_combinations: list[tuple[str, str]], 
         target_column: Optional[str] = None, 
-        html_report: object = None, 
-        ignore_errors: bool = True, 
-        show_chart: bool = True
+        column_types: Optional[Mapping[str, str]] = None,
+        render_mode: str = 'default',
+        swarm_budget: float = core._SWARM_TIME_BUDGET
+    ) -> dict[str, Callable]:
+    """Bind one relationship chart function per column pair.
+
+    Args:
+        column_combinations (list[tuple[str, str]]): column name pairs to chart
+        target_column (str, optional): String name of the target column. Defaults to None.
+        column_types (Mapping[str, str], optional): column type index. Defaults to None.
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        swarm_budget (float, optional): seconds each swarm layout may take. Defaults to core._SWARM_TIME_BUDGET.
+
+    Returns:
+        dict[str, Callable]: run dict of pair name to chart function (df and ax populated by caller)
+    """
+    relationship_ops = {}
+    for col_a, col_b in column_combinations:
+        relationship_ops[f'{col_a}-{col_b}'] = _bind_chart_function(viz._plot_relationship, column_name_one=col_a, column_name_two=col_b, target_column=target_column, column_types=column_types, render_mode=render_mode, swarm_budget=swarm_budget)
+    return relationship_ops
+
+
+def _relationship_page_worker(
+        df: pd.DataFrame, 
+        column_combinations: list[tuple[str, str]], 
+        target_column: Optional[str], 
+        column_types: Optional[dict[str, str]],
+        render_mode: str,
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
+    ) -> object:
+    """Render one page of pair charts in a worker process, capturing the figure in memory.
+
+    Args:
+        df (pd.DataFrame): dataframe holding the columns in the page (and the target columns)
+        column_combinations (list[tuple[str, str]]): column name pairs on this page
+        target_column (str, optional): String name of the target column
+        column_types (dict[str, str], optional): column type index for the page columns
+        render_mode (str): 'default' or 'fast'
+        time_budget (TimeBudget, optional): copy of the run budget, skips are returned on the buffered report
+        run_stats (RunStats, optional): copy of the run stats, new records are returned on the buffered report
+
+    Returns:
+        BufferedReport: captured rendered page
+    """
+    buffered_report = html_build.BufferedReport()
+    skipped_before = len(time_budget.skipped_ops) if time_budget is not None else 0
+    records_before = len(run_stats.records) if run_stats is not None else 0
+    swarm_budget = time_budget.swarm_seconds if time_budget is not None else core._SWARM_TIME_BUDGET
+    relationship_ops = _get_relationship_ops(column_combinations, target_column=target_column, column_types=column_types, render_mode=render_mode, swarm_budget=swarm_budget)
+    core._bind_to_console_html(section='multi_variable', run_type='charts', run_dict=relationship_ops, html_report=buffered_report, show_chart=False, time_budget=time_budget, run_stats=run_stats, df=df)
+    if time_budget is not None:
+        buffered_report.skipped_ops = time_budget.skipped_ops[skipped_before:]
+    if run_stats is not None:
+        buffered_report.run_stats_records = run_stats.records[records_before:]
+    return buffered_report
+
+
+def _relationship_page_args(
+        df: pd.DataFrame, 
+        column_combinations: list[tuple[str, str]], 
+        target_column: Optional[str], 
+        column_types: Optional[Mapping[str, str]],
+        render_mode: str,
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
+    ) -> tuple:
+    """Build picklable worker arguments that only carry the columns used by one page.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_combinations (list[tuple[str, str]]): column name pairs on this page
+        target_column (str, optional): String name of the target column
+        column_types (Mapping[str, str], optional): column type index
+        render_mode (str): 'default' or 'fast'
+        time_budget (TimeBudget, optional): run budget, copied to the worker
+        run_stats (RunStats, optional): run stats, copied to the worker
+
+    Returns:
+        tuple: arguments for _relationship_page_worker
+    """
+    page_columns = list(dict.fromkeys(col for combo in column_combinations for col in combo))
+    if target_column is not None:
+        page_columns += [col for col in [target_column, f'{target_column}_lc'] if col in df.columns and col not in page_columns]
+    if column_types is not None:
+        column_types = {col: column_types[col] for col in page_columns if col in column_types}
+    return df.loc[:, page_columns], column_combinations, target_column, column_types, render_mode, time_budget, run_stats
+
+
+def _render_relationship_pairs(
+        df: pd.DataFrame,
+        column_combinations: list[tuple[str, str]],
+        header_text: str,
+        target_column: Optional[str],
+        column_types: Mapping[str, str],
+        html_report: object,
+        show_chart: bool,
+        n_jobs: int,
+        render_mode: str = 'default',
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
     ):
-    _relationship_ops = {}
-    _heatmap_ops = {}
-    
-    # Get column combination tuples
+    """Chart a section of column pairs, as pages in worker processes when writing an html report with n_jobs > 1.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_combinations (list[tuple[str, str]]): column name pairs to chart, in order
+        header_text (str): section title
+        target_column (str, optional): String name of the target column
+        column_types (Mapping[str, str]): column type index
+        html_report (object): html report object to hold data and write to file
+        show_chart (bool): whether to call plt.show
+        n_jobs (int): resolved number of worker processes
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        time_budget (TimeBudget, optional): if set, pairs the budget does not admit are skipped. Defaults to None.
+        run_stats (RunStats, optional): if set, records the cost of every pair chart. Defaults to None.
+    """
+    # Render pages of pairs in worker processes, merged back in pair order
+    if html_report and n_jobs > 1 and len(column_combinations) > _PAIRS_PER_PAGE:
+        html_report.save_title(header_text, section='multi_variable')
+        pages = [column_combinations[i:i + _PAIRS_PER_PAGE] for i in range(0, len(column_combinations), _PAIRS_PER_PAGE)]
+        args_iterable = (_relationship_page_args(df, page, target_column, column_types, render_mode, time_budget, run_stats) for page in pages)
+        for buffered_report in core._parallel_map_ordered(_relationship_page_worker, args_iterable, n_jobs):
+            html_report.merge_buffered_report(buffered_report)
+            if time_budget is not None:
+                time_budget.skipped_ops.extend(buffered_report.skipped_ops)
+            if run_stats is not None:
+                run_stats.records.extend(buffered_report.run_stats_records)
+    else:
+        # Run all pair chart functions
+        swarm_budget = time_budget.swarm_seconds if time_budget is not None else core._SWARM_TIME_BUDGET
+        _relationship_ops = _get_relationship_ops(column_combinations, target_column=target_column, column_types=column_types, render_mode=render_mode, swarm_budget=swarm_budget)
+        core._bind_to_console_html(section='multi_variable', run_type='charts', run_dict=_relationship_ops, html_report=html_report, show_chart=show_chart, header_text=header_text, time_budget=time_budget, run_stats=run_stats, df=df)
+
+
+def _get_relationship_sections(
+        df: pd.DataFrame,
+        column_list: Optional[list[str]],
+        target_column: Optional[str],
+        column_types: Mapping[str, str],
+        correlation_engine: CorrelationEngine,
+        max_pairs: Optional[int] = None,
+        pair_threshold: Optional[float] = None,
+        top_non_target_pairs: int = 0
+    ) -> list[tuple[str, list[tuple[str, str]]]]:
+    """Select the column pairs charted in each relationship section.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_list (list[str], optional): columns to pair
+        target_column (str, optional): String name of the target column, only pairs with it are charted when passed
+        column_types (Mapping[str, str]): column type index
+        correlation_engine (CorrelationEngine): shared correlations used to rank pairs
+        max_pairs (int, optional): keep at most this many target section pairs. Defaults to None.
+        pair_threshold (float, optional): keep target section pairs scoring at least this. Defaults to None.
+        top_non_target_pairs (int, optional): number of the strongest pairs not involving the target to chart. Defaults to 0.
+
+    Returns:
+        list[tuple[str, list[tuple[str, str]]]]: (section title, column name pairs) in output order
+    """
+    # Get column combination tuples, only pairs with the target when one is passed
     column_combinations = _get_column_combinations(df, column_list=column_list)
     target_only_combinations = _get_column_combinations(df, column_list=column_list, target_column=target_column)
-    # Loop through tuples
-    for col_set in column_combinations:
-        # Parse tuple
-        col_a, col_b = col_set
-        # Enclose function with tuple (df and ax is populated by caller)
-        _relationship_ops[f'{col_a}-{col_b}'] = _bind_chart_function(viz._plot_relationship, column_name_one=col_a, column_name_two=col_b, target_column=target_column)
-    
-    # Run all pair chart functions
-    core._bind_to_console_html(section='multi_variable', run_type='charts', run_dict=_relationship_ops, html_report=html_report, show_chart=show_chart, header_text="Column Relationships", df=df)
-
-    # Run heatmap
+
+    # Rank and cut down by association if limits are set
+    selected_combinations = _select_column_pairs(df, target_only_combinations, column_types, correlation_engine, max_pairs=max_pairs, pair_threshold=pair_threshold)
+    relationship_sections = [("Column Relationships", selected_combinations)]
+
+    # Strongest pairs not involving the target
+    if target_column and top_non_target_pairs > 0:
+        target_only_set = set(target_only_combinations)
+        non_target_combinations = [combo for combo in column_combinations if combo not in target_only_set]
+        non_target_combinations = _select_column_pairs(df, non_target_combinations, column_types, correlation_engine, max_pairs=top_non_target_pairs)
+        if len(non_target_combinations) > 0:
+            relationship_sections.append(("Top Non-Target Relationships", non_target_combinations))
+    return relationship_sections
+
+
+def _get_heatmap_ops(
+        df: pd.DataFrame,
+        correlation_engine: CorrelationEngine,
+        target_column: Optional[str] = None,
+        correlation_method: str = 'pearson'
+    ) -> dict[str, Callable]:
+    """Bind the heatmaps drawn for a run, none if there are no numeric columns.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        correlation_engine (CorrelationEngine): shared correlations read by every heatmap
+        target_column (str, optional): String name of the target column, adds a target heatmap if numeric. Defaults to None.
+        correlation_method (str, optional): 'pearson' or 'spearman'. Defaults to 'pearson'.
+
+    Returns:
+        dict[str, Callable]: heatmap name -> chart function (df and ax populated by caller)
+    """
+    _heatmap_ops = {}
     # Check for numeric columns
-    if column_list is None:
-        column_list = df.columns.values
-    numeric_col_count = len([col for col in df.columns if col in column_list and is_numeric_dtype(df[col])])
-    if numeric_col_count > 0:
+    if len(correlation_engine.numeric_columns) > 0:
         # Standard heatmap
-        _heatmap_ops = {
-            'Correlation Heatmap': _bind_chart_function(viz._plot_heatmap, column_list=column_list)
-        }
-        # Target heatmap
+        _heatmap_ops['Correlation Heatmap'] = _bind_chart_function(viz._plot_heatmap, correlation_engine=correlation_engine, method=correlation_method)
+        # Target heatmap, reads the same cached matrix
         if target_column:
             if is_numeric_dtype(df[target_column]):
-                _heatmap_ops['Target Heatmap'] = _bind_chart_function(viz._plot_heatmap, column_list=column_list, target_column=target_column)
-        # Visualize all
-        for k,v in _heatmap_ops.items():
-            core._bind_to_console_html(section='multi_variable', run_type='chart', run_dict={k:v}, html_report=html_report, show_chart=show_chart, header_text=k, df=df)
+                _heatmap_ops['Target Heatmap'] = _bind_chart_function(viz._plot_heatmap, target_column=target_column, correlation_engine=correlation_engine, method=correlation_method)
+    return _heatmap_ops
+
+
+def _auto_eda_mutli_variable(
+        df: pd.DataFrame, 
+        column_list: Optional[list[str]] = None, 
+        target_column: Optional[str] = None, 
+        html_report: object = None, 
+        ignore_errors: bool = True, 
+        show_chart: bool = True,
+        column_types: Optional[Mapping[str, str]] = None,
+        n_jobs: int = 1,
+        correlation_method: str = 'pearson',
+        max_pairs: Optional[int] = None,
+        pair_threshold: Optional[float] = None,
+        top_non_target_pairs: int = 0,
+        render_mode: str = 'default',
+        correlation_engine: Optional[CorrelationEngine] = None,
+        relationship_sections: Optional[list[tuple[str, list[tuple[str, str]]]]] = None,
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
+    ):
+    # Infer column types once for every pair if caller has not already
+    if column_types is None:
+        column_types = sst._get_column_type_index(df, column_list)
+
+    # Correlations computed once, shared by pair ranking and heatmaps
+    if correlation_engine is None:
+        correlation_engine = CorrelationEngine(df, column_list)
+
+    # Pairs per section, selected here if caller has not already
+    if relationship_sections is None:
+        with core._measure_op(run_stats, 'multi_variable', None, 'Pair Selection'):
+            relationship_sections = _get_relationship_sections(df, column_list, target_column, column_types, correlation_engine, max_pairs, pair_threshold, top_non_target_pairs)
+    n_jobs = core._resolve_n_jobs(n_jobs)
+    for header_text, section_combinations in relationship_sections:
+        _render_relationship_pairs(df, section_combinations, header_text, target_column, column_types, html_report, show_chart, n_jobs, render_mode, time_budget, run_stats)
+
+    # Run heatmaps
+    _heatmap_ops = _get_heatmap_ops(df, correlation_engine, target_column, correlation_method)
+    for k,v in _heatmap_ops.items():
+        core._bind_to_console_html(section='multi_variable', run_type='chart', run_dict={k:v}, html_report=html_report, show_chart=show_chart, header_text=k, time_budget=time_budget, run_stats=run_stats, df=df)
@@ -0,0 +1,77 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+import edatk._sketches as sketches
+
+
+# Correlation methods the engine can compute, rank variants correlate column ranks
+_CORRELATION_METHODS = ('pearson', 'spearman')
+
+
+class CorrelationEngine:
+    """Pairwise complete correlation of the numeric columns of a dataframe, computed once per method and cached.
+
+    Shared by heatmaps and pair ranking so a run never recomputes the same matrix.
+    """
+    def __init__(self, df: pd.DataFrame, column_list: Optional[list[str]] = None):
+        """Create new Correlation Engine
+
+        Args:
+            df (pd.DataFrame): input dataframe
+            column_list (list[str], optional): columns to consider, non numeric columns are skipped. Defaults to None.
+        """
+        if column_list is None:
+            column_list = df.columns.values
+        self.numeric_columns = [col for col in df.columns if col in column_list and is_numeric_dtype(df[col])]
+        self._df = df
+        self._cache = {}
+
+
+    def _get_values(self, method: str) -> np.ndarray:
+        """Return the float array (rows x numeric columns) correlated by a method, nans are missing.
+
+        Args:
+            method (str): correlation method
+
+        Returns:
+            np.ndarray: column values, or average column ranks for spearman
+        """
+        numeric_df = self._df.loc[:, self.numeric_columns]
+        if method == 'spearman':
+            numeric_df = numeric_df.rank()
+        return numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+    def correlation(self, method: str = 'pearson') -> pd.DataFrame:
+        """Return the pairwise complete correlation matrix of the numeric columns.
+
+        Spearman ranks each column over all of its values, so it matches pandas exactly when no values are missing.
+
+        Args:
+            method (str, optional): 'pearson' or 'spearman'. Defaults to 'pearson'.
+
+        Returns:
+            pd.DataFrame: correlation matrix indexed by numeric column names
+        """
+        assert method in _CORRELATION_METHODS, f"method must be one of {_CORRELATION_METHODS}"
+        if method not in self._cache:
+            accumulator = sketches.CorrelationAccumulator(self.numeric_columns)
+            accumulator.update(self._get_values(method))
+            self._cache[method] = accumulator.correlation()
+        return self._cache[method]
+
+
+    def target_correlation(self, target_column: str, method: str = 'pearson') -> pd.Series:
+        """Return correlations of every numeric column against a numeric target.
+
+        Args:
+            target_column (str): numeric target column name
+            method (str, optional): 'pearson' or 'spearman'. Defaults to 'pearson'.
+
+        Returns:
+            pd.Series: correlation per numeric column, target included
+        """
+        assert target_column in self.numeric_columns, f"{target_column} is not a numeric column"
+        return self.correlation(method)[target_column]
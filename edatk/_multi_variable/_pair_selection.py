@@ -0,0 +1,157 @@
+from typing import Mapping, Optional
+import numpy as np
+import pandas as pd
+
+from edatk._multi_variable._correlation import CorrelationEngine
+
+
+# Categories kept per column when scoring categorical pairs, the rest are lumped together
+_MAX_PAIR_SCORE_LEVELS = 50
+
+
+def _get_category_codes(s: pd.Series, max_levels: int = _MAX_PAIR_SCORE_LEVELS) -> np.ndarray:
+    """Return integer category codes, the most frequent max_levels values keep their own code and the rest share one. Missing is -1.
+
+    Args:
+        s (pd.Series): column to encode
+        max_levels (int, optional): max number of distinct codes before lumping. Defaults to _MAX_PAIR_SCORE_LEVELS.
+
+    Returns:
+        np.ndarray: codes from 0 to at most max_levels, -1 for missing
+    """
+    codes, uniques = pd.factorize(s)
+    if len(uniques) > max_levels:
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        rank = np.empty(len(uniques), dtype=np.int64)
+        rank[np.argsort(-counts, kind='stable')] = np.arange(len(uniques))
+        codes = np.where(codes >= 0, np.minimum(rank[np.maximum(codes, 0)], max_levels), -1)
+    return codes
+
+
+def _correlation_ratio(codes: np.ndarray, values: np.ndarray) -> float:
+    """Return the correlation ratio (eta) of a numeric column grouped by a categorical column, over rows where both are present.
+
+    Args:
+        codes (np.ndarray): category codes, -1 for missing
+        values (np.ndarray): float values, nan for missing
+
+    Returns:
+        float: eta from 0 (group means equal) to 1 (groups fully determine values)
+    """
+    present = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[present], values[present]
+    if values.shape[0] == 0:
+        return 0.0
+    deltas = values - values.mean()
+    total_ss = np.dot(deltas, deltas)
+    if total_ss == 0:
+        return 0.0
+    group_counts = np.bincount(codes)
+    group_sums = np.bincount(codes, weights=deltas)
+    nonempty = group_counts > 0
+    between_ss = np.sum(group_sums[nonempty] ** 2 / group_counts[nonempty])
+    return float(np.sqrt(min(between_ss / total_ss, 1.0)))
+
+
+def _cramers_v(codes_one: np.ndarray, codes_two: np.ndarray) -> float:
+    """Return Cramér's V of two categorical columns, over rows where both are present.
+
+    Args:
+        codes_one (np.ndarray): category codes of the first column, -1 for missing
+        codes_two (np.ndarray): category codes of the second column, -1 for missing
+
+    Returns:
+        float: association from 0 (independent) to 1 (one determines the other)
+    """
+    present = (codes_one >= 0) & (codes_two >= 0)
+    codes_one, codes_two = codes_one[present], codes_two[present]
+    n = codes_one.shape[0]
+    if n == 0:
+        return 0.0
+
+    # Contingency table from flattened code pairs
+    levels_one, levels_two = codes_one.max() + 1, codes_two.max() + 1
+    table = np.bincount(codes_one * levels_two + codes_two, minlength=levels_one * levels_two).reshape(levels_one, levels_two)
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    min_levels = min(table.shape)
+    if min_levels < 2:
+        return 0.0
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    chi2 = np.sum((table - expected) ** 2 / expected)
+    return float(np.sqrt(min(chi2 / n / (min_levels - 1), 1.0)))
+
+
+def _score_column_pairs(
+        df: pd.DataFrame,
+        column_combinations: list[tuple[str, str]],
+        column_types: Mapping[str, str],
+        correlation_engine: Optional[CorrelationEngine] = None
+    ) -> pd.Series:
+    """Score the association of each column pair on a common 0 to 1 scale.
+
+    Numeric pairs use absolute Pearson correlation from the shared engine, numeric and categorical pairs the correlation ratio, and categorical pairs Cramér's V.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_combinations (list[tuple[str, str]]): column name pairs to score
+        column_types (Mapping[str, str]): column type index, only 'numeric' columns are treated as continuous
+        correlation_engine (CorrelationEngine, optional): shared engine, built from df if not passed. Defaults to None.
+
+    Returns:
+        pd.Series: score per pair, indexed by pair tuples in the given order
+    """
+    if correlation_engine is None:
+        correlation_engine = CorrelationEngine(df)
+    pair_columns = list(dict.fromkeys(col for combo in column_combinations for col in combo))
+    continuous = {col for col in pair_columns if column_types.get(col) == 'numeric' and col in correlation_engine.numeric_columns}
+    correlation = correlation_engine.correlation() if continuous else None
+
+    # Encode every column once, not once per pair
+    values = {col: df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in pair_columns if col in continuous}
+    codes = {col: _get_category_codes(df[col]) for col in pair_columns if col not in continuous}
+
+    scores = []
+    for col_a, col_b in column_combinations:
+        if col_a in continuous and col_b in continuous:
+            score = abs(correlation.loc[col_a, col_b])
+        elif col_a in continuous:
+            score = _correlation_ratio(codes[col_b], values[col_a])
+        elif col_b in continuous:
+            score = _correlation_ratio(codes[col_a], values[col_b])
+        else:
+            score = _cramers_v(codes[col_a], codes[col_b])
+        scores.append(0.0 if np.isnan(score) else score)
+    return pd.Series(scores, index=pd.Index(column_combinations, tupleize_cols=False), dtype=np.float64)
+
+
+def _select_column_pairs(
+        df: pd.DataFrame,
+        column_combinations: list[tuple[str, str]],
+        column_types: Mapping[str, str],
+        correlation_engine: Optional[CorrelationEngine] = None,
+        max_pairs: Optional[int] = None,
+        pair_threshold: Optional[float] = None
+    ) -> list[tuple[str, str]]:
+    """Keep the most associated column pairs, strongest first. Returns all pairs unchanged if no limit is set.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_combinations (list[tuple[str, str]]): column name pairs to select from
+        column_types (Mapping[str, str]): column type index
+        correlation_engine (CorrelationEngine, optional): shared engine, built from df if not passed. Defaults to None.
+        max_pairs (int, optional): keep at most this many pairs. Defaults to None.
+        pair_threshold (float, optional): keep pairs scoring at least this (0 to 1). Defaults to None.
+
+    Returns:
+        list[tuple[str, str]]: selected column name pairs
+    """
+    if max_pairs is None and pair_threshold is None:
+        return column_combinations
+    assert max_pairs is None or max_pairs >= 0, "max_pairs must be non negative"
+    scores = _score_column_pairs(df, column_combinations, column_types, correlation_engine)
+    scores = scores.sort_values(ascending=False, kind='stable')
+    if pair_threshold is not None:
+        scores = scores[scores >= pair_threshold]
+    if max_pairs is not None:
+        scores = scores.iloc[:max_pairs]
+    return list(scores.index)
@@ -1,11 +1,20 @@
 import math
-from typing import Optional
+from typing import Mapping, Optional
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.colors import LogNorm
+from matplotlib.lines import Line2D
 from seaborn.miscplot import palplot
 from seaborn.palettes import color_palette
-from edatk._single_variable._summary_statistics import _op_get_column_data_type, _op_distinct_count
+from edatk._single_variable._summary_statistics import _lookup_column_data_type, _op_distinct_count, _get_box_stats
+from edatk._kde import _binned_kde_grouped
+from edatk._core import _get_swarm_sample_size, _MIN_SWARM_POINTS, _SWARM_TIME_BUDGET
+from edatk._multi_variable._correlation import CorrelationEngine
+
+
+# Bins per axis for 2d density charts of numeric pairs
+_DENSITY_BINS = 50
 
 
 def _plot_relationship(
@@ -13,7 +22,10 @@ def _plot_relationship(
         column_name_one: str, 
         column_name_two: str, 
         ax: object, 
-        target_column: Optional[str] = None
+        target_column: Optional[str] = None,
+        column_types: Optional[Mapping[str, str]] = None,
+        render_mode: str = 'default',
+        swarm_budget: float = _SWARM_TIME_BUDGET
     ):
     """Plot relationship columns given df and two column names
 
@@ -22,10 +34,14 @@ def _plot_relationship(
         column_name_one (str): name of column 1 to be compared.
         column_name_two (str): name of column 2 to be compared
         ax (matplotlib ax): chart to plot to.
+        target_column (str, optional): Name of target column. Defaults to None.
+        column_types (Mapping[str, str], optional): column type index, columns not in it are inferred. Defaults to None.
+        render_mode (str, optional): 'fast' draws box plots from grouped aggregates and numeric pairs as 2d densities instead of sampled scatters. Defaults to 'default'.
+        swarm_budget (float, optional): seconds allowed for the swarm layout of category vs. numeric pairs, a strip plot is drawn when a swarm does not fit. Defaults to _SWARM_TIME_BUDGET.
     """
     # Determine data types of two cols
-    dt_one = _op_get_column_data_type(df, column_name_one)
-    dt_two = _op_get_column_data_type(df, column_name_two)
+    dt_one = _lookup_column_data_type(df, column_name_one, column_types)
+    dt_two = _lookup_column_data_type(df, column_name_two, column_types)
 
     # Set col names as title
     ax.set_title(f'{column_name_one}-{column_name_two}')
@@ -64,9 +80,11 @@ def _plot_relationship(
             ax.set_xlim(xmin, xmax)
             ax.set_ylim(ymin, ymax)
 
-        # Plot scatter
+        # Plot 2d density over every row in fast mode, otherwise scatter a sample
         max_sample = 1000
-        if len(df) <= max_sample:
+        if render_mode == 'fast':
+            _plot_density_scatter(df, column_name_one, column_name_two, ax, hue_column=hue_color_column, hue_order=hue_order, palette=color_palette)
+        elif len(df) <= max_sample:
             sns.scatterplot(data=df, x=column_name_one, y=column_name_two, hue=hue_color_column, hue_order=hue_order, palette=color_palette, ax=ax)
         else:
             ct = sns.scatterplot(data=df.sample(n=max_sample, random_state=42), x=column_name_one, y=column_name_two, hue=hue_color_column, hue_order=hue_order, palette=color_palette, ax=ax)
@@ -82,7 +100,7 @@ def _plot_relationship(
             string_col = column_name_two
             numeric_col = column_name_one
         
-        sns.kdeplot(data=df, x=numeric_col, hue=string_col, common_norm=False, ax=ax)
+        _plot_grouped_kde(df, numeric_col, string_col, ax)
 
     # --Text/Bool as one column, countplot/boxplot/kdeplot depending on data types and unique counts--
     elif (dt_one in ['string', 'bool'] and dt_two in ['numeric', 'numeric-condensed']) or (dt_one in ['numeric', 'numeric-condensed'] and dt_two in ['string', 'bool']):
@@ -110,7 +128,13 @@ def _plot_relationship(
         if (dt_one == 'bool' or dt_two == 'bool') and (dt_one != 'numeric' and dt_two != 'numeric'):
             sns.countplot(y=df2[numeric_col], hue=df2[string_col], ax=ax)
         elif (dt_one == 'bool' or dt_two == 'bool' or distinct_string_count == 2) and (dt_one == 'numeric' or dt_two == 'numeric'):
-            sns.kdeplot(data=df2, x=numeric_col, hue=string_col, common_norm=False, ax=ax)
+            _plot_grouped_kde(df2, numeric_col, string_col, ax)
+        elif render_mode == 'fast':
+
+            # Box plot categories vs. numeric from grouped box statistics, no swarm
+            sort_order = df2[string_col].value_counts().index.tolist()
+            cpalette = ['red' if 'Missing' in x else 'tab:blue' if 'Other' in x else 'grey' for x in sort_order]
+            _plot_grouped_box_fast(df2, string_col, numeric_col, sort_order, cpalette, ax)
         else:
 
             # Box plot categories vs. numeric
@@ -118,19 +142,27 @@ def _plot_relationship(
             cpalette = ['red' if 'Missing' in x else 'tab:blue' if 'Other' in x else 'grey' for x in sort_order]
             sns.boxplot(data=df2, x=string_col, y=numeric_col, palette=cpalette, order=sort_order, ax=ax)
             
-            # Swarm plot target
+            # Swarm plot target, sample sized to the swarm time budget with a strip plot fallback
             max_sample = 75
-            if len(df) > max_sample:
+            sample_size = _get_swarm_sample_size(df2[string_col].value_counts().values, max_sample, swarm_budget)
+            use_swarm = sample_size >= min(_MIN_SWARM_POINTS, len(df2))
+            if not use_swarm:
+                sample_size = min(max_sample, len(df2))
+            point_plot = sns.swarmplot if use_swarm else sns.stripplot
+            plot_name = 'swarm' if use_swarm else 'strip (swarm over time budget)'
+            if len(df2) > sample_size:
                 if hue_color_column is not None:
-                    num_groups = _op_distinct_count(df, hue_color_column)
-                    group_sample = int(max_sample / num_groups * 1.0)
-                    ct = sns.swarmplot(data=df.groupby(hue_color_column).apply(lambda x: x.sample(group_sample, replace=True, random_state=42)), x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, palette=color_palette, order=sort_order, ax=ax)
-                    ct.set_title(f'{ct.get_title()}, swarm n={group_sample * num_groups} (with resampling) of {len(df)}')
+                    group_sample = int(sample_size / len(hue_order))
+                    sample_df = df2.iloc[_sample_group_positions(df2[hue_color_column], hue_order, group_sample)]
+                    ct = point_plot(data=sample_df, x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, palette=color_palette, order=sort_order, ax=ax)
+                    ct.set_title(f'{ct.get_title()}, {plot_name} n={len(sample_df)} (with resampling) of {len(df)}')
                 else:
-                    ct = sns.swarmplot(data=df2.sample(n=max_sample, random_state=42), x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, order=sort_order, ax=ax)
-                    ct.set_title(f'{ct.get_title()}, swarm n={max_sample} of {len(df)}')
+                    ct = point_plot(data=df2.sample(n=sample_size, random_state=42), x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, order=sort_order, ax=ax)
+                    ct.set_title(f'{ct.get_title()}, {plot_name} n={sample_size} of {len(df)}')
             else:
-                sns.swarmplot(data=df2, x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, order=sort_order, ax=ax)
+                ct = point_plot(data=df2, x=string_col, y=numeric_col, hue=hue_color_column, hue_order=hue_order, order=sort_order, ax=ax)
+                if not use_swarm:
+                    ct.set_title(f'{ct.get_title()}, {plot_name}')
 
     # --Both Text/Bool = countplot--
     elif dt_one in ['string', 'bool', 'numeric-condensed'] and dt_two in ['string', 'bool', 'numeric-condensed']:
@@ -164,11 +196,180 @@ def _plot_relationship(
             sns.countplot(data=df2, y='combinations', hue=hue_color_column, hue_order=hue_order, order=sort_order, ax=ax)
 
 
+def _sample_group_positions(hue_values: pd.Series, hue_order: list, group_sample: int, random_state: int = 42) -> np.ndarray:
+    """Return row positions of an equal size sample (with replacement) from each hue group, without a groupby apply.
+
+    Args:
+        hue_values (pd.Series): hue value per row
+        hue_order (list): hue groups to sample from
+        group_sample (int): rows drawn per group
+        random_state (int, optional): random seed. Defaults to 42.
+
+    Returns:
+        np.ndarray: sampled row positions, grouped in hue order
+    """
+    codes = pd.Categorical(hue_values, categories=hue_order).codes
+    rng = np.random.default_rng(random_state)
+    positions = []
+    for i in range(len(hue_order)):
+        group_positions = np.flatnonzero(codes == i)
+        if group_positions.shape[0] > 0:
+            positions.append(rng.choice(group_positions, group_sample, replace=True))
+    return np.concatenate(positions) if positions else np.zeros(0, dtype=np.int64)
+
+
+def _get_bin_index(values: np.ndarray, bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return equal width bin edges over the value range and the bin index of each value.
+
+    Args:
+        values (np.ndarray): values without NAs
+        bins (int): number of bins
+
+    Returns:
+        tuple: bin edges and bin index per value
+    """
+    low, high = values.min(), values.max()
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+    index = np.minimum(((values - low) / (high - low) * bins).astype(np.int64), bins - 1)
+    return edges, index
+
+
+def _plot_density_scatter(
+        df: pd.DataFrame,
+        x_col: str,
+        y_col: str,
+        ax: object,
+        hue_column: Optional[str] = None,
+        hue_order: Optional[list] = None,
+        palette: Optional[dict] = None,
+        bins: int = _DENSITY_BINS
+    ):
+    """Plot a 2d histogram of every row as a log scaled heatmap, with density contours per hue group if a hue column is passed.
+
+    All groups are counted in one bincount pass over the rows.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        x_col (str): x axis column
+        y_col (str): y axis column
+        ax (matplotlib ax): ax to plot to
+        hue_column (str, optional): column to draw group density layers for. Defaults to None.
+        hue_order (list, optional): hue values to draw, in order. Defaults to None.
+        palette (dict, optional): hue value to color. Defaults to None.
+        bins (int, optional): bins per axis. Defaults to _DENSITY_BINS.
+    """
+    x = df[x_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[y_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(x) & ~np.isnan(y)
+    if not present.any():
+        return None
+    x, y = x[present], y[present]
+
+    # Group codes, rows missing a hue still count toward the overall density
+    if hue_column is not None:
+        hue_order = hue_order if hue_order is not None else df[hue_column].dropna().unique().tolist()
+        codes = pd.Categorical(df[hue_column][present], categories=hue_order).codes.astype(np.int64)
+    else:
+        hue_order = []
+        codes = np.full(x.shape[0], -1, dtype=np.int64)
+    n_layers = len(hue_order) + 1
+    codes = np.where(codes < 0, len(hue_order), codes)
+
+    # One pass counting every group on shared bins
+    x_edges, x_index = _get_bin_index(x, bins)
+    y_edges, y_index = _get_bin_index(y, bins)
+    counts = np.bincount((codes * bins + x_index) * bins + y_index, minlength=n_layers * bins * bins).reshape(n_layers, bins, bins)
+    total_counts = counts.sum(axis=0)
+
+    # Overall density, greyed out when group layers are drawn on top
+    mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(total_counts.T, 0), cmap='Greys' if hue_order else 'viridis', norm=LogNorm(), shading='flat')
+    if not hue_order:
+        ax.figure.colorbar(mesh, ax=ax, label='count')
+
+    # Density contours per group
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2.0
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2.0
+    handles = []
+    for i, hue_value in enumerate(hue_order):
+        group_counts = counts[i]
+        if np.count_nonzero(group_counts) < 2:
+            continue
+        color = palette.get(hue_value) if isinstance(palette, dict) else None
+        levels = np.unique(group_counts.max() * np.array([0.1, 0.3, 0.6]))
+        ax.contour(x_centers, y_centers, group_counts.T, levels=levels, colors=[color] if color else None)
+        handles.append(Line2D([0], [0], color=color, label=str(hue_value)))
+    if handles:
+        ax.legend(handles=handles, title=hue_column)
+
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(f'{ax.get_title()}, density of n={x.shape[0]}')
+
+
+def _plot_grouped_kde(df: pd.DataFrame, numeric_col: str, group_col: str, ax: object):
+    """Plot one kde per group, each normalized on its own (like kdeplot with common_norm=False), binned in one pass and smoothed with FFTs.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        numeric_col (str): column the densities are estimated for
+        group_col (str): column to group (hue) by
+        ax (matplotlib ax): ax to plot to
+    """
+    values = df[numeric_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    codes, groups = pd.factorize(df[group_col], sort=True)
+    present = (codes >= 0) & ~np.isnan(values)
+    grid, densities = _binned_kde_grouped(values[present], codes[present], len(groups), gridsize=512)
+    if grid is not None:
+        for group_name, density in zip(groups, densities):
+            if not np.all(np.isnan(density)):
+                ax.plot(grid, density, label=str(group_name))
+        ax.legend(title=group_col)
+    ax.set_xlabel(numeric_col)
+    ax.set_ylabel('Density')
+
+
+def _plot_grouped_box_fast(
+        df: pd.DataFrame, 
+        group_col: str, 
+        numeric_col: str, 
+        order: list[str], 
+        palette: list[str], 
+        ax: object
+    ):
+    """Plot one box per group from box statistics computed per group.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        group_col (str): column to group by, one box per value
+        numeric_col (str): column summarized in each box
+        order (list[str]): group values in plotting order
+        palette (list[str]): box color per group in order
+        ax (matplotlib ax): ax to plot to
+    """
+    grouped = {group_name: np.sort(group_values.dropna().to_numpy(dtype=np.float64)) for group_name, group_values in df.groupby(group_col)[numeric_col]}
+    box_stats, colors = [], []
+    for group_name, color in zip(order, palette):
+        group_stats = _get_box_stats(grouped.get(group_name, np.zeros(0)), label=group_name)
+        if group_stats is not None:
+            box_stats.append(group_stats)
+            colors.append(color)
+    if len(box_stats) > 0:
+        boxes = ax.bxp(box_stats, widths=0.8, patch_artist=True, medianprops={'color': 'black'})
+        for patch, color in zip(boxes['boxes'], colors):
+            patch.set_facecolor(color)
+    ax.set_xlabel(group_col)
+    ax.set_ylabel(numeric_col)
+
+
 def _plot_heatmap(
         df: pd.DataFrame, 
         ax: object, 
         column_list: Optional[list[str]] = None, 
-        target_column: Optional[str]=None
+        target_column: Optional[str] = None,
+        correlation_engine: Optional[CorrelationEngine] = None,
+        method: str = 'pearson'
     ):
     """Plot a heatmap of columns. If target passed, then one col heatmap.
 
@@ -177,15 +378,32 @@ def _plot_heatmap(
         ax (matplotlib ax): ax to plot to
         column_list (str, optional): Columns to be analyzed. Defaults to None.
         target_column (str, optional): Name of target column. Defaults to None.
+        correlation_engine (CorrelationEngine, optional): shared engine holding cached correlations, built from df if not passed. Defaults to None.
+        method (str, optional): correlation method, 'pearson' or 'spearman'. Defaults to 'pearson'.
+    """
+    if correlation_engine is None:
+        correlation_engine = CorrelationEngine(df, column_list)
+
+    _plot_correlation_matrix(correlation_engine.correlation(method), ax, target_column=target_column)
+
+
+def _plot_correlation_matrix(
+        correlation: pd.DataFrame, 
+        ax: object, 
+        target_column: Optional[str] = None
+    ):
+    """Plot a heatmap of an already computed correlation matrix. If target passed, then one col heatmap.
+
+    Args:
+        correlation (pd.DataFrame): square correlation matrix
+        ax (matplotlib ax): ax to plot to
+        target_column (str, optional): Name of target column. Defaults to None.
     """
-    if column_list is None:
-        column_list = df.columns.values
-    
     if target_column:
-        ct = sns.heatmap(df.loc[:,column_list].corr()[[target_column]].sort_values(by=target_column, ascending=False), ax=ax, vmin=-1, vmax=1, annot=True, cmap='Spectral')
+        ct = sns.heatmap(correlation[[target_column]].sort_values(by=target_column, ascending=False), ax=ax, vmin=-1, vmax=1, annot=True, cmap='Spectral')
     else:
-        mask = np.triu(np.ones_like(df.loc[:,column_list].corr(), dtype=np.bool))
-        ct = sns.heatmap(df.loc[:,column_list].corr(), ax=ax, vmin=-1, vmax=1, annot=True, cmap='Spectral', mask=mask)
+        mask = np.triu(np.ones_like(correlation, dtype=bool))
+        ct = sns.heatmap(correlation, ax=ax, vmin=-1, vmax=1, annot=True, cmap='Spectral', mask=mask)
 
     # Fix label rotation
     ct.set_yticklabels(ct.get_yticklabels(), rotation=0)
\ No newline at end of file
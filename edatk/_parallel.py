@@ -0,0 +1,18 @@
+import os
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Translate n_jobs into a worker count, negative values count back from the cpu count (-1 is all cpus).
+
+    Args:
+        n_jobs (int): requested number of jobs, None or 1 for serial.
+
+    Returns:
+        int: number of worker processes to use, at least 1.
+    """
+    if n_jobs is None:
+        return 1
+    cpu_count = os.cpu_count() or 1
+    if n_jobs < 0:
+        n_jobs = cpu_count + 1 + n_jobs
+    return max(1, n_jobs)
@@ -0,0 +1,194 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+import pandas as pd
+
+import edatk._core as core
+
+
+# Ops listed in the performance section, slowest first
+_SLOWEST_OPS_SHOWN = 20
+
+
+class RunStats:
+    """Wall time, cpu time and (optionally) peak traced memory of every op in an auto eda run, one record per table metric, chart, column profile and pair.
+
+    Returned by auto_eda. Records from worker processes are merged back in, cpu time is per process.
+    """
+    def __init__(self, trace_memory: bool = False):
+        """Create new Run Stats, the run clock starts now
+
+        Args:
+            trace_memory (bool, optional): record the peak memory allocated by each op with tracemalloc, which slows allocation heavy ops. Defaults to False.
+        """
+        self.trace_memory = trace_memory
+        self.records = []
+        self.skipped_ops = []
+        self.total_wall_seconds = None
+        self._start = time.perf_counter()
+        self._started_tracing = False
+
+
+    def __repr__(self) -> str:
+        return f'RunStats(ops={len(self.records)}, total_wall_seconds={self.total_wall_seconds}, skipped_ops={len(self.skipped_ops)})'
+
+
+    @contextmanager
+    def measure(self, section: str, column_name: Optional[str], op_name: str) -> Iterator[None]:
+        """Record wall time, cpu time and peak traced memory of the code run inside the context.
+
+        Args:
+            section (str): run stage, e.g. 'single_variable'
+            column_name (str, optional): column the op summarizes, None for multi column ops
+            op_name (str): op, chart or pair name
+        """
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                'section': section,
+                'column': column_name,
+                'op': op_name,
+                'wall_seconds': time.perf_counter() - wall_start,
+                'cpu_seconds': time.process_time() - cpu_start,
+                'peak_memory_bytes': tracemalloc.get_traced_memory()[1] - memory_before if self.trace_memory else None,
+                'pid': os.getpid()
+            }
+            self.records.append(record)
+
+
+    def elapsed_seconds(self) -> float:
+        """Return wall seconds since the run started.
+
+        Returns:
+            float: elapsed seconds
+        """
+        return time.perf_counter() - self._start
+
+
+    def finish(self):
+        """Stop the run clock and memory tracing started by this object.
+        """
+        self.total_wall_seconds = self.elapsed_seconds()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return one row per op record.
+
+        Returns:
+            pd.DataFrame: section, column, op, wall_seconds, cpu_seconds, peak_memory_bytes and pid per op
+        """
+        return pd.DataFrame(self.records, columns=['section', 'column', 'op', 'wall_seconds', 'cpu_seconds', 'peak_memory_bytes', 'pid'])
+
+
+    def summary(self, by: str = 'column') -> pd.DataFrame:
+        """Return total wall and cpu seconds and the largest op memory peak per group, slowest first.
+
+        Args:
+            by (str, optional): 'column', 'op' or 'section'. Defaults to 'column'.
+
+        Returns:
+            pd.DataFrame: wall_seconds, cpu_seconds, peak_memory_bytes and op count per group, multi column ops grouped under a missing column
+        """
+        assert by in ['column', 'op', 'section'], "by must be 'column', 'op' or 'section'"
+        stats_df = self.to_dataframe()
+        summary_df = stats_df.groupby(by, dropna=False).agg(wall_seconds=('wall_seconds', 'sum'), cpu_seconds=('cpu_seconds', 'sum'), peak_memory_bytes=('peak_memory_bytes', 'max'), ops=('op', 'count'))
+        return summary_df.sort_values('wall_seconds', ascending=False)
+
+
+    def to_dict(self) -> dict:
+        """Return the run stats as plain python objects.
+
+        Returns:
+            dict: total_wall_seconds, trace_memory, records and skipped_ops
+        """
+        return {
+            'total_wall_seconds': self.total_wall_seconds,
+            'trace_memory': self.trace_memory,
+            'records': self.records,
+            'skipped_ops': self.skipped_ops
+        }
+
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """Return the run stats as json, also writing them to a file if a path is passed.
+
+        Args:
+            path (str, optional): file to write. Defaults to None.
+            indent (int, optional): json indent. Defaults to 2.
+
+        Returns:
+            str: json document
+        """
+        json_str = json.dumps(self.to_dict(), indent=indent, default=str)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(json_str)
+        return json_str
+
+
+def _format_stats_row(row: pd.Series) -> str:
+    """Format the timings of one summary or record row.
+
+    Args:
+        row (pd.Series): row with wall_seconds, cpu_seconds and peak_memory_bytes
+
+    Returns:
+        str: timings as text
+    """
+    stats_str = f'wall {row["wall_seconds"]:.2f}s, cpu {row["cpu_seconds"]:.2f}s'
+    if pd.notna(row['peak_memory_bytes']):
+        stats_str += f', peak {row["peak_memory_bytes"] / 1e6:.1f} MB'
+    return stats_str
+
+
+def _report_run_stats(run_stats: RunStats, html_report: object, show_chart: bool = True):
+    """Print or save a performance section with run totals, time per column and the slowest ops, covering the run up to this call.
+
+    Args:
+        run_stats (RunStats): finished run stats
+        html_report (object): html report object to hold data and write to file, None for console
+        show_chart (bool, optional): whether to call plt.show. Defaults to True.
+    """
+    stats_df = run_stats.to_dataframe()
+    if stats_df.shape[0] == 0:
+        return None
+    section = 'performance'
+
+    # Run totals
+    totals_dict = {
+        'Run Wall Seconds': lambda: float(run_stats.elapsed_seconds()),
+        'Op Wall Seconds': lambda: float(stats_df['wall_seconds'].sum()),
+        'Op CPU Seconds': lambda: float(stats_df['cpu_seconds'].sum()),
+        'Ops Timed': lambda: int(stats_df.shape[0]),
+        'Ops Skipped': lambda: len(run_stats.skipped_ops)
+    }
+    if run_stats.trace_memory:
+        totals_dict['Largest Op Peak MB'] = lambda: float(stats_df['peak_memory_bytes'].max() / 1e6)
+    core._bind_to_console_html(section=section, run_type='table', run_dict=totals_dict, html_report=html_report, show_chart=show_chart, header_text='Performance')
+
+    # Time per column
+    column_summary = run_stats.summary('column')
+    column_dict = {('(no column)' if pd.isna(col) else str(col)): (lambda row=row: _format_stats_row(row)) for col, row in column_summary.iterrows()}
+    core._bind_to_console_html(section=section, run_type='table', run_dict=column_dict, html_report=html_report, show_chart=show_chart, header_text='Time per Column')
+
+    # Slowest individual ops
+    slowest_df = stats_df.sort_values('wall_seconds', ascending=False).head(_SLOWEST_OPS_SHOWN)
+    slowest_dict = {}
+    for i, (_, row) in enumerate(slowest_df.iterrows()):
+        op_name = row['op'] if pd.isna(row['column']) else f"{row['column']} {row['op']}"
+        slowest_dict[f'{i + 1}. {op_name}'] = lambda row=row: _format_stats_row(row)
+    core._bind_to_console_html(section=section, run_type='table', run_dict=slowest_dict, html_report=html_report, show_chart=show_chart, header_text='Slowest Ops')
@@ -0,0 +1,238 @@
+import time
+from typing import Callable, Mapping, Optional
+import pandas as pd
+
+import edatk._core as core
+
+
+# Order charts are admitted in when the budget is tight, lower first. Summary tables always run.
+_CHART_PRIORITY = {
+    'Histogram': 1,
+    'Box Plot': 1,
+    'Count Plot': 1,
+    'Count Plot %': 1,
+    'Correlation Heatmap': 1,
+    'Target Heatmap': 1,
+    'ECDF': 2,
+    'Best Distribution': 2,
+    'Swarm': 3,
+    'Distributions': 3,
+    'Distribution Fits': 3
+}
+_PAIR_PRIORITY = 2
+_DEFAULT_PRIORITY = 2
+
+# Estimated chart seconds as (fixed, per row) by render mode, measured on skewed numeric columns
+_CHART_COSTS = {
+    'Histogram': {'default': (0.3, 4e-6), 'fast': (0.1, 2e-7)},
+    'Box Plot': {'default': (0.01, 1e-7), 'fast': (0.01, 3e-7)},
+    'Count Plot': {'default': (0.02, 2e-7), 'fast': (0.02, 2e-7)},
+    'Count Plot %': {'default': (0.02, 2e-7), 'fast': (0.02, 2e-7)},
+    'ECDF': {'default': (0.01, 1e-6), 'fast': (0.01, 0.0)},
+    'Swarm': {'default': (0.1, 0.0), 'fast': (0.01, 0.0)},
+    'Distributions': {'default': (0.15, 1e-6), 'fast': (0.15, 1e-6)},
+    'Best Distribution': {'default': (0.05, 2e-7), 'fast': (0.05, 2e-7)},
+    'Distribution Fits': {'default': (0.02, 0.0), 'fast': (0.02, 0.0)}
+}
+_DEFAULT_CHART_COST = (0.1, 1e-6)
+_PAIR_COST = {'default': (0.1, 1e-6), 'fast': (0.1, 1e-7)}
+_HEATMAP_COST = (0.2, 1e-8)
+
+# Seconds of distribution fitting per numeric column, shared by the three distribution charts
+_DISTRIBUTION_FIT_SECONDS = 0.4
+_DISTRIBUTION_CHARTS = ('Distributions', 'Best Distribution', 'Distribution Fits')
+
+# Seconds per chart for its share of saving a page, and per column summary table
+_CHART_SAVE_SECONDS = 0.04
+_TABLE_SECONDS = 0.01
+_TABLE_SECONDS_PER_ROW = 1e-7
+
+
+class TimeBudget:
+    """Wall clock budget for a run. Charts are planned against it up front by priority and estimated cost, and checked again against the time left when dispatched.
+
+    The deadline is absolute, so copies sent to worker processes keep the same clock.
+    """
+    def __init__(self, seconds: float, swarm_seconds: Optional[float] = None):
+        """Create new Time Budget, the clock starts now
+
+        Args:
+            seconds (float): wall clock seconds allowed for the run
+            swarm_seconds (float, optional): seconds each swarm chart may spend on layout, swarms that do not fit are drawn as strip plots. Defaults to a share of seconds.
+        """
+        assert seconds > 0, "time_budget must be positive"
+        assert swarm_seconds is None or swarm_seconds > 0, "swarm_seconds must be positive"
+        self.seconds = seconds
+        self.swarm_seconds = core._get_swarm_time_budget(seconds) if swarm_seconds is None else swarm_seconds
+        self.deadline = time.time() + seconds
+        self.estimates = {}
+        self.planned = set()
+        self.skipped_ops = []
+
+
+    def remaining(self) -> float:
+        """Return seconds left before the deadline, negative once passed.
+
+        Returns:
+            float: seconds left
+        """
+        return self.deadline - time.time()
+
+
+    def plan(self, op_costs: Mapping[tuple, tuple[int, float]]):
+        """Admit ops in priority then estimated cost order while their estimates fit the time left, the rest are left out of the run.
+
+        Priority 0 ops always run and only take their estimate out of the time left.
+
+        Args:
+            op_costs (Mapping[tuple, tuple[int, float]]): op id (column name or None, op name) -> (priority, estimated seconds)
+        """
+        available = self.remaining()
+        for op_id, (priority, cost) in sorted(op_costs.items(), key=lambda item: item[1]):
+            self.estimates[op_id] = cost
+            if priority == 0 or cost <= available:
+                self.planned.add(op_id)
+                available -= cost
+
+
+    def admit(self, op_id: tuple, pending_seconds: float = 0.0) -> bool:
+        """Check whether an op should run now, recording it as skipped if not.
+
+        Ops the plan does not know about run while time is left.
+
+        Args:
+            op_id (tuple): (column name or None, op name)
+            pending_seconds (float, optional): estimated seconds of ops already admitted ahead of this one. Defaults to 0.0.
+
+        Returns:
+            bool: True if the op should run
+        """
+        estimate = self.estimates.get(op_id, 0.0)
+        if op_id in self.estimates and op_id not in self.planned:
+            reason = 'left out of plan'
+        elif pending_seconds + estimate > self.remaining():
+            reason = 'out of time'
+        else:
+            return True
+        self.skipped_ops.append({'column': op_id[0], 'op': op_id[1], 'estimated_seconds': estimate, 'reason': reason})
+        return False
+
+
+    def filter_run_dict(self, run_dict: dict[str, Callable], column_name: Optional[str] = None) -> dict[str, Callable]:
+        """Keep the charts of a run dict admitted by the budget, in their original order.
+
+        Args:
+            run_dict (dict[str, Callable]): chart name -> chart function
+            column_name (str, optional): column the charts summarize, None for multi column charts. Defaults to None.
+
+        Returns:
+            dict[str, Callable]: admitted charts
+        """
+        admitted = {}
+        pending_seconds = 0.0
+        for k, op in run_dict.items():
+            if self.admit((column_name, k), pending_seconds):
+                admitted[k] = op
+                pending_seconds += self.estimates.get((column_name, k), 0.0)
+        return admitted
+
+
+def _estimate_chart_cost(chart_name: str, row_count: int, render_mode: str = 'default', distribution_fit_timeout: Optional[float] = None, swarm_seconds: float = core._SWARM_TIME_BUDGET) -> float:
+    """Estimate seconds to draw and save one single column chart.
+
+    Args:
+        chart_name (str): chart name from the column visual dicts
+        row_count (int): rows in the column
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        distribution_fit_timeout (float, optional): caps the distribution fit seconds when set. Defaults to None.
+        swarm_seconds (float, optional): swarm layout budget per chart. Defaults to core._SWARM_TIME_BUDGET.
+
+    Returns:
+        float: estimated seconds
+    """
+    fixed, per_row = _CHART_COSTS.get(chart_name, {}).get(render_mode, _DEFAULT_CHART_COST)
+    cost = fixed + per_row * row_count + _CHART_SAVE_SECONDS
+    if chart_name == 'Swarm' and render_mode == 'default':
+        cost += swarm_seconds
+    if chart_name in _DISTRIBUTION_CHARTS:
+        fit_seconds = _DISTRIBUTION_FIT_SECONDS if distribution_fit_timeout is None else min(_DISTRIBUTION_FIT_SECONDS, distribution_fit_timeout)
+        cost += fit_seconds / len(_DISTRIBUTION_CHARTS)
+    return cost
+
+
+def _estimate_pair_cost(type_one: str, type_two: str, row_count: int, render_mode: str = 'default', swarm_seconds: float = core._SWARM_TIME_BUDGET) -> float:
+    """Estimate seconds to draw and save one relationship chart.
+
+    Args:
+        type_one (str): column type of the first column
+        type_two (str): column type of the second column
+        row_count (int): rows in the dataframe
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        swarm_seconds (float, optional): swarm layout budget per chart. Defaults to core._SWARM_TIME_BUDGET.
+
+    Returns:
+        float: estimated seconds
+    """
+    fixed, per_row = _PAIR_COST[render_mode]
+    cost = fixed + per_row * row_count + _CHART_SAVE_SECONDS
+    # Numeric by categorical pairs draw a swarm in default mode
+    if render_mode == 'default' and 'numeric' in (type_one, type_two) and type_one != type_two:
+        cost += swarm_seconds
+    return cost
+
+
+def _get_op_costs(
+        df: pd.DataFrame,
+        column_visuals: Mapping[str, list[str]],
+        column_combinations: list[tuple[str, str]],
+        heatmap_names: list[str],
+        column_types: Mapping[str, str],
+        render_mode: str = 'default',
+        distribution_fit_timeout: Optional[float] = None,
+        swarm_seconds: float = core._SWARM_TIME_BUDGET
+    ) -> dict[tuple, tuple[int, float]]:
+    """Estimate priority and seconds of every op in a run from the data shape.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_visuals (Mapping[str, list[str]]): column name -> chart names drawn for it
+        column_combinations (list[tuple[str, str]]): column pairs charted
+        heatmap_names (list[str]): heatmaps drawn
+        column_types (Mapping[str, str]): column type index
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        distribution_fit_timeout (float, optional): caps the distribution fit seconds when set. Defaults to None.
+        swarm_seconds (float, optional): swarm layout budget per chart. Defaults to core._SWARM_TIME_BUDGET.
+
+    Returns:
+        dict[tuple, tuple[int, float]]: op id (column name or None, op name) -> (priority, estimated seconds)
+    """
+    row_count = df.shape[0]
+    numeric_count = sum(1 for col_type in column_types.values() if col_type == 'numeric')
+    op_costs = {}
+    for col, chart_names in column_visuals.items():
+        op_costs[(col, 'Summary Table')] = (0, _TABLE_SECONDS + _TABLE_SECONDS_PER_ROW * row_count)
+        for chart_name in chart_names:
+            op_costs[(col, chart_name)] = (_CHART_PRIORITY.get(chart_name, _DEFAULT_PRIORITY), _estimate_chart_cost(chart_name, row_count, render_mode, distribution_fit_timeout, swarm_seconds))
+    for col_a, col_b in column_combinations:
+        op_costs[(None, f'{col_a}-{col_b}')] = (_PAIR_PRIORITY, _estimate_pair_cost(column_types.get(col_a), column_types.get(col_b), row_count, render_mode, swarm_seconds))
+    for heatmap_name in heatmap_names:
+        fixed, per_cell = _HEATMAP_COST
+        op_costs[(None, heatmap_name)] = (_CHART_PRIORITY.get(heatmap_name, _DEFAULT_PRIORITY), fixed + per_cell * row_count * numeric_count ** 2 + _CHART_SAVE_SECONDS)
+    return op_costs
+
+
+def _report_skipped_ops(time_budget: TimeBudget, html_report: object, show_chart: bool = True):
+    """Print or save the ops a time budget skipped.
+
+    Args:
+        time_budget (TimeBudget): budget used by the run
+        html_report (object): html report object to hold data and write to file, None for console
+        show_chart (bool, optional): whether to call plt.show. Defaults to True.
+    """
+    if len(time_budget.skipped_ops) == 0:
+        return None
+    skipped_dict = {}
+    for skipped in time_budget.skipped_ops:
+        op_name = skipped['op'] if skipped['column'] is None else f"{skipped['column']} {skipped['op']}"
+        skipped_dict[op_name] = lambda skipped=skipped: f"{skipped['reason']} (estimated {skipped['estimated_seconds']:.2f}s)"
+    core._bind_to_console_html(section='multi_variable', run_type='table', run_dict=skipped_dict, html_report=html_report, show_chart=show_chart, header_text=f'Skipped (Time Budget {time_budget.seconds}s)')
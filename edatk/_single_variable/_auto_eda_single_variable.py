@@ -1,94 +1,71 @@
-from typing import Optional
+from typing import Mapping, Optional
 import matplotlib.pyplot as plt
 import pandas as pd
 
 import edatk._core as core
 import edatk._single_variable._summary_statistics as sst
+import edatk._single_variable._distributions as distributions_registry
 import edatk._single_variable._visuals as viz
+import edatk._html_report._report_builder as html_build
+from edatk._scheduler import TimeBudget
+from edatk._run_stats import RunStats
 
-def _text_box_plot(df: pd.DataFrame, column_name: str) -> str:
-    """Return the text box plot given a dataframe and column name string.
+def _text_box_plot(profile: sst.ColumnProfile) -> str:
+    """Return the text box plot given a column profile.
 
     Args:
-        df (pd.DataFrame): input dataframe
-        column_name (string): column name to be analyzed
+        profile (ColumnProfile): precomputed column profile
 
     Returns:
         string: box plot as a simple string
     """
-    min = sst._op_min(df, column_name)
-    tf = sst._op_quantile(df, column_name, 0.25)
-    med = sst._op_median(df, column_name)
-    sf = sst._op_quantile(df, column_name, 0.75)
-    max = sst._op_max(df, column_name)
+    min = profile.min
+    tf = profile.quantile(0.25)
+    med = profile.median
+    sf = profile.quantile(0.75)
+    max = profile.max
     try:
         return f'|{min:.2f} --||{tf:.2f} ~ {med:.2f} ~ {sf:.2f}||-- {max:.2f}|'
     except:
         return f'|{min} --||{tf} ~ {med} ~ {sf}||-- {max}|'
 
 
-def _dist_rank_wrapper(df: pd.DataFrame, column_name: str, ax: object):
-    _, dist_df = sst._get_theoritical_distributions(df, column_name)
-    dist_series = dist_df.set_index('distribution_type')['rmse'].squeeze()
-    if dist_series is not None:
+def _dist_rank_wrapper(df: pd.DataFrame, column_name: str, ax: object, distributions: Optional[dict] = None, fit_timeout: Optional[float] = None):
+    _, dist_df = sst._get_theoritical_distributions(df, column_name, distributions, fit_timeout)
+    dist_series = dist_df.set_index('distribution_type')['rmse']
+    if dist_series.shape[0] > 0:
         viz._plot_simple_bar(dist_series, f"{column_name} Distribution Fit (RMSE of Density Deltas)", ax)
 
 
+# Table ops read from a precomputed column profile instead of rescanning the column
+_base_column_ops = {
+    'Column Name': lambda profile: str(profile.column_name),
+    'Data Type Grouping': lambda profile: profile.data_type,
+    'Data Type': lambda profile: profile.dtype,
+    'Row Count': lambda profile: profile.row_count,
+    'Distinct Count': lambda profile: profile.distinct_count,
+    'Missing Values': lambda profile: profile.missing_count,
+    'Missing Value %': lambda profile: profile.missing_ratio
+}
+
+_numeric_column_ops = {
+    **_base_column_ops,
+    'Mean': lambda profile: profile.mean,
+    'Median': lambda profile: profile.median,
+    'Min': lambda profile: profile.min,
+    'Max': lambda profile: profile.max,
+    'Standard Deviation': lambda profile: profile.std,
+    'CV %': lambda profile: profile.cv_ratio,
+    'Skew': lambda profile: profile.skew,
+    'Kurtosis': lambda profile: profile.kurtosis,
+    'Text Box Plot': _text_box_plot
+}
+
 _auto_eda_column_ops = {
-    'numeric': {
-        'Column Name': lambda df, column_name: str(column_name),
-        'Data Type Grouping': sst._op_get_column_data_type,
-        'Data Type': lambda df, column_name: str(df[column_name].dtype),
-        'Row Count': sst._op_rowcount,
-        'Distinct Count': sst._op_distinct_count,
-        'Missing Values': sst._op_missing_rows,
-        'Missing Value %': lambda df, column_name: float(sst._op_missing_rows(df, column_name)) / float(sst._op_rowcount(df, column_name)),
-        'Mean': sst._op_mean,
-        'Median': sst._op_median,
-        'Min': sst._op_min,
-        'Max': sst._op_max,
-        'Standard Deviation': sst._op_standard_deviation,
-        'CV %': lambda df, column_name: float(sst._op_standard_deviation(df, column_name)) / float(sst._op_mean(df, column_name)),
-        'Skew': sst._op_skew,
-        'Kurtosis': sst._op_kurtosis,
-        'Text Box Plot': _text_box_plot
-    },
-    'numeric-condensed': {
-        'Column Name': lambda df, column_name: str(column_name),
-        'Data Type Grouping': sst._op_get_column_data_type,
-        'Data Type': lambda df, column_name: str(df[column_name].dtype),
-        'Row Count': sst._op_rowcount,
-        'Distinct Count': sst._op_distinct_count,
-        'Missing Values': sst._op_missing_rows,
-        'Missing Value %': lambda df, column_name: float(sst._op_missing_rows(df, column_name)) / float(sst._op_rowcount(df, column_name)),
-        'Mean': sst._op_mean,
-        'Median': sst._op_median,
-        'Min': sst._op_min,
-        'Max': sst._op_max,
-        'Standard Deviation': sst._op_standard_deviation,
-        'CV %': lambda df, column_name: float(sst._op_standard_deviation(df, column_name)) / float(sst._op_mean(df, column_name)),
-        'Skew': sst._op_skew,
-        'Kurtosis': sst._op_kurtosis,
-        'Text Box Plot': _text_box_plot
-    },
-    'string': {
-        'Column Name': lambda df, column_name: str(column_name),
-        'Data Type Grouping': sst._op_get_column_data_type,
-        'Data Type': lambda df, column_name: str(df[column_name].dtype),
-        'Row Count': sst._op_rowcount,
-        'Distinct Count': sst._op_distinct_count,
-        'Missing Values': sst._op_missing_rows,
-        'Missing Value %': lambda df, column_name: float(sst._op_missing_rows(df, column_name)) / float(sst._op_rowcount(df, column_name))
-    },
-    'bool': {
-        'Column Name': lambda df, column_name: str(column_name),
-        'Data Type Grouping': sst._op_get_column_data_type,
-        'Data Type': lambda df, column_name: str(df[column_name].dtype),
-        'Row Count': sst._op_rowcount,
-        'Distinct Count': sst._op_distinct_count,
-        'Missing Values': sst._op_missing_rows,
-        'Missing Value %': lambda df, column_name: float(sst._op_missing_rows(df, column_name)) / float(sst._op_rowcount(df, column_name))
-    }
+    'numeric': _numeric_column_ops,
+    'numeric-condensed': _numeric_column_ops,
+    'string': _base_column_ops,
+    'bool': _base_column_ops
 }
 
 _auto_eda_column_visuals = {
@@ -113,12 +90,94 @@ _auto_eda_column_visuals = {
     }
 }
 
+def _get_distribution_fit_visuals(distributions: Optional[dict], fit_timeout: Optional[float]) -> dict:
+    """Return distribution fit charts bound to a set of candidate distributions and fit time limit.
+
+    Args:
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed
+        fit_timeout (float, optional): seconds allowed for fits running in parallel, slower fits are dropped
+
+    Returns:
+        dict: chart name -> chart function, overriding the default numeric distribution charts
+    """
+    return {
+        'Distributions': lambda df, column_name, ax: viz._plot_distribution_overlay(df, column_name, ax, distributions=distributions, fit_timeout=fit_timeout),
+        'Best Distribution': lambda df, column_name, ax: viz._plot_distribution_overlay(df, column_name, ax, best_only=True, distributions=distributions, fit_timeout=fit_timeout),
+        'Distribution Fits': lambda df, column_name, ax: _dist_rank_wrapper(df, column_name, ax, distributions=distributions, fit_timeout=fit_timeout)
+    }
+
+
+# Charts swapped for versions drawn from precomputed aggregates in fast render mode
+_fast_column_visuals = {
+    'numeric': {
+        'Box Plot': viz._plot_distributions_fast,
+        'Histogram': viz._plot_histogram_fast,
+        'Swarm': viz._plot_strip_fast,
+        'ECDF': viz._plot_ecdf_fast
+    },
+    'numeric-condensed': {
+        'Histogram': viz._plot_histogram_fast
+    },
+    'bool': {
+        'Histogram': viz._plot_histogram_fast
+    }
+}
+
+# Charts swapped for quantile sketch backed versions in approximate mode
+_sketch_column_visuals = {
+    'numeric': {
+        'Box Plot': viz._plot_distributions_sketch,
+        'ECDF': viz._plot_ecdf_sketch
+    }
+}
+
+
+def _get_column_visuals(
+        data_type: str,
+        render_mode: str = 'default',
+        quantile_sketch_k: Optional[int] = None,
+        distribution_fit_timeout: Optional[float] = None,
+        distributions: Optional[dict] = None,
+        swarm_budget: Optional[float] = None
+    ) -> dict:
+    """Return the charts drawn for a column data type, with the overrides for the run options applied.
+
+    Args:
+        data_type (str): column data type
+        render_mode (str, optional): 'default' or 'fast'. Defaults to 'default'.
+        quantile_sketch_k (int, optional): if set, quantile based charts come from a sketch. Defaults to None.
+        distribution_fit_timeout (float, optional): if set, distributions are fit in parallel with a time limit. Defaults to None.
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed. Defaults to None.
+        swarm_budget (float, optional): if set, seconds the swarm layout may take instead of the default. Defaults to None.
+
+    Returns:
+        dict: chart name -> chart function
+    """
+    visual_dict = _auto_eda_column_visuals[data_type]
+    if render_mode == 'fast':
+        visual_dict = {**visual_dict, **_fast_column_visuals.get(data_type, {})}
+    if quantile_sketch_k is not None:
+        visual_dict = {**visual_dict, **_sketch_column_visuals.get(data_type, {})}
+    if data_type == 'numeric' and (distribution_fit_timeout is not None or distributions is not None):
+        visual_dict = {**visual_dict, **_get_distribution_fit_visuals(distributions, distribution_fit_timeout)}
+    if visual_dict.get('Swarm') is viz._plot_swarm and swarm_budget is not None:
+        visual_dict = {**visual_dict, 'Swarm': lambda df, column_name, ax: viz._plot_swarm(df, column_name, ax, swarm_budget=swarm_budget)}
+    return visual_dict
+
 
 def _auto_eda_single_column(
         df: pd.DataFrame, 
         column_name: str, 
         html_report: object, 
-        show_chart: bool
+        show_chart: bool,
+        column_types: Optional[Mapping[str, str]] = None,
+        hll_precision: Optional[int] = None,
+        quantile_sketch_k: Optional[int] = None,
+        distribution_fit_timeout: Optional[float] = None,
+        distributions: Optional[dict] = None,
+        render_mode: str = 'default',
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
     ):
     """Print summary statistics and charts given a dataframe and column name string. Ignores NAs besides missing count row.
 
@@ -127,12 +186,20 @@ def _auto_eda_single_column(
         column_name (string): column name to be summarized
         html_report (object): html report object to hold data and write to file
         show_chart (bool): whether to call plt.show, can be useful to disable in command line interactions
+        column_types (Mapping[str, str], optional): column type index, inferred for this column if not passed
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch
+        quantile_sketch_k (int, optional): if set, box plots and ECDFs are drawn from a sketch of this size
+        distribution_fit_timeout (float, optional): if set, distributions are fit in parallel and fits slower than this many seconds are dropped
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed
+        render_mode (str): 'default' for seaborn charts from rows, 'fast' for charts drawn from precomputed aggregates
+        time_budget (TimeBudget, optional): if set, charts the budget does not admit are skipped
+        run_stats (RunStats, optional): if set, records the cost of the profile and every op
     """
     # Used for separating portions of html doc
     section = 'single_variable'
 
     # Determine column data type
-    data_type = sst._op_get_column_data_type(df, column_name)
+    data_type = sst._lookup_column_data_type(df, column_name, column_types, hll_precision)
 
     # Try to find operations to do to summarize data type in question
     if data_type in _auto_eda_column_ops:
@@ -144,18 +211,35 @@ def _auto_eda_single_column(
             html_report.save_text(error_str, section=section)
         return None
 
-    # Run metric table
-    core._bind_to_console_html(section='single_variable', run_type='table', run_dict=column_operations, html_report=html_report, show_chart=show_chart, header_text=column_name, df=df, column_name=column_name)
+    try:
+        # Profile column once and run metric table off of it, quantiles of in memory rows are exact since one partition is cheaper than sketching them
+        with core._measure_op(run_stats, section, column_name, 'Column Profile'):
+            profile = sst._op_column_profile(df, column_name, data_type=data_type, hll_precision=hll_precision)
+        core._bind_to_console_html(section='single_variable', run_type='table', run_dict=column_operations, html_report=html_report, show_chart=show_chart, header_text=column_name, run_stats=run_stats, profile=profile)
 
-    # Visual layout
-    visual_dict = _auto_eda_column_visuals[data_type]
-    core._bind_to_console_html('single_variable', 'charts', visual_dict, html_report, show_chart=show_chart, df=df, column_name=column_name)
+        # Visual layout
+        swarm_budget = time_budget.swarm_seconds if time_budget is not None else None
+        visual_dict = _get_column_visuals(data_type, render_mode, quantile_sketch_k, distribution_fit_timeout, distributions, swarm_budget)
+        core._bind_to_console_html('single_variable', 'charts', visual_dict, html_report, show_chart=show_chart, time_budget=time_budget, run_stats=run_stats, df=df, column_name=column_name)
 
+        # List distribution fits dropped by the fit time limit
+        if distribution_fit_timeout is not None:
+            for dist_name in sst._get_distribution_fit_timeouts(df, column_name, distributions, distribution_fit_timeout):
+                timeout_str = f'{column_name} {dist_name} distribution fit exceeded {distribution_fit_timeout} seconds and was skipped'
+                print(timeout_str)
+                if html_report:
+                    html_report.save_text(timeout_str, section=section)
+                if run_stats is not None:
+                    run_stats.skipped_ops.append({'column': column_name, 'op': f'{dist_name} Distribution Fit', 'estimated_seconds': distribution_fit_timeout, 'reason': 'fit timeout'})
+    finally:
+        # Column scoped caches (sketches) are not reused across columns
+        sst._clear_column_cache()
 
-def _single_col_ops_error_wrap(df, col, html_report, show_chart):
+
+def _single_col_ops_error_wrap(df, col, html_report, show_chart, column_types=None, hll_precision=None, quantile_sketch_k=None, distribution_fit_timeout=None, distributions=None, render_mode='default', time_budget=None, run_stats=None):
     section = 'single_variable'
     try:
-        _auto_eda_single_column(df, col, html_report, show_chart)
+        _auto_eda_single_column(df, col, html_report, show_chart, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats)
     except:
         error_str = f'{col} was not able to be profiled due to errors'
         print(error_str)
@@ -164,12 +248,107 @@ def _single_col_ops_error_wrap(df, col, html_report, show_chart):
         plt.close('all')
 
 
+def _single_column_worker(
+        df: pd.DataFrame, 
+        column_name: str, 
+        ignore_errors: bool, 
+        column_types: Optional[Mapping[str, str]], 
+        hll_precision: Optional[int],
+        quantile_sketch_k: Optional[int],
+        distribution_fit_timeout: Optional[float],
+        distributions: Optional[dict],
+        render_mode: str,
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
+    ) -> object:
+    """Profile one column in a worker process, capturing report components in memory.
+
+    Args:
+        df (pd.DataFrame): dataframe holding (at least) the column to profile
+        column_name (string): column name to be summarized
+        ignore_errors (bool): whether to ignore errors and run what is possible or raise excpetions
+        column_types (Mapping[str, str], optional): column type index from the schema inference stage
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch
+        quantile_sketch_k (int, optional): if set, box plots and ECDFs are drawn from a sketch of this size
+        distribution_fit_timeout (float, optional): if set, distribution fits slower than this many seconds are dropped
+        distributions (dict, optional): name -> scipy distribution candidates
+        render_mode (str): 'default' or 'fast'
+        time_budget (TimeBudget, optional): copy of the run budget, skips are returned on the buffered report
+        run_stats (RunStats, optional): copy of the run stats, new records are returned on the buffered report
+
+    Returns:
+        BufferedReport: captured titles, tables and rendered charts
+    """
+    buffered_report = html_build.BufferedReport()
+    skipped_before = len(time_budget.skipped_ops) if time_budget is not None else 0
+    records_before = len(run_stats.records) if run_stats is not None else 0
+    stats_skipped_before = len(run_stats.skipped_ops) if run_stats is not None else 0
+    if ignore_errors:
+        _single_col_ops_error_wrap(df, column_name, buffered_report, False, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats)
+    else:
+        _auto_eda_single_column(df, column_name, buffered_report, False, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats)
+    if time_budget is not None:
+        buffered_report.skipped_ops = time_budget.skipped_ops[skipped_before:]
+    if run_stats is not None:
+        buffered_report.run_stats_records = run_stats.records[records_before:]
+        buffered_report.run_stats_skipped_ops = run_stats.skipped_ops[stats_skipped_before:]
+    return buffered_report
+
+
+def _single_column_worker_args(
+        df: pd.DataFrame, 
+        column_name: str, 
+        ignore_errors: bool, 
+        column_types: Optional[Mapping[str, str]], 
+        hll_precision: Optional[int],
+        quantile_sketch_k: Optional[int],
+        distribution_fit_timeout: Optional[float],
+        distributions: Optional[dict],
+        render_mode: str,
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None
+    ) -> tuple:
+    """Build picklable worker arguments that only carry the one column being profiled.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ignore_errors (bool): whether to ignore errors and run what is possible or raise excpetions
+        column_types (Mapping[str, str], optional): column type index from the schema inference stage
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch
+        quantile_sketch_k (int, optional): if set, box plots and ECDFs are drawn from a sketch of this size
+        distribution_fit_timeout (float, optional): if set, distribution fits slower than this many seconds are dropped
+        distributions (dict, optional): name -> scipy distribution candidates
+        render_mode (str): 'default' or 'fast'
+        time_budget (TimeBudget, optional): run budget, copied to the worker
+        run_stats (RunStats, optional): run stats, copied to the worker
+
+    Returns:
+        tuple: arguments for _single_column_worker
+    """
+    column_df = df[[column_name]] if column_name in df.columns else df.iloc[:, :0]
+    if column_types is not None and column_name in column_types:
+        column_types = {column_name: column_types[column_name]}
+    else:
+        column_types = None
+    return column_df, column_name, ignore_errors, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats
+
+
 def _auto_eda_columns(
         df: pd.DataFrame, 
         column_list: Optional[str] = None, 
         html_report: Optional[str] = None, 
         ignore_errors: bool = True, 
-        show_chart: bool = True):
+        show_chart: bool = True,
+        column_types: Optional[Mapping[str, str]] = None,
+        n_jobs: int = 1,
+        hll_precision: Optional[int] = None,
+        quantile_sketch_k: Optional[int] = None,
+        distribution_fit_timeout: Optional[float] = None,
+        distributions: Optional[dict] = None,
+        render_mode: str = 'default',
+        time_budget: Optional[TimeBudget] = None,
+        run_stats: Optional[RunStats] = None):
     """Print summary statistics and charts given a dataframe and list of column name strings. Ignores NAs besides missing count row.
 
     Args:
@@ -178,27 +357,44 @@ def _auto_eda_columns(
         html_report (HTMLReport class): html report object to write data to
         ignore_errors (bool): whether to ignore errors and run what is possible or raise excpetions
         show_chart (bool): whether to call plt.show, can be useful to disable in command line interactions
+        column_types (Mapping[str, str], optional): column type index from the schema inference stage
+        n_jobs (int): number of worker processes to profile columns with when writing an html report, -1 for all cpus
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch of this precision
+        quantile_sketch_k (int, optional): if set, box plots and ECDFs are drawn from a sketch of this size
+        distribution_fit_timeout (float, optional): if set, distributions are fit in parallel and fits slower than this many seconds are dropped
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed
+        render_mode (str): 'default' for seaborn charts from rows, 'fast' for charts drawn from precomputed aggregates
+        time_budget (TimeBudget, optional): if set, charts the budget does not admit are skipped
+        run_stats (RunStats, optional): if set, records the cost of every column profile and op
     """
 
     # Check if user pased in list
-    if column_list is not None: 
+    if column_list is None:
+        # Run all columns
+        column_list = list(df.columns)
+    elif isinstance(column_list, str) and column_list in df.columns:
         # Single column
-        if isinstance(column_list, str) and column_list in df.columns:
-            if ignore_errors:
-                _single_col_ops_error_wrap(df, column_list, html_report, show_chart)
-            else:
-                _auto_eda_single_column(df, column_list, html_report, show_chart)
+        column_list = [column_list]
+
+    # Fan columns out to worker processes, merging results back in column order
+    n_jobs = core._resolve_n_jobs(n_jobs)
+    if html_report and n_jobs > 1 and len(column_list) > 1:
+        # Registry snapshot travels with the arguments so workers fit the same candidates
+        if distributions is None:
+            distributions = dict(distributions_registry._distribution_registry)
+        args_iterable = (_single_column_worker_args(df, col, ignore_errors, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats) for col in column_list)
+        for buffered_report in core._parallel_map_ordered(_single_column_worker, args_iterable, n_jobs):
+            html_report.merge_buffered_report(buffered_report)
+            if time_budget is not None:
+                time_budget.skipped_ops.extend(buffered_report.skipped_ops)
+            if run_stats is not None:
+                run_stats.records.extend(buffered_report.run_stats_records)
+                run_stats.skipped_ops.extend(buffered_report.run_stats_skipped_ops)
+        return None
+
+    # Multiple defined columns
+    for col in column_list:
+        if ignore_errors:
+            _single_col_ops_error_wrap(df, col, html_report, show_chart, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats)
         else:
-            # Multiple defined columns
-            for col in column_list:
-                if ignore_errors:
-                    _single_col_ops_error_wrap(df, col, html_report, show_chart)
-                else:
-                    _auto_eda_single_column(df, col, html_report, show_chart)
-    else:
-        # Run all columns
-        for col in df.columns:
-            if ignore_errors:
-                _single_col_ops_error_wrap(df, col, html_report, show_chart)
-            else:
-                _auto_eda_single_column(df, col, html_report, show_chart)
+            _auto_eda_single_column(df, col, html_report, show_chart, column_types, hll_precision, quantile_sketch_k, distribution_fit_timeout, distributions, render_mode, time_budget, run_stats)
@@ -1,3 +1,4 @@
+from typing import Mapping, Optional
 import pandas as pd
 
 import edatk._single_variable._summary_statistics as sst
@@ -23,7 +24,8 @@ def _get_column_reduced_cardinality(
         df: pd.DataFrame, 
         column_name: str, 
         cardinality: int, 
-        desired_cardinality: int
+        desired_cardinality: int,
+        target_dtype: Optional[str] = None
     ) -> pd.Series:
     """Return a series that is the reduced cardinality version of a supplied df[column_name]
 
@@ -32,6 +34,7 @@ def _get_column_reduced_cardinality(
         column_name (str): string column name to reduce cardinality on
         cardinality (int): cardinality of the input column
         desired_cardinality (int): desired cardinality
+        target_dtype (str, optional): data type grouping of the column if already inferred. Defaults to None.
 
     Returns:
         pd.Series: reduced cardinality pandas series
@@ -39,7 +42,8 @@ def _get_column_reduced_cardinality(
     if cardinality <= desired_cardinality:
         return df[column_name]
     else:
-        target_dtype = sst._op_get_column_data_type(df, column_name)
+        if target_dtype is None:
+            target_dtype = sst._op_get_column_data_type(df, column_name)
         s = df[column_name].dropna()
         reduced_cardinality_series = None
 
@@ -62,18 +66,26 @@ def _get_column_reduced_cardinality(
         return reduced_cardinality_series
 
 
-def _add_low_cardinality_target_column(df: pd.DataFrame, target_column: str, desired_cardinality: int):
+def _add_low_cardinality_target_column(
+        df: pd.DataFrame, 
+        target_column: str, 
+        desired_cardinality: int, 
+        column_types: Optional[Mapping[str, str]] = None,
+        hll_precision: Optional[int] = None
+    ):
     """Add an additional low cardinality derived column in place.
 
     Args:
         df (pd.DataFrame): input dataframe
         target_column (str): string name of the target column
         desired_cardinality (int): desired cardinality (numeric will always be 3 though).
+        column_types (Mapping[str, str], optional): column type index from the schema inference stage. Defaults to None.
+        hll_precision (int, optional): if set, the target distinct count is estimated with a HyperLogLog sketch. Defaults to None.
     """
     
     # Get information about the target column
     inferred_col_name = f'{target_column}_lc'
-    target_distinct_count = sst._op_distinct_count(df, target_column)
+    target_distinct_count = sst._op_distinct_count(df, target_column, hll_precision)
     
     # Cardinality > desired, reduce cardinality
     if target_distinct_count > desired_cardinality:
@@ -81,7 +93,8 @@ def _add_low_cardinality_target_column(df: pd.DataFrame, target_column: str, des
             df=df, 
             column_name=target_column, 
             cardinality=target_distinct_count, 
-            desired_cardinality=desired_cardinality
+            desired_cardinality=desired_cardinality,
+            target_dtype=sst._lookup_column_data_type(df, target_column, column_types)
         )
     else:
         # If cardinality <= desired, leave as is
@@ -0,0 +1,181 @@
+from typing import Optional
+import multiprocessing
+import signal
+import threading
+import time
+import numpy as np
+import scipy.stats as stats
+
+
+# Candidate distributions compared against numeric columns, name -> scipy continuous distribution
+_distribution_registry = {
+    'norm': stats.norm,
+    'expon': stats.expon,
+    'uniform': stats.uniform,
+    'lognorm': stats.lognorm,
+    't': stats.t
+}
+
+# Fit pool shared by every column of a run in the parent process, closed by _close_fit_pool
+_fit_pool = None
+_fit_pool_size = 0
+
+
+def register_distribution(name: str, distribution: Optional[object] = None):
+    """Add (or replace) a candidate distribution used in distribution fit charts.
+
+    Args:
+        name (str): name shown in charts, also the scipy.stats attribute looked up if distribution is not passed.
+        distribution (scipy.stats.rv_continuous, optional): distribution with fit and pdf methods. Defaults to None.
+    """
+    if distribution is None:
+        assert hasattr(stats, name), f"{name} is not a scipy.stats distribution"
+        distribution = getattr(stats, name)
+    assert hasattr(distribution, 'fit') and hasattr(distribution, 'pdf'), "distribution must have fit and pdf methods"
+    _distribution_registry[name] = distribution
+
+
+def unregister_distribution(name: str):
+    """Remove a candidate distribution used in distribution fit charts.
+
+    Args:
+        name (str): registered distribution name.
+    """
+    assert name in _distribution_registry, f"{name} is not a registered distribution"
+    del _distribution_registry[name]
+
+
+def list_distributions() -> list[str]:
+    """Return names of the candidate distributions used in distribution fit charts.
+
+    Returns:
+        list[str]: registered distribution names, in fit order.
+    """
+    return list(_distribution_registry)
+
+
+def _fit_distribution(distribution: object, values: np.ndarray) -> tuple:
+    """Fit one distribution, module level so it can run in a worker process.
+
+    Args:
+        distribution (scipy.stats.rv_continuous): distribution to fit.
+        values (np.ndarray): values without NAs.
+
+    Returns:
+        tuple: fitted distribution parameters.
+    """
+    return distribution.fit(values)
+
+
+class _FitTimeout(BaseException):
+    """Raised inside a fit that ran past its time limit, a BaseException so scipy's own exception handling does not swallow it.
+    """
+
+
+def _raise_fit_timeout(signum: int, frame: object):
+    raise _FitTimeout()
+
+
+def _can_fit_with_alarm() -> bool:
+    """Check whether fits should be timed out in this process with an alarm instead of a pool.
+
+    Column worker processes time their fits in process, so n_jobs workers do not each start a pool of their own.
+
+    Returns:
+        bool: True in a child process's main thread on platforms with interval timers
+    """
+    return multiprocessing.parent_process() is not None and hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+def _fit_distribution_with_alarm(distribution: object, values: np.ndarray, fit_timeout: float) -> tuple:
+    """Fit one distribution in this process, interrupting it after fit_timeout seconds.
+
+    Args:
+        distribution (scipy.stats.rv_continuous): distribution to fit.
+        values (np.ndarray): values without NAs.
+        fit_timeout (float): seconds allowed for the fit.
+
+    Returns:
+        tuple: fitted distribution parameters.
+
+    Raises:
+        _FitTimeout: the fit ran past fit_timeout seconds.
+    """
+    previous_handler = signal.signal(signal.SIGALRM, _raise_fit_timeout)
+    signal.setitimer(signal.ITIMER_REAL, fit_timeout)
+    try:
+        return distribution.fit(values)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _get_fit_pool(processes: int) -> object:
+    """Return the run's fit pool, started on first use and restarted only when more processes are needed.
+
+    Args:
+        processes (int): fits that will run at once.
+
+    Returns:
+        multiprocessing.pool.Pool: shared fit pool
+    """
+    global _fit_pool, _fit_pool_size
+    if _fit_pool is None or _fit_pool_size < processes:
+        _close_fit_pool()
+        _fit_pool = multiprocessing.Pool(processes=processes)
+        _fit_pool_size = processes
+    return _fit_pool
+
+
+def _close_fit_pool():
+    """Terminate the run's fit pool, including any fits still running in it.
+    """
+    global _fit_pool, _fit_pool_size
+    if _fit_pool is not None:
+        _fit_pool.terminate()
+        _fit_pool.join()
+    _fit_pool = None
+    _fit_pool_size = 0
+
+
+def _fit_distributions(values: np.ndarray, distributions: Optional[dict] = None, fit_timeout: Optional[float] = None) -> tuple[dict, list[str]]:
+    """Fit candidate distributions, with each fit limited to fit_timeout seconds when a time limit is set.
+
+    In the parent process the fits run concurrently in one pool shared by the whole run. In column worker processes they run serially, each interrupted by an alarm, so parallel runs never start a pool per column.
+
+    Args:
+        values (np.ndarray): values without NAs.
+        distributions (dict, optional): name -> distribution, the registry if not passed. Defaults to None.
+        fit_timeout (float, optional): wall clock seconds allowed for the fits, fits run serially without a limit if not passed. Defaults to None.
+
+    Returns:
+        dict: name -> fitted parameters, in distribution order.
+        list[str]: names of fits that ran past fit_timeout and were left out
+    """
+    if distributions is None:
+        distributions = _distribution_registry
+    if fit_timeout is None or len(distributions) == 0:
+        return {name: _fit_distribution(dist, values) for name, dist in distributions.items()}, []
+
+    fitted = {}
+    timed_out = []
+    if _can_fit_with_alarm():
+        for name, dist in distributions.items():
+            try:
+                fitted[name] = _fit_distribution_with_alarm(dist, values, fit_timeout)
+            except _FitTimeout:
+                timed_out.append(name)
+        return fitted, timed_out
+
+    # One process per fit so every fit gets the full time limit, the pool is restarted after a timeout so stuck fits do not linger
+    pool = _get_fit_pool(len(distributions))
+    async_results = {name: pool.apply_async(_fit_distribution, (dist, values)) for name, dist in distributions.items()}
+    deadline = time.monotonic() + fit_timeout
+    for name, async_result in async_results.items():
+        try:
+            fitted[name] = async_result.get(timeout=max(0.0, deadline - time.monotonic()))
+        except multiprocessing.TimeoutError:
+            timed_out.append(name)
+    if len(timed_out) > 0:
+        _close_fit_pool()
+    return fitted, timed_out
@@ -1,8 +1,221 @@
+import weakref
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_string_dtype, is_numeric_dtype, is_bool_dtype, is_categorical_dtype
 import scipy.stats as stats
 
+import edatk._sketches as sketches
+import edatk._kde as kde
+import edatk._single_variable._distributions as distributions_registry
+
+
+# Quantiles gathered by the column profile, min and max ride along in the same partition
+_PROFILE_QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+# Quantile sketches, distribution fits and drawing aggregates of the column being profiled, shared until cleared
+_quantile_sketch_cache = {}
+_distribution_fit_cache = {}
+_numeric_aggregate_cache = {}
+
+# Distinct counts (exact or estimated) shared by type inference and column profiles for a whole run, until _clear_run_cache
+_distinct_count_cache = {}
+
+# Values added to a quantile sketch at once when sketching an in memory column
+_QUANTILE_SKETCH_CHUNK_SIZE = 1 << 14
+
+# Max number of values distributions are fit on
+_MAX_DISTRIBUTION_FIT_SAMPLE = 10000
+
+# Max points kept for ECDF grids and box plot fliers drawn from aggregates
+_MAX_AGGREGATE_POINTS = 1000
+
+# Max histogram bins, numpy's auto rule asks for millions on heavy tailed columns
+_MAX_HISTOGRAM_BINS = 1000
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    """Summary statistics of a single column, computed once by _op_column_profile.
+
+    Numeric fields are None for non numeric data type groupings.
+    """
+    column_name: str
+    data_type: str
+    dtype: str
+    row_count: int
+    missing_count: int
+    distinct_count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    skew: Optional[float] = None
+    kurtosis: Optional[float] = None
+    quantiles: Optional[dict[float, float]] = None
+
+    @property
+    def missing_ratio(self) -> float:
+        """Missing rows as a ratio of total rows."""
+        return float(self.missing_count) / float(self.row_count) if self.row_count else float('nan')
+
+    @property
+    def cv_ratio(self) -> float:
+        """Coefficient of variation (standard deviation over mean)."""
+        return self.std / self.mean if self.mean else float('nan')
+
+    @property
+    def median(self) -> Optional[float]:
+        """Median value, None if no quantiles were computed."""
+        return self.quantile(0.5)
+
+    def quantile(self, quantile_value: float) -> Optional[float]:
+        """Return a precomputed quantile.
+
+        Args:
+            quantile_value (float): quantile (0 to 1) that was computed with the profile
+
+        Returns:
+            float: quantile cuttoff point, None if not computed
+        """
+        if self.quantiles is None:
+            return None
+        return self.quantiles.get(quantile_value)
+
+
+@dataclass(frozen=True)
+class NumericAggregates:
+    """Drawing aggregates of a numeric column, computed once by _op_numeric_aggregates for fast render mode.
+
+    Sizes are bounded by bin, grid and point limits rather than the row count.
+    """
+    count: int
+    bin_edges: np.ndarray
+    bin_counts: np.ndarray
+    box_stats: Optional[dict]
+    ecdf_values: np.ndarray
+    ecdf_probabilities: np.ndarray
+    kde_grid: Optional[np.ndarray] = None
+    kde_density: Optional[np.ndarray] = None
+
+
+def _downsample_sorted(sorted_values: np.ndarray, max_points: int = _MAX_AGGREGATE_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """Return evenly spaced (by rank) values and their positions from sorted values, first and last always kept.
+
+    Args:
+        sorted_values (np.ndarray): sorted values
+        max_points (int, optional): max number of values to keep. Defaults to _MAX_AGGREGATE_POINTS.
+
+    Returns:
+        tuple: kept values and their integer positions
+    """
+    n = sorted_values.shape[0]
+    if n <= max_points:
+        positions = np.arange(n)
+    else:
+        positions = np.linspace(0, n - 1, max_points).round().astype(np.int64)
+    return sorted_values[positions], positions
+
+
+def _get_histogram_bin_edges(values: np.ndarray, max_bins: int = _MAX_HISTOGRAM_BINS) -> np.ndarray:
+    """Return numpy's auto histogram bin edges, or max_bins even bins over the data range when auto would use more.
+
+    Args:
+        values (np.ndarray): non missing float values
+        max_bins (int, optional): max number of bins. Defaults to _MAX_HISTOGRAM_BINS.
+
+    Returns:
+        np.ndarray: bin edges
+    """
+    # Auto takes the narrower of the Freedman Diaconis and Sturges widths, work out its bin count before building edges
+    n = values.shape[0]
+    low, q25, q75, high = np.percentile(values, [0, 25, 75, 100]) if n > 0 else (0.0, 0.0, 0.0, 0.0)
+    data_range = high - low
+    if data_range > 0:
+        width = data_range / (np.log2(n) + 1.0)
+        fd_width = 2.0 * (q75 - q25) * n ** (-1.0 / 3.0)
+        if fd_width > 0:
+            width = min(width, fd_width)
+        if np.ceil(data_range / width) > max_bins:
+            return np.linspace(low, high, max_bins + 1)
+    return np.histogram_bin_edges(values, bins='auto')
+
+
+def _get_box_stats(sorted_values: np.ndarray, label: Optional[str] = None) -> Optional[dict]:
+    """Return matplotlib bxp statistics with whiskers at the most extreme values within 1.5 IQR, fliers downsampled.
+
+    Args:
+        sorted_values (np.ndarray): sorted values without NAs
+        label (str, optional): box label. Defaults to None.
+
+    Returns:
+        dict: bxp statistics, None if there are no values
+    """
+    if sorted_values.shape[0] == 0:
+        return None
+    q1, med, q3 = np.quantile(sorted_values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    low = np.searchsorted(sorted_values, q1 - 1.5 * iqr, side='left')
+    high = np.searchsorted(sorted_values, q3 + 1.5 * iqr, side='right') - 1
+    fliers = np.concatenate([sorted_values[:low], sorted_values[high + 1:]])
+    box_stats = {
+        'med': med,
+        'q1': q1,
+        'q3': q3,
+        'whislo': sorted_values[min(low, high)],
+        'whishi': sorted_values[max(low, high)],
+        'fliers': _downsample_sorted(fliers)[0]
+    }
+    if label is not None:
+        box_stats['label'] = label
+    return box_stats
+
+
+def _op_numeric_aggregates(df: pd.DataFrame, column_name: str) -> NumericAggregates:
+    """Return drawing aggregates of a numeric column from one sort, cached until _clear_column_cache is called. Ignores NAs.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+
+    Returns:
+        NumericAggregates: histogram, box statistics, ECDF grid and KDE
+    """
+    key = (id(df), column_name)
+    if key in _numeric_aggregate_cache:
+        return _numeric_aggregate_cache[key]
+
+    values = df[column_name].to_numpy(dtype=np.float64, na_value=np.nan)
+    sorted_values = np.sort(values[~np.isnan(values)])
+    count = sorted_values.shape[0]
+
+    # Histogram with the same bin rule seaborn uses, kde on a grid within the data range as histplot draws it
+    if count > 0:
+        bin_counts, bin_edges = np.histogram(sorted_values, bins=_get_histogram_bin_edges(sorted_values))
+    else:
+        bin_counts, bin_edges = np.zeros(0, dtype=np.int64), np.zeros(0)
+    kde_grid, kde_density = kde._binned_kde(sorted_values, cut=0)
+
+    # ECDF step points at evenly spaced ranks
+    ecdf_values, positions = _downsample_sorted(sorted_values)
+    ecdf_probabilities = (positions + 1) / max(count, 1)
+
+    aggregates = NumericAggregates(
+        count=count,
+        bin_edges=bin_edges,
+        bin_counts=bin_counts,
+        box_stats=_get_box_stats(sorted_values),
+        ecdf_values=ecdf_values,
+        ecdf_probabilities=ecdf_probabilities,
+        kde_grid=kde_grid,
+        kde_density=kde_density
+    )
+    _numeric_aggregate_cache[key] = aggregates
+    return aggregates
+
+
 def _op_mean(df: pd.DataFrame, column_name: str) -> float:
     """Return the numpy mean given a dataframe and column name string. Ignores NAs.
 
@@ -16,16 +229,19 @@ def _op_mean(df: pd.DataFrame, column_name: str) -> float:
     return np.nanmean(df[column_name])
 
 
-def _op_median(df: pd.DataFrame, column_name: str) -> float:
+def _op_median(df: pd.DataFrame, column_name: str, quantile_sketch_k: Optional[int] = None) -> float:
     """Return the numpy median given a dataframe and column name string. Ignores NAs.
 
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be summarized
+        quantile_sketch_k (int, optional): if set, estimate from a quantile sketch with this k instead of an exact median. Defaults to None.
 
     Returns:
         float: median value
     """
+    if quantile_sketch_k is not None:
+        return float(_op_quantiles(df, column_name, [0.5], quantile_sketch_k)[0])
     return np.nanmedian(df[column_name])
 
 
@@ -107,33 +323,103 @@ def _op_missing_rows(df: pd.DataFrame, column_name: str) -> int:
     return int(np.sum(pd.isna(df[column_name])))
 
 
-def _op_quantile(df: pd.DataFrame, column_name: str, quantile_value: float = 0.75) -> float:
+def _op_quantile(df: pd.DataFrame, column_name: str, quantile_value: float = 0.75, quantile_sketch_k: Optional[int] = None) -> float:
     """Return the quantile (0 to 1 percentile) values given a dataframe and column name string. Ignores NAs.
 
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be summarized
+        quantile_value (float): quantile (0 to 1) to return
+        quantile_sketch_k (int, optional): if set, estimate from a quantile sketch with this k. Defaults to None.
 
     Returns:
         float: quantile cuttoff point
     """
     if is_bool_dtype(df[column_name]):
         return None
+    elif quantile_sketch_k is not None:
+        return float(_op_quantiles(df, column_name, [quantile_value], quantile_sketch_k)[0])
     else:
         return np.nanquantile(df[column_name],quantile_value)
 
 
-def _op_distinct_count(df: pd.DataFrame, column_name: str) -> int:
+def _op_quantiles(df: pd.DataFrame, column_name: str, quantile_values: list[float], quantile_sketch_k: Optional[int] = None) -> np.ndarray:
+    """Return several quantiles at once given a dataframe and column name string. Ignores NAs.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        quantile_values (list[float]): quantiles (0 to 1) to return
+        quantile_sketch_k (int, optional): if set, answer from one cached quantile sketch with this k instead of an exact partition. Defaults to None.
+
+    Returns:
+        np.ndarray: quantile cuttoff points
+    """
+    if quantile_sketch_k is not None:
+        return _op_quantile_sketch(df, column_name, quantile_sketch_k).quantiles(quantile_values)
+    return np.nanquantile(df[column_name], quantile_values)
+
+
+def _op_quantile_sketch(df: pd.DataFrame, column_name: str, quantile_sketch_k: int = 200) -> sketches.QuantileSketch:
+    """Return the quantile sketch of a column, built once and cached until _clear_column_cache is called.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        quantile_sketch_k (int, optional): sketch accuracy parameter used if the sketch is built. Defaults to 200.
+
+    Returns:
+        QuantileSketch: mergeable sketch of the non NA values
+    """
+    key = (id(df), column_name)
+    if key not in _quantile_sketch_cache:
+        # Bounded chunks, so compactions sort at most one chunk rather than the whole column
+        sketch = sketches.QuantileSketch(quantile_sketch_k)
+        values = df[column_name].to_numpy(dtype=np.float64, na_value=np.nan)
+        for start in range(0, values.shape[0], _QUANTILE_SKETCH_CHUNK_SIZE):
+            sketch.update(values[start:start + _QUANTILE_SKETCH_CHUNK_SIZE])
+        _quantile_sketch_cache[key] = sketch
+    return _quantile_sketch_cache[key]
+
+
+def _clear_column_cache():
+    """Clear per column caches once a column (or run) is done.
+    """
+    _quantile_sketch_cache.clear()
+    _distribution_fit_cache.clear()
+    _numeric_aggregate_cache.clear()
+
+
+def _clear_run_cache():
+    """Clear run scoped caches and stop the distribution fit pool once a run is done.
+    """
+    _distinct_count_cache.clear()
+    distributions_registry._close_fit_pool()
+
+
+def _op_distinct_count(df: pd.DataFrame, column_name: str, hll_precision: Optional[int] = None) -> int:
     """Return the distinct count given a dataframe and column name string. Ignores NAs.
 
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be summarized
+        hll_precision (int, optional): if set, estimate with a HyperLogLog sketch of this precision instead of an exact count. Defaults to None.
 
     Returns:
         int: number of unique values
     """
-    return df[column_name].nunique()
+    # Entries hold a weak reference so a later frame reusing the id is not served a stale count
+    key = (id(df), column_name, hll_precision)
+    if key in _distinct_count_cache and _distinct_count_cache[key][0]() is df:
+        return _distinct_count_cache[key][1]
+    if hll_precision is not None:
+        sketch = sketches.HyperLogLog(hll_precision)
+        sketch.update(df[column_name])
+        distinct_count = sketch.count
+    else:
+        distinct_count = df[column_name].nunique()
+    _distinct_count_cache[key] = (weakref.ref(df), distinct_count)
+    return distinct_count
 
 
 def _op_skew(df: pd.DataFrame, column_name: str) -> float:
@@ -162,12 +448,13 @@ def _op_kurtosis(df: pd.DataFrame, column_name: str) -> float:
     return stats.kurtosis(df[column_name])
 
 
-def _op_get_column_data_type(df: pd.DataFrame, column_name: str) -> str:
+def _op_get_column_data_type(df: pd.DataFrame, column_name: str, hll_precision: Optional[int] = None) -> str:
     """Return the data type given a dataframe and column name string.
 
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be analyzed
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch. Defaults to None.
 
     Returns:
         string: data type of the column
@@ -177,78 +464,281 @@ def _op_get_column_data_type(df: pd.DataFrame, column_name: str) -> str:
     elif is_bool_dtype(df[column_name]):
         return 'bool'
     elif is_numeric_dtype(df[column_name]):
-        if _op_distinct_count(df, column_name) <= 10:
-            if _op_distinct_count(df, column_name) == 2:
-                if _op_min(df, column_name) == 0 and _op_max(df, column_name) == 1:
-                    return 'bool'
-            return 'numeric-condensed'
-        else:
-            return 'numeric'
+        distinct_count = _op_distinct_count(df, column_name, hll_precision)
+        if distinct_count == 2:
+            return _classify_numeric_data_type(distinct_count, _op_min(df, column_name), _op_max(df, column_name))
+        return _classify_numeric_data_type(distinct_count)
     elif is_categorical_dtype(df[column_name]):
         return 'string'
     else:
         return str(df[column_name].dtype)
 
 
-def _get_theoritical_distributions(df: pd.DataFrame, column_name: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _classify_numeric_data_type(distinct_count: int, min_value: Optional[float] = None, max_value: Optional[float] = None) -> str:
+    """Return the data type grouping of a numeric column from its distinct count (and min/max for two value columns).
+
+    Args:
+        distinct_count (int): number of unique values
+        min_value (float, optional): min value, only needed when there are two distinct values. Defaults to None.
+        max_value (float, optional): max value, only needed when there are two distinct values. Defaults to None.
+
+    Returns:
+        string: 'bool', 'numeric-condensed' or 'numeric'
+    """
+    if distinct_count <= 10:
+        if distinct_count == 2 and min_value == 0 and max_value == 1:
+            return 'bool'
+        return 'numeric-condensed'
+    else:
+        return 'numeric'
+
+
+def _get_column_type_index(
+        df: pd.DataFrame, 
+        column_list: Optional[list[str]] = None, 
+        hll_precision: Optional[int] = None
+    ) -> Mapping[str, str]:
+    """Infer the data type of each column once and return a read only column name to data type index.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_list (list[str], optional): columns to infer, if none infers all columns. Defaults to None.
+        hll_precision (int, optional): if set, distinct counts are estimated with a HyperLogLog sketch. Defaults to None.
+
+    Returns:
+        Mapping[str, str]: read only mapping of column name to data type grouping
+    """
+    if column_list is None:
+        column_list = list(df.columns)
+    column_types = {col: _op_get_column_data_type(df, col, hll_precision) for col in column_list if col in df.columns}
+    return MappingProxyType(column_types)
+
+
+def _lookup_column_data_type(
+        df: pd.DataFrame, 
+        column_name: str, 
+        column_types: Optional[Mapping[str, str]] = None, 
+        hll_precision: Optional[int] = None
+    ) -> str:
+    """Return the data type from a column type index, falling back to inference for columns not in the index.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be analyzed
+        column_types (Mapping[str, str], optional): column type index from _get_column_type_index. Defaults to None.
+        hll_precision (int, optional): if set, fallback inference estimates distinct counts with a HyperLogLog sketch. Defaults to None.
+
+    Returns:
+        string: data type of the column
+    """
+    if column_types is not None and column_name in column_types:
+        return column_types[column_name]
+    return _op_get_column_data_type(df, column_name, hll_precision)
+
+
+def _get_distribution_fit_sample(values: np.ndarray, max_sample: int = _MAX_DISTRIBUTION_FIT_SAMPLE) -> np.ndarray:
+    """Return a quantile stratified sample of at most max_sample values, taken at evenly spaced ranks of the sorted values.
+
+    Args:
+        values (np.ndarray): values without NAs
+        max_sample (int, optional): max number of values to return. Defaults to _MAX_DISTRIBUTION_FIT_SAMPLE.
+
+    Returns:
+        np.ndarray: sampled values, all of them if there are max_sample or fewer
+    """
+    if values.shape[0] <= max_sample:
+        return values
+    # One full sort, partitioning on thousands of ranks is slower than sorting
+    ranks = np.linspace(0, values.shape[0] - 1, max_sample).round().astype(int)
+    return np.sort(values)[ranks]
+
+
+def _get_distribution_fit_key(df: pd.DataFrame, column_name: str, distributions: dict, fit_timeout: Optional[float]) -> tuple:
+    """Return the distribution fit cache key, fits with other candidates or time limits are cached apart.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be analyzed
+        distributions (dict): name -> scipy distribution candidates
+        fit_timeout (float, optional): seconds allowed for each fit
+
+    Returns:
+        tuple: cache key
+    """
+    return (id(df), column_name, tuple((name, id(dist)) for name, dist in distributions.items()), fit_timeout)
+
+
+def _get_distribution_fit_timeouts(
+        df: pd.DataFrame, 
+        column_name: str, 
+        distributions: Optional[dict] = None, 
+        fit_timeout: Optional[float] = None
+    ) -> list[str]:
+    """Return the distributions whose fits timed out for a column, empty if the column has not been fit.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be analyzed
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed. Defaults to None.
+        fit_timeout (float, optional): seconds allowed for each fit. Defaults to None.
+
+    Returns:
+        list[str]: names of distributions left out of the fit
+    """
+    if distributions is None:
+        distributions = dict(distributions_registry._distribution_registry)
+    cached = _distribution_fit_cache.get(_get_distribution_fit_key(df, column_name, distributions, fit_timeout))
+    return [] if cached is None else cached[2]
+
+
+def _get_theoritical_distributions(
+        df: pd.DataFrame, 
+        column_name: str, 
+        distributions: Optional[dict] = None, 
+        fit_timeout: Optional[float] = None
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Compare frequencies of column against theoritical freqencies to determine best fit distribution.
 
+    Distributions are fit on a quantile stratified sample of the column, and results are cached until _clear_column_cache is called.
+
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be analyzed
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed. Defaults to None.
+        fit_timeout (float, optional): seconds allowed for each fit, slower fits are dropped. Defaults to None.
 
     Returns:
         pd.DataFrame: dataframe containing distribtion points
         pd.DataFrame: dataframe containing distribution and rmse, sorted descending 
     """
-    # Init df concat list to hold distributions and remove NAs from column
-    df_concat_list = []
-    col_wo_nas = df[column_name].dropna()
+    if distributions is None:
+        distributions = dict(distributions_registry._distribution_registry)
+    key = _get_distribution_fit_key(df, column_name, distributions, fit_timeout)
+    if key in _distribution_fit_cache:
+        return _distribution_fit_cache[key][:2]
 
-    # Calculate the number of bins using numpy defaults
-    num_bins = len(np.histogram_bin_edges(np.array(col_wo_nas), bins='auto'))
+    # Remove NAs from column
+    col_wo_nas = df[column_name].dropna().to_numpy(dtype=np.float64)
 
-    # Get histogram from dataframe
+    # Calculate the number of bins using numpy defaults, capped for heavy tails
+    num_bins = len(_get_histogram_bin_edges(col_wo_nas))
+
+    # Get histogram from the full column
     y, x = np.histogram(col_wo_nas, bins=num_bins, density=True)
     midpoints = (x[:-1] + x[1:]) / 2.0
 
-    # Add original distribution to the df concat list
-    y_df = pd.DataFrame(y, columns=['distribution']).set_index(pd.Series(midpoints))
-    y_df['distribution_type'] = 'original data'
-    df_concat_list.append(y_df)
-
-    # Loop through distributions
-    dist_list = ['norm', 'expon', 'uniform', 'lognorm', 't']
-    for dist_name in dist_list:
-
-        # Fit Dist
-        dist = getattr(stats.distributions, dist_name)
-        dist_parms = dist.fit(col_wo_nas)
+    # Fit each distribution on the sample and evaluate its pdf at the midpoints
+    fitted, timed_out = distributions_registry._fit_distributions(_get_distribution_fit_sample(col_wo_nas), distributions, fit_timeout)
+    dist_list = list(fitted)
+    pdfs = np.empty((len(dist_list), midpoints.shape[0]))
+    for i, dist_name in enumerate(dist_list):
+        pdfs[i] = distributions[dist_name].pdf(midpoints, *fitted[dist_name])
+
+    # Long format points, original data first
+    distribution_types = ['original data'] + dist_list
+    all_distributions = pd.DataFrame({
+        column_name: np.tile(midpoints, len(distribution_types)),
+        'distribution': np.concatenate([y, pdfs.ravel()]),
+        'distribution_type': np.repeat(distribution_types, midpoints.shape[0])
+    })
+
+    # Calculate rmse of density deltas for every distribution at once
+    rmse = np.sqrt(np.mean((pdfs - y) ** 2, axis=1))
+    df_se = pd.DataFrame({'distribution_type': dist_list, 'rmse': rmse})
+    df_se = df_se.sort_values(by='rmse', ascending=True)
 
-        # Generate pdf from modpoints and distribution parms
-        pdf = dist.pdf(midpoints, *dist_parms)
+    _distribution_fit_cache[key] = (all_distributions, df_se, timed_out)
+    return all_distributions, df_se
 
-        # Add results to df concat list
-        df_dist = pd.DataFrame(pdf, columns=['distribution']).set_index(pd.Series(midpoints))
-        df_dist['distribution_type'] = dist_name
-        df_concat_list.append(df_dist)
 
+def _op_column_profile(
+        df: pd.DataFrame, 
+        column_name: str, 
+        data_type: Optional[str] = None, 
+        hll_precision: Optional[int] = None,
+        quantile_sketch_k: Optional[int] = None
+    ) -> ColumnProfile:
+    """Return the column profile given a dataframe and column name string. Ignores NAs besides missing count.
 
-    # Combine into one df
-    all_distributions = pd.concat(df_concat_list).reset_index().rename(columns={'index': column_name})
+    Numeric columns are converted to a float array once, and moments, extrema and quantiles are all derived from it.
 
-    # Split data by orig and distributions
-    orig_data_idx = all_distributions['distribution_type'] == 'original data'
-    df_orig_data = all_distributions.loc[orig_data_idx, :]
-    df_other_data = all_distributions.loc[~orig_data_idx]
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        data_type (string, optional): data type grouping if already known. Defaults to None.
+        hll_precision (int, optional): if set, the distinct count is estimated with a HyperLogLog sketch. Defaults to None.
+        quantile_sketch_k (int, optional): if set, quantiles come from a cached quantile sketch instead of a partition. Defaults to None.
 
-    # Calculate sse
-    combined_df = pd.merge(df_other_data, df_orig_data, how='left', on=column_name, suffixes=['_dist','_orig'])
-    combined_df['squared_errors'] = (combined_df['distribution_dist'] - combined_df['distribution_orig']) ** 2
-    df_se = pd.DataFrame(combined_df.groupby(['distribution_type_dist'])['squared_errors'].mean().reset_index())
-    df_se['rmse'] = np.sqrt(df_se['squared_errors']) 
-    df_se.drop(['squared_errors'], axis=1, inplace=True)
-    df_se = df_se.rename(columns={'distribution_type_dist': 'distribution_type'})
-    df_se = df_se.sort_values(by='rmse', ascending=True)
+    Returns:
+        ColumnProfile: profile record with all summary statistics
+    """
+    s = df[column_name]
+    if data_type is None:
+        data_type = _op_get_column_data_type(df, column_name, hll_precision)
+    row_count = int(s.shape[0])
+    distinct_count = int(_op_distinct_count(df, column_name, hll_precision))
+
+    # Non numeric groupings only need counts
+    if 'numeric' not in data_type:
+        return ColumnProfile(
+            column_name=column_name,
+            data_type=data_type,
+            dtype=str(s.dtype),
+            row_count=row_count,
+            missing_count=int(np.sum(pd.isna(s))),
+            distinct_count=distinct_count
+        )
+
+    # Single float conversion, NAs become nan and are dropped
+    values = s.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    missing_count = row_count - int(values.shape[0])
+    if values.shape[0] == 0:
+        nan = float('nan')
+        return ColumnProfile(
+            column_name=column_name,
+            data_type=data_type,
+            dtype=str(s.dtype),
+            row_count=row_count,
+            missing_count=missing_count,
+            distinct_count=distinct_count,
+            mean=nan, std=nan, min=nan, max=nan, skew=nan, kurtosis=nan,
+            quantiles={q: nan for q in _PROFILE_QUANTILES}
+        )
+
+    # Central moments from one set of deltas
+    mean = float(values.mean())
+    delta = values - mean
+    delta_sq = delta * delta
+    m2 = float(delta_sq.mean())
+    m3 = float((delta_sq * delta).mean())
+    m4 = float((delta_sq * delta_sq).mean())
+    if m2 > 0.0:
+        skew = m3 / m2 ** 1.5
+        kurtosis = m4 / m2 ** 2 - 3.0
+    else:
+        skew = float('nan')
+        kurtosis = float('nan')
 
-    return all_distributions, df_se
\ No newline at end of file
+    # All quantiles (including min/max) from one partition, or one sketch
+    if quantile_sketch_k is not None:
+        quantile_values = _op_quantile_sketch(df, column_name, quantile_sketch_k).quantiles(_PROFILE_QUANTILES)
+    else:
+        quantile_values = np.quantile(values, _PROFILE_QUANTILES)
+    quantiles = {q: float(v) for q, v in zip(_PROFILE_QUANTILES, quantile_values)}
+
+    return ColumnProfile(
+        column_name=column_name,
+        data_type=data_type,
+        dtype=str(s.dtype),
+        row_count=row_count,
+        missing_count=missing_count,
+        distinct_count=distinct_count,
+        mean=mean,
+        std=float(np.sqrt(m2)),
+        min=quantiles[0.0],
+        max=quantiles[1.0],
+        skew=float(skew),
+        kurtosis=float(kurtosis),
+        quantiles=quantiles
+    )
\ No newline at end of file
@@ -6,9 +6,14 @@ from pandas.api.types import is_bool_dtype
 import matplotlib.ticker as mtick
 import math
 
-from edatk._core import _rotate_x_axis_labels, _integer_y_axis_format
+from edatk._kde import _binned_kde
+from edatk._core import _rotate_x_axis_labels, _integer_y_axis_format, _get_swarm_sample_size, _MIN_SWARM_POINTS, _SWARM_TIME_BUDGET
 from edatk._single_variable._summary_statistics import _op_missing_rows as na_rows
-from edatk._single_variable._summary_statistics import _get_theoritical_distributions
+from edatk._single_variable._summary_statistics import _get_theoritical_distributions, _op_quantile_sketch, _op_numeric_aggregates, _get_histogram_bin_edges
+
+
+# Max points drawn for an ECDF step line from a quantile sketch
+_MAX_ECDF_POINTS = 1000
 
 
 def _split_top_others(s: pd.Series, topn: int = 10, na_row_count: Optional[int] = None) -> pd.Series:
@@ -26,13 +31,31 @@ def _split_top_others(s: pd.Series, topn: int = 10, na_row_count: Optional[int]
         return s.value_counts()
 
     # Count all values (presort) to be split
-    vcounts = s.value_counts()
+    return _split_top_other_counts(s.value_counts(), topn=topn, na_row_count=na_row_count)
+
+
+def _split_top_other_counts(
+        vcounts: pd.Series, 
+        topn: int = 10, 
+        na_row_count: Optional[int] = None, 
+        other_count: int = 0
+    ) -> pd.Series:
+    """Split value counts (sorted descending) by topn and others.
+
+    Args:
+        vcounts (pandas series): value counts sorted descending.
+        topn (int, optional): number to include as individual items, grouping others into one All Other. Defaults to 10.
+        na_row_count (int, optional): missing row count to add as its own item. Defaults to None.
+        other_count (int, optional): count already known to belong to Other. Defaults to 0.
 
+    Returns:
+        pandas series: pandas series with value counts
+    """
     # Grab slice for top values
     top_values = vcounts[:topn]
     
     # Build series for other values, with combined counts
-    other_values_sum = np.sum(vcounts[topn:].values)
+    other_values_sum = np.sum(vcounts[topn:].values) + other_count
     other_value_dict = {
         'Other': other_values_sum
     }
@@ -96,6 +119,57 @@ def _plot_distributions(df: pd.DataFrame, column_name: str, ax: object):
         ct.set(xlabel=None)
 
 
+def _plot_distributions_sketch(df: pd.DataFrame, column_name: str, ax: object):
+    """Return boxplot ax drawn from the column quantile sketch. Ignores NAs.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    if not is_bool_dtype(df[column_name]):
+        _plot_box_from_sketch(_op_quantile_sketch(df, column_name), f'{column_name} Box Plot', ax)
+
+
+def _plot_box_from_sketch(sketch: object, title: str, ax: object):
+    """Plot boxplot from quantile sketch statistics, whiskers at 1.5 IQR clipped to min and max.
+
+    Args:
+        sketch (QuantileSketch): quantile sketch of the values
+        title (string): title to add to plot
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    q1, med, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    box_stats = {
+        'med': med,
+        'q1': q1,
+        'q3': q3,
+        'whislo': max(sketch.min, q1 - 1.5 * iqr),
+        'whishi': min(sketch.max, q3 + 1.5 * iqr),
+        'fliers': []
+    }
+    ax.bxp([box_stats], vert=False, showfliers=False, widths=0.8, patch_artist=True, boxprops={'facecolor': 'tab:blue'}, medianprops={'color': 'grey'})
+    ax.set_yticks([])
+    ax.set_title(title)
+
+
+def _plot_distributions_fast(df: pd.DataFrame, column_name: str, ax: object):
+    """Plot boxplot from precomputed box statistics. Ignores NAs.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    if not is_bool_dtype(df[column_name]):
+        box_stats = _op_numeric_aggregates(df, column_name).box_stats
+        if box_stats is not None:
+            ax.bxp([box_stats], vert=False, widths=0.8, patch_artist=True, boxprops={'facecolor': 'tab:blue'}, medianprops={'color': 'grey'})
+            ax.set_yticks([])
+        ax.set_title(f'{column_name} Box Plot')
+
+
 def _plot_categorical_counts(df: pd.DataFrame, column_name: str, ax: object):
     """Plot bars with counts of the various values in the column.
 
@@ -110,13 +184,32 @@ def _plot_categorical_counts(df: pd.DataFrame, column_name: str, ax: object):
     filtered_col = df[column_name].dropna()
     summarized_col = _split_top_others(filtered_col, topn=5, na_row_count=na_row_count)
 
-    # Change y axis to integer format and pad
+    # Plot chart
+    _plot_count_bars(summarized_col, f'{column_name} Count Plot', ax)
+
+
+def _plot_count_bars(summarized_col: pd.Series, title: str, ax: object, percent: bool = False):
+    """Plot bars from already summarized counts, highlighting Other and Missing.
+
+    Args:
+        summarized_col (pd.Series): counts (or percents) indexed by category
+        title (string): title to add to plot
+        ax (matplotlib ax object): ax to plot chart on
+        percent (bool): whether values are percents rather than counts
+    """
+
+    # Change y axis to percent or integer format
+    if percent:
+        ax.yaxis.set_major_formatter(mtick.PercentFormatter())
+
+    # Pad y axis
     ymax = math.ceil(np.max(summarized_col) * 1.25)
     ymin = math.floor(np.min(summarized_col))
     if ymin > 0.0:
         ymin = 0
     ax.set_ylim(ymin, ymax)
-    _integer_y_axis_format(ax)
+    if not percent:
+        _integer_y_axis_format(ax)
     
     # Fix x axis labels from overlapping
     _rotate_x_axis_labels(ax)
@@ -125,10 +218,27 @@ def _plot_categorical_counts(df: pd.DataFrame, column_name: str, ax: object):
     cpalette = ['tab:blue' if x == 'Other' else 'red' if x == 'Missing' else 'grey' for x in summarized_col.index]
 
     # Plot chart
-    sns.barplot(x=summarized_col.index, y=summarized_col, ax=ax, palette=cpalette).set_title(f'{column_name} Count Plot')
+    sns.barplot(x=summarized_col.index, y=summarized_col, ax=ax, palette=cpalette).set_title(title)
 
     # Add labels
-    _annotate_bars(ax, cpalette, force_int=True)
+    _annotate_bars(ax, cpalette, force_int=not percent)
+
+
+def _plot_strip_fast(df: pd.DataFrame, column_name: str, ax: object):
+    """Plot jittered strip of the precomputed evenly ranked values, standing in for the swarmplot.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    aggregates = _op_numeric_aggregates(df, column_name)
+    values = aggregates.ecdf_values
+    jitter = np.random.default_rng(42).uniform(-0.2, 0.2, values.shape[0])
+    ax.scatter(jitter, values, s=8, alpha=0.6)
+    ax.set_xlim(-1, 1)
+    ax.set_xticks([])
+    ax.set_title(f'{column_name} Strip Plot {values.shape[0]} ranked points of {aggregates.count}')
 
 
 def _plot_simple_bar(s: pd.Series, title: str, ax: object):
@@ -181,27 +291,8 @@ def _plot_categorical_percent_counts(df: pd.DataFrame, column_name: str, ax: obj
     summarized_col = _get_percentage_from_counts(_split_top_others(filtered_col, topn=5, na_row_count=na_row_count))
     summarized_col *= 100.0
 
-    # Change y axis to percent format
-    ax.yaxis.set_major_formatter(mtick.PercentFormatter())
-
-    # Pad y axis
-    ymax = math.ceil(np.max(summarized_col) * 1.25)
-    ymin = math.floor(np.min(summarized_col))
-    if ymin > 0.0:
-        ymin = 0
-    ax.set_ylim(ymin, ymax)
-    
-    # Fix x axis labels from overlapping
-    _rotate_x_axis_labels(ax)
-    
-    # Calc color palette
-    cpalette = ['tab:blue' if x == 'Other' else 'red' if x == 'Missing' else 'grey' for x in summarized_col.index]
-
     # Plot chart
-    sns.barplot(x=summarized_col.index, y=summarized_col, ax=ax, palette=cpalette).set_title(f'{column_name} % Count Plot')
-
-    # Add labels
-    _annotate_bars(ax, cpalette)
+    _plot_count_bars(summarized_col, f'{column_name} % Count Plot', ax, percent=True)
 
 
 def _plot_histogram(df: pd.DataFrame, column_name: str, ax: object):
@@ -213,14 +304,44 @@ def _plot_histogram(df: pd.DataFrame, column_name: str, ax: object):
         ax (matplotlib ax object): ax to plot chart on
     """
 
-    # Plot chart and clean up formatting
-    ct = sns.histplot(data=df[column_name].dropna(), kde=True, ax=ax)
+    # Plot chart with the binned kde scaled to counts and clean up formatting
+    filtered_col = df[column_name].dropna()
+    bin_edges = _get_histogram_bin_edges(filtered_col.to_numpy(dtype=np.float64)) if len(filtered_col) > 0 else 'auto'
+    ct = sns.histplot(data=filtered_col, bins=bin_edges, ax=ax)
+    grid, density = _binned_kde(filtered_col.to_numpy(dtype=np.float64), cut=0)
+    if grid is not None:
+        ax.plot(grid, density * len(filtered_col) * np.mean(np.diff(bin_edges)), color=ax.patches[0].get_facecolor()[:3])
     ct.set_title(f'{column_name} Histogram')
     ct.set(xlabel=None)
     ct.set(ylabel=None)
 
 
-def _plot_distribution_overlay(df: pd.DataFrame, column_name: str, ax: object, best_only: bool = False):
+def _plot_histogram_fast(df: pd.DataFrame, column_name: str, ax: object):
+    """Plot histogram from precomputed bin counts, with the kde scaled to counts.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    aggregates = _op_numeric_aggregates(df, column_name)
+    if aggregates.count > 0:
+        # One step patch for all bins, a patch per bar gets slow with thousands of bins
+        widths = np.diff(aggregates.bin_edges)
+        bars = ax.stairs(aggregates.bin_counts, aggregates.bin_edges, fill=True, alpha=0.75)
+        if aggregates.kde_grid is not None:
+            ax.plot(aggregates.kde_grid, aggregates.kde_density * aggregates.count * widths.mean(), color=bars.get_facecolor()[:3])
+    ax.set_title(f'{column_name} Histogram')
+
+
+def _plot_distribution_overlay(
+        df: pd.DataFrame, 
+        column_name: str, 
+        ax: object, 
+        best_only: bool = False, 
+        distributions: Optional[dict] = None, 
+        fit_timeout: Optional[float] = None
+    ):
     """Plot distribution overlay.
 
     Args:
@@ -228,13 +349,15 @@ def _plot_distribution_overlay(df: pd.DataFrame, column_name: str, ax: object, b
         column_name (string): column name to be summarized
         ax (matplotlib ax object): ax to plot chart on
         best_only (bool): whether to plot the best fit only or all distributions
+        distributions (dict, optional): name -> scipy distribution candidates, the registry if not passed
+        fit_timeout (float, optional): seconds allowed for fits running in parallel, slower fits are dropped
     """
 
     # Calculate various lines for distribution
-    all_distributions, rankings = _get_theoritical_distributions(df, column_name)
+    all_distributions, rankings = _get_theoritical_distributions(df, column_name, distributions, fit_timeout)
 
     # filter to just one if needed
-    if best_only:
+    if best_only and rankings.shape[0] > 0:
         best_text = rankings['distribution_type'].values[0]
         best_idx = all_distributions['distribution_type'] == best_text
         default_idx = all_distributions['distribution_type'] == 'original data'
@@ -264,27 +387,79 @@ def _plot_ecdf(df: pd.DataFrame, column_name: str, ax: object):
     ct.set(ylabel=None)
 
 
-def _plot_swarm(df: pd.DataFrame, column_name: str, ax: object):
-    """Plot swarmplot.
+def _plot_ecdf_fast(df: pd.DataFrame, column_name: str, ax: object):
+    """Plot ecdf from a precomputed grid of evenly ranked values.
 
     Args:
         df (pd.DataFrame): input dataframe
         column_name (string): column name to be summarized
         ax (matplotlib ax object): ax to plot chart on
     """
+    aggregates = _op_numeric_aggregates(df, column_name)
+    if aggregates.count > 0:
+        values, probabilities = aggregates.ecdf_values, aggregates.ecdf_probabilities
+        ax.step(np.concatenate([[values[0]], values]), np.concatenate([[0.0], probabilities]), where='post')
+        ax.set_ylim(0, 1.05)
+    ax.set_title(f'{column_name} ECDF')
+
+
+def _plot_ecdf_sketch(df: pd.DataFrame, column_name: str, ax: object):
+    """Plot ecdf from the column quantile sketch.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    _plot_ecdf_from_sketch(_op_quantile_sketch(df, column_name), f'{column_name} ECDF', ax)
+
+
+def _plot_ecdf_from_sketch(sketch: object, title: str, ax: object):
+    """Plot ecdf from quantile sketch items, downsampled to a fixed number of steps.
+
+    Args:
+        sketch (QuantileSketch): quantile sketch of the values
+        title (string): title to add to plot
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    items, cdf = sketch.weighted_items()
+    if items.shape[0] > _MAX_ECDF_POINTS:
+        idx = np.linspace(0, items.shape[0] - 1, _MAX_ECDF_POINTS).astype(int)
+        items, cdf = items[idx], cdf[idx]
+    ax.step(np.concatenate([[items[0]], items]), np.concatenate([[0.0], cdf]), where='post')
+    ax.set_ylim(0, 1.05)
+    ax.set_title(title)
+
+
+def _plot_swarm(df: pd.DataFrame, column_name: str, ax: object, swarm_budget: float = _SWARM_TIME_BUDGET):
+    """Plot swarmplot of a sample sized to the swarm time budget, or a stripplot if even a small swarm would exceed it.
+
+    Args:
+        df (pd.DataFrame): input dataframe
+        column_name (string): column name to be summarized
+        ax (matplotlib ax object): ax to plot chart on
+        swarm_budget (float, optional): seconds allowed for the swarm layout. Defaults to _SWARM_TIME_BUDGET.
+    """
     # Sampling
     s = df[column_name].dropna()
     max_sample = 1000
-    if len(s) <= max_sample:
-        max_sample = len(df)
+    swarm_sample = _get_swarm_sample_size([len(s)], max_sample, swarm_budget)
+    use_swarm = swarm_sample >= min(_MIN_SWARM_POINTS, len(s))
+    sample_size = swarm_sample if use_swarm else min(max_sample, len(s))
+    if sample_size >= len(s):
         sample_string = ''
-        t=s
+        t = s
     else:
-        t = s.sample(n=max_sample, random_state=42)
-        sample_string = f' {max_sample} max sample'
-
-    # Plot chart and clean up formatting
-    ct = sns.swarmplot(y=t, ax=ax)
-    ct.set_title(f'{column_name} Swarmplot{sample_string}')
+        t = s.sample(n=sample_size, random_state=42)
+        sample_string = f' {sample_size} max sample'
+
+    # Plot chart and clean up formatting, noting when the budget cut the sample
+    if use_swarm:
+        ct = sns.swarmplot(y=t, ax=ax)
+        budget_string = ' (time budget)' if sample_size < min(max_sample, len(s)) else ''
+        ct.set_title(f'{column_name} Swarmplot{sample_string}{budget_string}')
+    else:
+        ct = sns.stripplot(y=t, size=3, jitter=0.3, ax=ax)
+        ct.set_title(f'{column_name} Stripplot{sample_string} (swarm over time budget)')
     ct.set(xlabel=None)
-    ct.set(ylabel=None)
\ No newline at end of file
+    ct.set(ylabel=None)
@@ -0,0 +1,533 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+
+# Min buffered chunk hashes before they are folded into the exact distinct set
+_MIN_DISTINCT_BATCH = 1000000
+
+# Values hashed at once by HyperLogLog updates, bounds the temporary arrays
+_HLL_CHUNK_SIZE = 1 << 18
+
+
+class MomentAccumulator:
+    """Mergeable count, null count, extrema and central moments (up to 4th) of a numeric stream.
+
+    Chunks are reduced with numpy and combined with the pairwise (Chan/Pebay) update, so results match a single pass over all rows.
+    """
+    def __init__(self):
+        """Create new empty Moment Accumulator
+        """
+        self.count = 0
+        self.null_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values, nans are counted as nulls.
+
+        Args:
+            values (np.ndarray): float values of the chunk
+        """
+        values = np.asarray(values, dtype=np.float64)
+        null_mask = np.isnan(values)
+        self.null_count += int(np.sum(null_mask))
+        values = values[~null_mask]
+        if values.shape[0] == 0:
+            return
+
+        # Chunk moments, then merged into running moments
+        chunk = MomentAccumulator()
+        chunk.count = int(values.shape[0])
+        chunk.mean = float(values.mean())
+        delta = values - chunk.mean
+        delta_sq = delta * delta
+        chunk.m2 = float(delta_sq.sum())
+        chunk.m3 = float((delta_sq * delta).sum())
+        chunk.m4 = float((delta_sq * delta_sq).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk, include_nulls=False)
+
+
+    def merge(self, other: 'MomentAccumulator', include_nulls: bool = True):
+        """Merge another accumulator into this one in place.
+
+        Args:
+            other (MomentAccumulator): accumulator to merge in
+            include_nulls (bool): whether to add the other null count. Defaults to True.
+        """
+        if include_nulls:
+            self.null_count += other.null_count
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.m3, self.m4 = other.count, other.mean, other.m2, other.m3, other.m4
+            self.min, self.max = other.min, other.max
+            return
+
+        na, nb = float(self.count), float(other.count)
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3 + delta * delta_n * delta_n * na * nb * (na - nb)
+              + 3.0 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4 + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6.0 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+              + 4.0 * delta_n * (na * other.m3 - nb * self.m3))
+
+        self.count = int(n)
+        self.mean = self.mean + delta_n * nb
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (numpy default ddof=0)."""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else float('nan')
+
+
+    @property
+    def skew(self) -> float:
+        """Biased sample skew (scipy default)."""
+        if self.count == 0 or self.m2 <= 0.0:
+            return float('nan')
+        return float((self.m3 / self.count) / (self.m2 / self.count) ** 1.5)
+
+
+    @property
+    def kurtosis(self) -> float:
+        """Biased Fisher kurtosis (scipy default)."""
+        if self.count == 0 or self.m2 <= 0.0:
+            return float('nan')
+        return float((self.m4 / self.count) / (self.m2 / self.count) ** 2 - 3.0)
+
+
+class DistinctAccumulator:
+    """Mergeable exact distinct counter, holding the set of 64 bit value hashes seen so far.
+
+    Chunk hashes are buffered and folded into the sorted set once the buffer is as large as the set, so every hash is re-sorted a logarithmic number of times rather than once per chunk.
+    """
+    def __init__(self):
+        """Create new empty Distinct Accumulator
+        """
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._pending = []
+        self._pending_count = 0
+
+
+    def _add_hashes(self, hashes: np.ndarray):
+        """Buffer unique hashes, folding the buffer into the set once it is as large as the set.
+
+        Args:
+            hashes (np.ndarray): unique uint64 hashes
+        """
+        self._pending.append(hashes)
+        self._pending_count += hashes.shape[0]
+        if self._pending_count >= max(self._hashes.shape[0], _MIN_DISTINCT_BATCH):
+            self._flush()
+
+
+    def _flush(self):
+        """Fold buffered hashes into the sorted set of distinct hashes.
+        """
+        if self._pending:
+            self._hashes = np.unique(np.concatenate([self._hashes] + self._pending))
+            self._pending = []
+            self._pending_count = 0
+
+
+    def update(self, s: pd.Series):
+        """Add a chunk of values, NAs are ignored.
+
+        Args:
+            s (pd.Series): chunk values
+        """
+        values = s.dropna().to_numpy()
+        if values.shape[0] == 0:
+            return
+        self._add_hashes(np.unique(pd.util.hash_array(values)))
+
+
+    def merge(self, other: 'DistinctAccumulator'):
+        """Merge another accumulator into this one in place.
+
+        Args:
+            other (DistinctAccumulator): accumulator to merge in
+        """
+        other._flush()
+        self._add_hashes(other._hashes)
+
+
+    @property
+    def count(self) -> int:
+        """Number of distinct values seen."""
+        self._flush()
+        return int(self._hashes.shape[0])
+
+
+class HyperLogLog:
+    """Mergeable approximate distinct counter with relative standard error of about 1.04 / sqrt(2**precision).
+    """
+    def __init__(self, precision: int = 14):
+        """Create new empty Hyper Log Log sketch
+
+        Args:
+            precision (int, optional): number of index bits (4 to 18), memory is 2**precision bytes. Defaults to 14.
+        """
+        assert 4 <= precision <= 18, "precision must be between 4 and 18"
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+
+    def update(self, s: pd.Series):
+        """Add a chunk of values, NAs are ignored.
+
+        Args:
+            s (pd.Series): chunk values
+        """
+        values = s.dropna().to_numpy()
+        value_bits = 64 - self.precision
+        for start in range(0, values.shape[0], _HLL_CHUNK_SIZE):
+            # Hash values directly, categorizing first costs a factorize of the whole chunk
+            hashes = pd.util.hash_array(values[start:start + _HLL_CHUNK_SIZE], categorize=False)
+
+            # Top bits pick the register, rank is the position of the first set bit in the rest
+            register_idx = (hashes >> np.uint64(value_bits)).astype(np.int64)
+            rank = value_bits - _bit_length(hashes & np.uint64((1 << value_bits) - 1)) + 1
+
+            # Only hashes ranked above their register can raise it, once registers fill up few are left
+            higher = rank > self.registers[register_idx]
+            if not np.any(higher):
+                continue
+
+            # Max rank per register from one sort of (register, rank) keys, ranks fit in 6 bits
+            keys = np.sort((register_idx[higher] << 6) | rank[higher])
+            last = np.append((keys[1:] >> 6) != (keys[:-1] >> 6), True)
+            self.registers[keys[last] >> 6] = (keys[last] & 63).astype(np.uint8)
+
+
+    def merge(self, other: 'HyperLogLog'):
+        """Merge another sketch with the same precision into this one in place.
+
+        Args:
+            other (HyperLogLog): sketch to merge in
+        """
+        assert self.precision == other.precision, "Sketches must share precision to merge"
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+
+    @property
+    def count(self) -> int:
+        """Estimated number of distinct values seen."""
+        m = float(self.registers.shape[0])
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # Linear counting is more accurate for small cardinalities
+        empty_registers = int(np.sum(self.registers == 0))
+        if estimate <= 2.5 * m and empty_registers > 0:
+            estimate = m * np.log(m / empty_registers)
+        return int(round(estimate))
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Return the exact bit length of each unsigned 64 bit integer (0 for 0).
+
+    Args:
+        x (np.ndarray): uint64 values
+
+    Returns:
+        np.ndarray: bit lengths as int64
+    """
+    # Float exponents are exact bit lengths below 2**53
+    if x.shape[0] == 0 or x.max() < np.uint64(1 << 53):
+        return np.frexp(x.astype(np.float64))[1].astype(np.int64)
+    x = x.copy()
+    bit_length = np.zeros(x.shape[0], dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        over = x >= np.uint64(1 << shift)
+        x[over] >>= np.uint64(shift)
+        bit_length += over * shift
+    return bit_length + (x > 0)
+
+
+class QuantileSketch:
+    """Mergeable KLL quantile sketch with rank error that shrinks with k.
+
+    Level h holds items with weight 2**h. When a level overflows it is sorted and every other item (random offset) is promoted.
+    Exact min and max are tracked alongside, so the 0 and 1 quantiles are exact.
+    """
+    def __init__(self, k: int = 200, seed: int = 42):
+        """Create new empty Quantile Sketch
+
+        Args:
+            k (int, optional): capacity of the top level, larger is more accurate. Defaults to 200.
+            seed (int, optional): seed for the compaction offsets. Defaults to 42.
+        """
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            if self.levels[level].shape[0] > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(self.levels[level])
+
+                # Odd item stays behind so total weight is preserved
+                if items.shape[0] % 2:
+                    keep, items = items[-1:], items[:-1]
+                else:
+                    keep = np.empty(0, dtype=np.float64)
+                offset = int(self._rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+                self.levels[level] = keep
+            level += 1
+
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values, nans are ignored.
+
+        Args:
+            values (np.ndarray): float values of the chunk
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.shape[0] == 0:
+            return
+        self.count += int(values.shape[0])
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+
+    def merge(self, other: 'QuantileSketch'):
+        """Merge another sketch into this one in place.
+
+        Args:
+            other (QuantileSketch): sketch to merge in
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+
+    def weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return retained items sorted ascending, with cumulative weights normalized to 1.
+
+        Returns:
+            tuple: sorted items and their cumulative weight (an empirical cdf)
+        """
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level_items.shape[0], 2.0 ** level) for level, level_items in enumerate(self.levels)])
+        order = np.argsort(items, kind='mergesort')
+        cumulative_weights = np.cumsum(weights[order])
+        return items[order], cumulative_weights / cumulative_weights[-1]
+
+
+    def quantiles(self, quantile_values: list[float]) -> np.ndarray:
+        """Return estimated quantiles.
+
+        Args:
+            quantile_values (list[float]): quantiles (0 to 1) to estimate
+
+        Returns:
+            np.ndarray: estimated quantile cuttoff points, nan if the sketch is empty
+        """
+        quantile_values = np.asarray(quantile_values, dtype=np.float64)
+        if self.count == 0:
+            return np.full(quantile_values.shape, np.nan)
+        items, cdf = self.weighted_items()
+        idx = np.searchsorted(cdf, quantile_values, side='left')
+        estimates = items[np.clip(idx, 0, items.shape[0] - 1)]
+        estimates[quantile_values <= 0.0] = self.min
+        estimates[quantile_values >= 1.0] = self.max
+        return estimates
+
+
+    def cdf(self, x: np.ndarray) -> np.ndarray:
+        """Return the estimated fraction of values less than or equal to x.
+
+        Args:
+            x (np.ndarray): points to evaluate
+
+        Returns:
+            np.ndarray: estimated cdf at x
+        """
+        items, cdf = self.weighted_items()
+        idx = np.searchsorted(items, np.asarray(x, dtype=np.float64), side='right')
+        return np.concatenate([[0.0], cdf])[idx]
+
+
+class HistogramAccumulator:
+    """Mergeable histogram over fixed bin edges.
+    """
+    def __init__(self, bin_edges: np.ndarray):
+        """Create new empty Histogram Accumulator
+
+        Args:
+            bin_edges (np.ndarray): fixed, increasing bin edges
+        """
+        self.bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        self.counts = np.zeros(self.bin_edges.shape[0] - 1, dtype=np.int64)
+
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values, nans are ignored.
+
+        Args:
+            values (np.ndarray): float values of the chunk
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        counts, _ = np.histogram(values, bins=self.bin_edges)
+        self.counts += counts
+
+
+    def merge(self, other: 'HistogramAccumulator'):
+        """Merge another histogram with the same bin edges into this one in place.
+
+        Args:
+            other (HistogramAccumulator): histogram to merge in
+        """
+        assert np.array_equal(self.bin_edges, other.bin_edges), "Histograms must share bin edges to merge"
+        self.counts += other.counts
+
+
+class TopCountsAccumulator:
+    """Mergeable value counts that keep at most max_tracked values, folding the rest into other_count.
+    """
+    def __init__(self, max_tracked: int = 1000):
+        """Create new empty Top Counts Accumulator
+
+        Args:
+            max_tracked (int, optional): maximum number of individual values to keep counts for. Defaults to 1000.
+        """
+        self.max_tracked = max_tracked
+        self.counts = pd.Series(dtype=np.int64)
+        self.other_count = 0
+
+
+    def _prune(self):
+        self.counts = self.counts.sort_values(ascending=False)
+        if self.counts.shape[0] > self.max_tracked:
+            self.other_count += int(self.counts[self.max_tracked:].sum())
+            self.counts = self.counts[:self.max_tracked]
+
+
+    def update(self, s: pd.Series):
+        """Add a chunk of values, NAs are ignored.
+
+        Args:
+            s (pd.Series): chunk values
+        """
+        self.counts = self.counts.add(s.value_counts(dropna=True), fill_value=0).astype(np.int64)
+        self._prune()
+
+
+    def merge(self, other: 'TopCountsAccumulator'):
+        """Merge another accumulator into this one in place.
+
+        Args:
+            other (TopCountsAccumulator): accumulator to merge in
+        """
+        self.counts = self.counts.add(other.counts, fill_value=0).astype(np.int64)
+        self.other_count += other.other_count
+        self._prune()
+
+
+class CorrelationAccumulator:
+    """Mergeable pairwise complete Pearson correlation over a fixed set of numeric columns.
+
+    Keeps per pair counts and shifted sums (x, y, x^2, y^2, xy) over rows where both columns are present.
+    """
+    def __init__(self, column_names: list[str]):
+        """Create new empty Correlation Accumulator
+
+        Args:
+            column_names (list[str]): numeric columns to correlate
+        """
+        self.column_names = list(column_names)
+        p = len(self.column_names)
+        self._shift: Optional[np.ndarray] = None
+        self._n = np.zeros((p, p))
+        self._sx = np.zeros((p, p))
+        self._sxx = np.zeros((p, p))
+        self._sxy = np.zeros((p, p))
+
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of rows.
+
+        Args:
+            values (np.ndarray): float array (rows x columns) in column_names order, nans are missing
+        """
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+
+        # Shift by first chunk means for numerical stability of the raw sums
+        if self._shift is None:
+            self._shift = np.nansum(values, axis=0) / np.maximum(present.sum(axis=0), 1)
+        x = np.where(present, values - self._shift, 0.0)
+        mask = present.astype(np.float64)
+
+        # Entry [i, j] sums column i over rows where column j is also present
+        self._n += mask.T @ mask
+        self._sx += x.T @ mask
+        self._sxx += (x * x).T @ mask
+        self._sxy += x.T @ x
+
+
+    def drop_columns(self, column_names: list[str]):
+        """Stop tracking columns, pairwise sums of the remaining columns are unaffected.
+
+        Args:
+            column_names (list[str]): columns to drop
+        """
+        keep = [i for i, col in enumerate(self.column_names) if col not in column_names]
+        self.column_names = [self.column_names[i] for i in keep]
+        if self._shift is not None:
+            self._shift = self._shift[keep]
+        self._n, self._sx, self._sxx, self._sxy = (matrix[np.ix_(keep, keep)] for matrix in (self._n, self._sx, self._sxx, self._sxy))
+
+
+    def correlation(self) -> pd.DataFrame:
+        """Return the pairwise complete correlation matrix.
+
+        Returns:
+            pd.DataFrame: correlation matrix indexed by column names
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = self._n
+            cov = self._sxy - self._sx * self._sx.T / n
+            var_x = self._sxx - self._sx * self._sx / n
+            var_y = var_x.T
+            corr = cov / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.column_names, columns=self.column_names)
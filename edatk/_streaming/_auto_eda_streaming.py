@@ -0,0 +1,371 @@
+import math
+from typing import Iterator, Optional
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+import matplotlib.pyplot as plt
+
+import edatk._core as core
+import edatk._sketches as sketches
+import edatk._single_variable._summary_statistics as sst
+import edatk._streaming._visuals as viz
+import edatk._html_report._report_builder as html_build
+from edatk._single_variable._auto_eda_single_variable import _auto_eda_column_ops
+
+
+# Upper bound on fixed histogram bins for numeric columns
+_MAX_HISTOGRAM_BINS = 200
+
+_streaming_column_visuals = {
+    'numeric': {
+        'Box Plot': viz._plot_box_from_accumulator,
+        'Histogram': viz._plot_histogram_from_accumulator,
+        'ECDF': viz._plot_ecdf_from_accumulator
+    },
+    'numeric-condensed': {
+        'Histogram': viz._plot_value_counts_from_accumulator
+    },
+    'string': {
+        'Count Plot': viz._plot_categorical_counts_from_accumulator,
+        'Count Plot %': viz._plot_categorical_percent_counts_from_accumulator
+    },
+    'bool': {
+        'Histogram': viz._plot_value_counts_from_accumulator
+    }
+}
+
+
+def _iter_path_chunks(
+        path: str,
+        chunksize: int,
+        column_list: Optional[list[str]] = None,
+        file_format: Optional[str] = None,
+        **read_kwargs
+    ) -> Iterator[pd.DataFrame]:
+    """Yield dataframe chunks from a csv or parquet file.
+
+    Args:
+        path (str): path to the file
+        chunksize (int): rows per chunk
+        column_list (list[str], optional): columns to read, if none reads all. Defaults to None.
+        file_format (str, optional): 'csv' or 'parquet', inferred from the extension if none. Defaults to None.
+        **read_kwargs: passed to pandas.read_csv for csv files
+
+    Yields:
+        pd.DataFrame: chunk of rows
+    """
+    if file_format is None:
+        file_format = 'parquet' if str(path).lower().endswith(('.parquet', '.pq')) else 'csv'
+    assert file_format in ['csv', 'parquet'], "Invalid file format, must be csv or parquet"
+
+    if file_format == 'csv':
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=column_list, **read_kwargs)
+    else:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required to profile parquet files")
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=column_list):
+            yield batch.to_pandas()
+
+
+def _to_float_array(s: pd.Series) -> np.ndarray:
+    """Coerce a chunk to a float array, values that do not parse become nan.
+
+    Args:
+        s (pd.Series): chunk values
+
+    Returns:
+        np.ndarray: float values
+    """
+    if not is_numeric_dtype(s):
+        s = pd.to_numeric(s, errors='coerce')
+    return s.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class ColumnAccumulator:
+    """Class accumulating everything needed to profile one column from a stream of chunks.
+    """
+    def __init__(self, column_name: str, first_chunk: pd.Series, hll_precision: Optional[int] = None, kind: Optional[str] = None):
+        """Create new Column Accumulator, the storage kind (numeric, bool or string) is taken from the first chunk unless passed.
+
+        Args:
+            column_name (string): column name being summarized
+            first_chunk (pd.Series): first chunk of the column
+            hll_precision (int, optional): if set, distinct values are estimated with a HyperLogLog sketch instead of an exact hash set. Defaults to None.
+            kind (str, optional): storage kind to use instead of the first chunk's. Defaults to None.
+        """
+        self.column_name = column_name
+        self.dtype = first_chunk.dtype if kind != 'string' else np.dtype(object)
+        if kind is not None:
+            self.kind = kind
+        elif is_bool_dtype(first_chunk):
+            self.kind = 'bool'
+        elif is_numeric_dtype(first_chunk):
+            self.kind = 'numeric'
+        else:
+            self.kind = 'string'
+        self.kind_changed = False
+        self.data_type = None
+        self.row_count = 0
+        self.na_count = 0
+        self.distinct = sketches.DistinctAccumulator() if hll_precision is None else sketches.HyperLogLog(hll_precision)
+        self.moments = sketches.MomentAccumulator() if self.kind == 'numeric' else None
+        self.quantiles = sketches.QuantileSketch() if self.kind == 'numeric' else None
+        self.top_counts = None if self.kind == 'numeric' else sketches.TopCountsAccumulator()
+        self.histogram = None
+
+
+    def update(self, s: pd.Series):
+        """First pass update with a chunk of the column.
+
+        Args:
+            s (pd.Series): chunk values
+        """
+        if self.kind_changed:
+            return
+        if self.kind == 'numeric':
+            # Text after numeric chunks (e.g. an all empty first chunk), the column is re-read as string rather than coerced to nan
+            values = _to_float_array(s)
+            if not is_numeric_dtype(s) and np.any(np.isnan(values) & s.notna().to_numpy()):
+                self.kind_changed = True
+                return
+        self.row_count += int(s.shape[0])
+        self.na_count += int(np.sum(pd.isna(s)))
+        self.distinct.update(s)
+        if self.kind == 'numeric':
+            if is_numeric_dtype(s):
+                self.dtype = np.result_type(self.dtype, s.dtype)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        else:
+            self.top_counts.update(s)
+
+
+    def finalize_data_type(self):
+        """Set the data type grouping once the first pass is complete.
+        """
+        if self.kind == 'numeric':
+            self.data_type = sst._classify_numeric_data_type(self.distinct.count, self.moments.min, self.moments.max)
+        else:
+            self.data_type = self.kind
+
+
+    @property
+    def needs_second_pass(self) -> bool:
+        """Whether charts need a second pass (histogram bins are only known after the first pass)."""
+        return self.kind == 'numeric'
+
+
+    def prepare_second_pass(self):
+        """Create the second pass accumulators, fixed bins for continuous columns and value counts otherwise.
+        """
+        if self.data_type == 'numeric':
+            self.histogram = sketches.HistogramAccumulator(self._get_histogram_bin_edges())
+        else:
+            self.top_counts = sketches.TopCountsAccumulator()
+
+
+    def update_second_pass(self, s: pd.Series):
+        """Second pass update with a chunk of the column.
+
+        Args:
+            s (pd.Series): chunk values
+        """
+        values = _to_float_array(s)
+        if self.histogram is not None:
+            self.histogram.update(values)
+        else:
+            self.top_counts.update(pd.Series(values[~np.isnan(values)]))
+
+
+    def _get_histogram_bin_edges(self) -> np.ndarray:
+        """Return bin edges using numpy auto rules (min width of Freedman Diaconis and Sturges) from the first pass summary.
+
+        Returns:
+            np.ndarray: bin edges
+        """
+        low, high, n = self.moments.min, self.moments.max, self.moments.count
+        if n == 0 or high <= low:
+            return np.array([low - 0.5, low + 0.5]) if n else np.array([0.0, 1.0])
+        q1, q3 = self.quantiles.quantiles([0.25, 0.75])
+        sturges_width = (high - low) / (math.log2(n) + 1.0)
+        fd_width = 2.0 * (q3 - q1) * n ** (-1.0 / 3.0)
+        width = min(fd_width, sturges_width) if fd_width > 0 else sturges_width
+        bins = int(min(max(math.ceil((high - low) / width), 1), _MAX_HISTOGRAM_BINS))
+        return np.linspace(low, high, bins + 1)
+
+
+    @property
+    def missing_count(self) -> int:
+        """Missing rows, for numeric columns this includes values that could not be parsed."""
+        if self.kind == 'numeric':
+            return self.moments.null_count
+        return self.na_count
+
+
+    def to_profile(self) -> sst.ColumnProfile:
+        """Return the column profile record used by the metric table.
+
+        Returns:
+            ColumnProfile: profile record with all summary statistics
+        """
+        profile_kwargs = {
+            'column_name': self.column_name,
+            'data_type': self.data_type,
+            'dtype': str(self.dtype),
+            'row_count': self.row_count,
+            'missing_count': self.missing_count,
+            'distinct_count': self.distinct.count
+        }
+        if 'numeric' in self.data_type:
+            quantile_values = self.quantiles.quantiles(sst._PROFILE_QUANTILES)
+            quantiles = {q: float(v) for q, v in zip(sst._PROFILE_QUANTILES, quantile_values)}
+            profile_kwargs.update({
+                'mean': self.moments.mean,
+                'std': self.moments.std,
+                'min': self.moments.min,
+                'max': self.moments.max,
+                'skew': self.moments.skew,
+                'kurtosis': self.moments.kurtosis,
+                'quantiles': quantiles
+            })
+        return sst.ColumnProfile(**profile_kwargs)
+
+
+def _accumulate_path(
+        path: str,
+        chunksize: int,
+        column_list: Optional[list[str]] = None,
+        file_format: Optional[str] = None,
+        hll_precision: Optional[int] = None,
+        **read_kwargs
+    ) -> tuple[dict[str, ColumnAccumulator], Optional[sketches.CorrelationAccumulator]]:
+    """Read the file twice in chunks and return per column summaries and numeric correlations.
+
+    Args:
+        path (str): path to the file
+        chunksize (int): rows per chunk
+        column_list (list[str], optional): columns to read, if none reads all. Defaults to None.
+        file_format (str, optional): 'csv' or 'parquet', inferred from the extension if none. Defaults to None.
+        hll_precision (int, optional): if set, distinct values are estimated with HyperLogLog sketches. Defaults to None.
+        **read_kwargs: passed to pandas.read_csv for csv files
+
+    Returns:
+        tuple: dict of column name to ColumnAccumulator, CorrelationAccumulator (None if no numeric columns)
+    """
+    column_summaries = {}
+    correlation = None
+
+    # First pass, moments, counts, sketches and correlations
+    for chunk in _iter_path_chunks(path, chunksize, column_list, file_format, **read_kwargs):
+        if not column_summaries:
+            column_summaries = {col: ColumnAccumulator(col, chunk[col], hll_precision) for col in chunk.columns}
+            numeric_columns = [col for col, summary in column_summaries.items() if summary.kind == 'numeric']
+            if len(numeric_columns) > 0:
+                correlation = sketches.CorrelationAccumulator(numeric_columns)
+        for col, column_summary in column_summaries.items():
+            column_summary.update(chunk[col])
+        if correlation is not None:
+            correlation.update(np.column_stack([_to_float_array(chunk[col]) for col in correlation.column_names]))
+
+    # Columns that turned out to hold text are accumulated again as string, and dropped from the numeric correlations
+    retyped_columns = [col for col, summary in column_summaries.items() if summary.kind_changed]
+    if len(retyped_columns) > 0:
+        for chunk_number, chunk in enumerate(_iter_path_chunks(path, chunksize, retyped_columns, file_format, **read_kwargs)):
+            for col in retyped_columns:
+                if chunk_number == 0:
+                    column_summaries[col] = ColumnAccumulator(col, chunk[col], hll_precision, kind='string')
+                column_summaries[col].update(chunk[col])
+        correlation.drop_columns(retyped_columns)
+        if len(correlation.column_names) == 0:
+            correlation = None
+
+    for column_summary in column_summaries.values():
+        column_summary.finalize_data_type()
+
+    # Second pass, fixed bin histograms now that ranges are known
+    second_pass_columns = [col for col, summary in column_summaries.items() if summary.needs_second_pass]
+    if len(second_pass_columns) > 0:
+        for col in second_pass_columns:
+            column_summaries[col].prepare_second_pass()
+        for chunk in _iter_path_chunks(path, chunksize, second_pass_columns, file_format, **read_kwargs):
+            for col in second_pass_columns:
+                column_summaries[col].update_second_pass(chunk[col])
+
+    return column_summaries, correlation
+
+
+def _auto_eda_streaming_column(column_summary: ColumnAccumulator, html_report: object, show_chart: bool):
+    """Print summary statistics and charts from an accumulated column summary.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        html_report (object): html report object to hold data and write to file
+        show_chart (bool): whether to call plt.show, can be useful to disable in command line interactions
+    """
+    section = 'single_variable'
+    column_operations = _auto_eda_column_ops[column_summary.data_type]
+    core._bind_to_console_html(section=section, run_type='table', run_dict=column_operations, html_report=html_report, show_chart=show_chart, header_text=column_summary.column_name, profile=column_summary.to_profile())
+    visual_dict = _streaming_column_visuals[column_summary.data_type]
+    core._bind_to_console_html(section, 'charts', visual_dict, html_report, show_chart=show_chart, column_summary=column_summary)
+
+
+def auto_eda_from_path(
+        path: str,
+        column_list: Optional[list[str]] = None,
+        chunksize: int = 100000,
+        file_format: Optional[str] = None,
+        save_path: Optional[str] = None,
+        ignore_errors: bool = True,
+        show_chart: bool = True,
+        approximate: bool = False,
+        hll_precision: int = 14,
+        **read_kwargs):
+    """Run auto eda on a csv or parquet file without loading it into memory.
+
+    The file is read twice in chunks. Summary statistics, quantiles and correlations come from mergeable accumulators and charts are drawn from them rather than raw rows, so pair plots and distribution fits are not produced.
+
+    Args:
+        path (str): Path to a csv or parquet (requires pyarrow) file.
+        column_list (list, optional): List of columns, if none runs for all. Defaults to None.
+        chunksize (int, optional): Rows read per chunk. Defaults to 100000.
+        file_format (str, optional): 'csv' or 'parquet', inferred from the file extension if none. Defaults to None.
+        save_path (str, optional): Directory to save html report to. If none then results printed to console instead. Defaults to None.
+        ignore_errors (bool, optional): Ignores errors and runs as much as possible. Defaults to True.
+        show_chart (bool, optional): Display charts, likely always want this as True unless testing or working with very large datasets. Defaults to True.
+        approximate (bool, optional): Estimate distinct counts with HyperLogLog sketches instead of holding every distinct value hash. Defaults to False.
+        hll_precision (int, optional): HyperLogLog precision (4 to 18) when approximate. Defaults to 14.
+        **read_kwargs: Additional arguments passed to pandas.read_csv.
+    """
+    # Initiate html file ops if needed
+    if save_path:
+        html_report = html_build.HTMLReport(save_path)
+    else:
+        html_report = None
+
+    # Accumulate all summaries out of core
+    column_summaries, correlation = _accumulate_path(path, chunksize, column_list, file_format, hll_precision if approximate else None, **read_kwargs)
+
+    # Run single column to console and bind to html if needed
+    for col, column_summary in column_summaries.items():
+        if ignore_errors:
+            try:
+                _auto_eda_streaming_column(column_summary, html_report, show_chart)
+            except:
+                error_str = f'{col} was not able to be profiled due to errors'
+                print(error_str)
+                if html_report:
+                    html_report.save_text(error_str, section='single_variable')
+                plt.close('all')
+        else:
+            _auto_eda_streaming_column(column_summary, html_report, show_chart)
+
+    # Correlation heatmap from accumulated pairwise sums
+    if correlation is not None:
+        core._bind_to_console_html(section='multi_variable', run_type='chart', run_dict={'Correlation Heatmap': viz._plot_correlation_heatmap}, html_report=html_report, show_chart=show_chart, header_text='Correlation Heatmap', correlation=correlation.correlation())
+
+    # Save off final html template
+    if html_report:
+        html_report.build_final_template()
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from edatk._single_variable._visuals import _split_top_other_counts, _get_percentage_from_counts, _plot_count_bars, _plot_box_from_sketch, _plot_ecdf_from_sketch
+from edatk._multi_variable._visuals import _plot_correlation_matrix
+
+
+def _plot_box_from_accumulator(column_summary: object, ax: object):
+    """Plot boxplot from the accumulated quantile sketch.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    _plot_box_from_sketch(column_summary.quantiles, f'{column_summary.column_name} Box Plot', ax)
+
+
+def _plot_histogram_from_accumulator(column_summary: object, ax: object):
+    """Plot histogram from fixed bin counts.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    edges = column_summary.histogram.bin_edges
+    ax.bar(edges[:-1], column_summary.histogram.counts, width=np.diff(edges), align='edge', alpha=0.75, edgecolor='white')
+    ax.set_title(f'{column_summary.column_name} Histogram')
+
+
+def _plot_value_counts_from_accumulator(column_summary: object, ax: object):
+    """Plot histogram of a low cardinality column from its value counts.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    vcounts = column_summary.top_counts.counts.sort_index()
+    ax.bar([str(x) for x in vcounts.index], vcounts.values, alpha=0.75, edgecolor='white')
+    ax.set_title(f'{column_summary.column_name} Histogram')
+
+
+def _plot_ecdf_from_accumulator(column_summary: object, ax: object):
+    """Plot ecdf from the accumulated quantile sketch.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    _plot_ecdf_from_sketch(column_summary.quantiles, f'{column_summary.column_name} ECDF', ax)
+
+
+def _get_summarized_counts(column_summary: object) -> pd.Series:
+    """Return top 5, Other and Missing counts from accumulated value counts.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+
+    Returns:
+        pd.Series: summarized counts
+    """
+    return _split_top_other_counts(column_summary.top_counts.counts, topn=5, na_row_count=column_summary.missing_count, other_count=column_summary.top_counts.other_count)
+
+
+def _plot_categorical_counts_from_accumulator(column_summary: object, ax: object):
+    """Plot bars with counts of the various values in the column.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    _plot_count_bars(_get_summarized_counts(column_summary), f'{column_summary.column_name} Count Plot', ax)
+
+
+def _plot_categorical_percent_counts_from_accumulator(column_summary: object, ax: object):
+    """Plot bars with count percents of the various values in the column.
+
+    Args:
+        column_summary (ColumnAccumulator): accumulated column summary
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    summarized_col = _get_percentage_from_counts(_get_summarized_counts(column_summary)) * 100.0
+    _plot_count_bars(summarized_col, f'{column_summary.column_name} % Count Plot', ax, percent=True)
+
+
+def _plot_correlation_heatmap(correlation: pd.DataFrame, ax: object):
+    """Plot heatmap of an accumulated correlation matrix.
+
+    Args:
+        correlation (pd.DataFrame): correlation matrix
+        ax (matplotlib ax object): ax to plot chart on
+    """
+    _plot_correlation_matrix(correlation, ax)
@@ -1,9 +1,16 @@
 import pytest
+import time
+import json
+import subprocess
+import tempfile
+import sys
 import pandas as pd
 import numpy as np
 import seaborn as sns
+import scipy.stats as stats
 from sklearn.metrics import mean_absolute_error
 from sklearn.linear_model import LinearRegression
+from sklearn.dummy import DummyRegressor
 
 
 import warnings
@@ -13,7 +20,26 @@ warnings.filterwarnings("ignore", message="FixedFormatter should only be used to
 
 import edatk._single_variable._summary_statistics as sst
 from edatk._auto_eda import auto_eda
+import edatk._multi_variable._auto_eda_multi_variable as mv
 from edatk._modeling._cross_val_custom import cross_validate_custom
+from edatk._streaming._auto_eda_streaming import auto_eda_from_path
+import edatk._streaming._auto_eda_streaming as streaming
+import edatk._sketches as sketches
+import edatk as eda
+import edatk._single_variable._visuals as sviz
+import edatk._single_variable._auto_eda_single_variable as single_variable
+import edatk._multi_variable._visuals as mviz
+import matplotlib.pyplot as plt
+from edatk._core import get_fig_ax
+import edatk._kde as kde
+import edatk._core as core
+from edatk._single_variable._cardinality_reduction import _add_low_cardinality_target_column
+import edatk._html_report._report_builder as html_build
+from edatk._multi_variable._correlation import CorrelationEngine
+import edatk._scheduler as scheduler
+import edatk._modeling._fold_data as fold_data
+from benchmark.synthetic_data import make_synthetic_frame
+from benchmark.run_benchmarks import run_benchmarks, compare_results
 
 
 def _get_sns_test_datasets(small_list=True):
@@ -71,11 +97,54 @@ def test_distinct_count():
     assert int(sst._op_distinct_count(_get_test_df(), 'category')) == 5
 
 
+def test_distinct_count_approximate(monkeypatch):
+    df = pd.DataFrame({'id': np.arange(20000).astype(str)})
+    assert int(sst._op_distinct_count(_get_test_df(), 'category', hll_precision=14)) == 5
+    assert abs(sst._op_distinct_count(df, 'id', hll_precision=14) - 20000) < 20000 * 0.03
+    left, right = sketches.HyperLogLog(12), sketches.HyperLogLog(12)
+    left.update(df['id'][:12000])
+    right.update(df['id'][8000:])
+    left.merge(right)
+    assert abs(left.count - 20000) < 20000 * 0.05
+
+    # Estimated once per column and run, type inference and the profile share it
+    updates = []
+    original_update = sketches.HyperLogLog.update
+    monkeypatch.setattr(sketches.HyperLogLog, 'update', lambda self, s: updates.append(1) or original_update(self, s))
+    numeric_df = pd.DataFrame({'x': np.arange(50000) % 1000})
+    column_types = sst._get_column_type_index(numeric_df, hll_precision=12)
+    sst._op_column_profile(numeric_df, 'x', data_type=column_types['x'], hll_precision=12)
+    sst._clear_run_cache()
+    assert len(updates) == 1
+
+
 def test_data_type():
     assert sst._op_get_column_data_type(_get_test_df(), 'category') == 'string'
     assert sst._op_get_column_data_type(_get_test_df(), 'metric') == 'numeric-condensed'
 
 
+def test_column_type_index():
+    column_types = sst._get_column_type_index(_get_test_df())
+    assert dict(column_types) == {'metric': 'numeric-condensed', 'category': 'string'}
+    with pytest.raises(TypeError):
+        column_types['metric'] = 'numeric'
+
+
+def test_column_profile():
+    df = _get_test_df()
+    profile = sst._op_column_profile(df, 'metric')
+    assert profile.row_count == 6
+    assert profile.missing_count == 1
+    assert round(profile.missing_ratio, 4) == round(1 / 6, 4)
+    assert round(profile.mean, 2) == round(sst._op_mean(df, 'metric'), 2)
+    assert round(profile.std, 4) == round(sst._op_standard_deviation(df, 'metric'), 4)
+    assert round(profile.median, 2) == round(sst._op_median(df, 'metric'), 2)
+    assert round(profile.quantile(0.75), 4) == round(sst._op_quantile(df, 'metric', 0.75), 4)
+    assert round(profile.skew, 4) == round(float(stats.skew(df['metric'].dropna())), 4)
+    assert round(profile.kurtosis, 4) == round(float(stats.kurtosis(df['metric'].dropna())), 4)
+    assert sst._op_column_profile(df, 'category').mean is None
+
+
 def test_cv():
     df = sns.load_dataset('diamonds')
     y = df.pop('price')
@@ -96,3 +165,353 @@ def test_sns_datasets():
     for i, ds in enumerate(ds_list):
         print(f'Running dataset {i}')
         auto_eda(ds, ignore_errors=False, show_chart=False)
+
+
+def test_auto_eda_parallel_columns(tmp_path):
+    df = _get_test_df()
+    auto_eda(df, save_path=str(tmp_path), ignore_errors=False, show_chart=False, n_jobs=2)
+    report = (tmp_path / 'html_report' / 'report.html').read_text()
+    assert report.index('>metric<') < report.index('>category<')
+
+
+def test_relationship_page_worker():
+    df = _get_test_df()
+    args = mv._relationship_page_args(df, [('metric', 'category')], None, {'metric': 'numeric-condensed', 'category': 'string'}, 'default')
+    buffered_report = mv._relationship_page_worker(*args)
+    assert [component[0] for component in buffered_report.components] == ['png']
+
+
+def test_moment_accumulator_merge():
+    values = np.random.default_rng(0).lognormal(size=10000)
+    left, right = sketches.MomentAccumulator(), sketches.MomentAccumulator()
+    left.update(values[:3000])
+    right.update(values[3000:])
+    left.merge(right)
+    assert left.count == 10000
+    assert round(left.mean, 6) == round(np.mean(values), 6)
+    assert round(left.std, 6) == round(np.std(values), 6)
+    assert round(left.skew, 6) == round(float(stats.skew(values)), 6)
+    assert round(left.kurtosis, 6) == round(float(stats.kurtosis(values)), 6)
+
+
+def test_quantile_sketch():
+    values = np.random.default_rng(0).normal(size=100000)
+    sketch = sketches.QuantileSketch()
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    estimates = sketch.quantiles([0.25, 0.5, 0.75])
+    ranks = np.searchsorted(np.sort(values), estimates) / values.shape[0]
+    assert np.all(np.abs(ranks - np.array([0.25, 0.5, 0.75])) < 0.02)
+
+
+def test_quantiles_sketch_backend():
+    df = pd.DataFrame({'x': np.random.default_rng(1).exponential(size=50000)})
+    exact = sst._op_quantiles(df, 'x', [0.0, 0.5, 0.9, 1.0])
+    approx = sst._op_quantiles(df, 'x', [0.0, 0.5, 0.9, 1.0], quantile_sketch_k=200)
+    sst._clear_column_cache()
+    assert approx[0] == exact[0] and approx[-1] == exact[-1]
+    ranks = np.searchsorted(np.sort(df['x'].values), approx[1:3]) / df.shape[0]
+    assert np.all(np.abs(ranks - np.array([0.5, 0.9])) < 0.02)
+
+
+def test_in_memory_sketch_charts_only(monkeypatch):
+    df = pd.DataFrame({'x': np.random.default_rng(2).exponential(size=50000)})
+    sketched = []
+    original_update = sketches.QuantileSketch.update
+    monkeypatch.setattr(sketches.QuantileSketch, 'update', lambda self, values: sketched.append(len(values)) or original_update(self, values))
+    auto_eda(df, approximate=True, ignore_errors=False, show_chart=False)
+    assert sum(sketched) == 50000 and max(sketched) <= sst._QUANTILE_SKETCH_CHUNK_SIZE
+
+
+def test_theoritical_distributions_cached():
+    df = pd.DataFrame({'x': np.random.default_rng(2).normal(size=50000)})
+    all_distributions, rankings = sst._get_theoritical_distributions(df, 'x')
+    assert sst._get_theoritical_distributions(df, 'x')[1] is rankings
+    fit_sample = sst._get_distribution_fit_sample(df['x'].to_numpy(), 100)
+    assert fit_sample.shape[0] == 100 and (np.diff(fit_sample) >= 0).all() and fit_sample[[0, -1]].tolist() == [df['x'].min(), df['x'].max()]
+    sst._clear_column_cache()
+    assert rankings['distribution_type'].values[0] in ('norm', 't')
+    assert set(all_distributions['distribution_type']) == {'original data', 'norm', 'expon', 'uniform', 'lognorm', 't'}
+
+
+class _SlowNormal:
+    def fit(self, values):
+        time.sleep(30)
+        return stats.norm.fit(values)
+
+    def pdf(self, x, *args):
+        return stats.norm.pdf(x, *args)
+
+
+def test_distribution_fit_timeout():
+    df = pd.DataFrame({'x': np.random.default_rng(3).normal(size=2000)})
+    candidates = {'norm': stats.norm, 'slow': _SlowNormal()}
+    start = time.monotonic()
+    _, rankings = sst._get_theoritical_distributions(df, 'x', candidates, fit_timeout=2)
+    assert sst._get_distribution_fit_timeouts(df, 'x', candidates, fit_timeout=2) == ['slow']
+    assert list(sst._get_theoritical_distributions(df, 'x', {'norm': stats.norm}, fit_timeout=2)[1]['distribution_type']) == ['norm']
+    assert sst._get_distribution_fit_timeouts(df, 'x', {'norm': stats.norm}, fit_timeout=2) == []
+    sst._clear_column_cache()
+    sst._clear_run_cache()
+    assert time.monotonic() - start < 20
+    assert list(rankings['distribution_type']) == ['norm']
+
+
+def test_distribution_fit_timeout_in_workers(tmp_path):
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({'a': rng.normal(size=500), 'b': rng.lognormal(size=500)})
+    eda.register_distribution('slow', _SlowNormal())
+    try:
+        start = time.monotonic()
+        run_stats = auto_eda(df, save_path=str(tmp_path), ignore_errors=False, show_chart=False, n_jobs=2, distribution_fit_timeout=1)
+    finally:
+        eda.unregister_distribution('slow')
+    assert time.monotonic() - start < 25
+    assert [(skipped['column'], skipped['op'], skipped['reason']) for skipped in run_stats.skipped_ops] == [('a', 'slow Distribution Fit', 'fit timeout'), ('b', 'slow Distribution Fit', 'fit timeout')]
+    assert 'slow distribution fit exceeded 1 seconds' in (tmp_path / 'html_report' / 'report.html').read_text()
+
+
+def test_distribution_registry():
+    eda.register_distribution('gamma')
+    assert 'gamma' in eda.list_distributions()
+    eda.unregister_distribution('gamma')
+    assert 'gamma' not in eda.list_distributions()
+
+
+def test_correlation_engine():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({'a': rng.normal(size=500), 'c': rng.choice(['x', 'y'], 500)})
+    df['b'] = df['a'] * 2 + rng.normal(size=500)
+    engine = CorrelationEngine(df)
+    assert engine.numeric_columns == ['a', 'b']
+    pd.testing.assert_frame_equal(engine.correlation(), df[['a', 'b']].corr())
+    pd.testing.assert_frame_equal(engine.correlation('spearman'), df[['a', 'b']].corr(method='spearman'))
+    assert engine.correlation() is engine.correlation()
+    df.loc[::7, 'a'] = np.nan
+    np.testing.assert_allclose(CorrelationEngine(df).correlation().values, df[['a', 'b']].corr().values)
+
+
+def test_select_column_pairs():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({'a': rng.normal(size=1000), 'noise': rng.normal(size=1000), 'group': rng.choice(['x', 'y', 'z'], 1000)})
+    df['b'] = df['a'] + rng.normal(scale=0.1, size=1000)
+    df['shifted'] = df['group'].map({'x': 0.0, 'y': 5.0, 'z': 10.0}) + rng.normal(size=1000)
+    column_types = sst._get_column_type_index(df)
+    pairs = mv._get_column_combinations(df)
+    assert mv._select_column_pairs(df, pairs, column_types) == pairs
+    assert mv._select_column_pairs(df, pairs, column_types, max_pairs=2) == [('a', 'b'), ('group', 'shifted')]
+    assert mv._select_column_pairs(df, pairs, column_types, pair_threshold=1.01) == []
+    auto_eda(df.iloc[:200], pair_threshold=1.01, ignore_errors=False, show_chart=False)
+
+
+def test_target_only_relationships():
+    df = _get_test_df()
+    df['double'] = df['metric'] * 2
+    _add_low_cardinality_target_column(df, 'metric', 3)
+    report = html_build.BufferedReport()
+    mv._auto_eda_mutli_variable(df, target_column='metric', html_report=report, show_chart=False, top_non_target_pairs=1)
+    titles = [value for render_type, _, value in report.components if render_type == 'title']
+    assert titles[:2] == ['Column Relationships', 'Top Non-Target Relationships']
+
+
+def test_paged_charts():
+    run_dict = {f'chart_{i}': (lambda ax: ax.plot([0, 1])) for i in range(23)}
+    assert [len(page) for page in core._get_chart_pages(run_dict, 10)] == [10, 10, 3]
+    report = html_build.BufferedReport()
+    core._bind_to_console_html('multi_variable', 'charts', run_dict, report, show_chart=False, page_size=10)
+    assert [render_type for render_type, _, _ in report.components] == ['png', 'png', 'png']
+
+
+def test_numeric_aggregates():
+    values = np.random.default_rng(6).normal(size=20000)
+    df = pd.DataFrame({'x': np.append(values, np.nan)})
+    aggregates = sst._op_numeric_aggregates(df, 'x')
+    sst._clear_column_cache()
+    assert aggregates.count == 20000 and aggregates.bin_counts.sum() == 20000
+    assert aggregates.ecdf_values.shape[0] == sst._MAX_AGGREGATE_POINTS and aggregates.ecdf_probabilities[-1] == 1.0
+    assert np.isclose(aggregates.box_stats['med'], np.median(values))
+    assert abs(np.trapz(aggregates.kde_density, aggregates.kde_grid) - 1.0) < 0.01
+    assert np.array_equal(sst._get_histogram_bin_edges(values), np.histogram_bin_edges(values, bins='auto'))
+
+
+def test_histogram_bins_capped():
+    df = pd.DataFrame({'x': np.random.default_rng(8).standard_cauchy(size=200000)})
+    aggregates = sst._op_numeric_aggregates(df, 'x')
+    sst._clear_column_cache()
+    assert aggregates.bin_counts.shape[0] == sst._MAX_HISTOGRAM_BINS and aggregates.bin_counts.sum() == 200000
+
+
+def test_auto_eda_fast_render():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.integers(0, 3, 300), 'c': rng.choice(['x', 'y', 'z', 'w', 'v'], 300), 'd': rng.normal(size=300)})
+    auto_eda(df, target_column='a', top_non_target_pairs=2, render_mode='fast', ignore_errors=False, show_chart=False)
+
+
+def test_density_scatter():
+    rng = np.random.default_rng(9)
+    df = pd.DataFrame({'x': rng.normal(size=5000), 'y': rng.normal(size=5000), 'hue': rng.choice(['p', 'q'], 5000)})
+    df.loc[::10, 'y'] = np.nan
+    fig, axs, _ = get_fig_ax(1)
+    mviz._plot_density_scatter(df, 'x', 'y', axs[0, 0], hue_column='hue', palette={'p': 'tab:orange', 'q': 'tab:purple'})
+    assert axs[0, 0].get_title().endswith('density of n=4500')
+    assert sorted(text.get_text() for text in axs[0, 0].get_legend().get_texts()) == ['p', 'q']
+    plt.close('all')
+
+
+def test_binned_kde_grouped():
+    rng = np.random.default_rng(8)
+    groups = [rng.normal(0, 1, 4000), rng.exponential(2, 1000)]
+    values = np.concatenate(groups)
+    codes = np.repeat([0, 1], [4000, 1000])
+    grid, densities = kde._binned_kde_grouped(values, codes, 3, gridsize=512)
+    for group_values, density in zip(groups, densities):
+        inside = ~np.isnan(density)
+        np.testing.assert_allclose(density[inside], stats.gaussian_kde(group_values)(grid[inside]), atol=2e-3)
+    assert np.all(np.isnan(densities[2]))
+
+
+def test_swarm_budget():
+    assert core._get_swarm_sample_size([100000], 1000, time_budget=0.5) < 1000
+    assert core._get_swarm_sample_size([30], 1000) == 30
+    assert core._get_swarm_sample_size([1000] * 4, 1000, time_budget=0.5) > core._get_swarm_sample_size([4000], 1000, time_budget=0.5)
+    assert scheduler.TimeBudget(1.0).swarm_seconds == core._get_swarm_time_budget(1.0) < core._SWARM_TIME_BUDGET
+    rng = np.random.default_rng(10)
+    df = pd.DataFrame({'x': rng.normal(size=2000), 'c': rng.choice(list('abcde'), 2000)})
+    fig, axs, _ = get_fig_ax(3)
+    axs = axs.flatten()
+    sviz._plot_swarm(df, 'x', axs[0])
+    assert axs[0].get_title().startswith('x Swarmplot')
+    swarm_budget = scheduler.TimeBudget(0.1).swarm_seconds
+    single_variable._get_column_visuals('numeric', swarm_budget=swarm_budget)['Swarm'](df, 'x', axs[1])
+    assert axs[1].get_title() == 'x Stripplot 1000 max sample (swarm over time budget)'
+    mviz._plot_relationship(df, 'c', 'x', axs[2], swarm_budget=0.001)
+    assert 'strip (swarm over time budget)' in axs[2].get_title()
+    plt.close('all')
+
+
+def test_time_budget(capsys):
+    time_budget = scheduler.TimeBudget(1.0)
+    time_budget.plan({('x', 'Summary Table'): (0, 0.05), ('x', 'Histogram'): (1, 0.3), ('x', 'Swarm'): (3, 0.9), ('x', 'ECDF'): (2, 0.1)})
+    assert list(time_budget.filter_run_dict({'Histogram': None, 'Swarm': None, 'ECDF': None}, 'x')) == ['Histogram', 'ECDF']
+    assert [(skipped['op'], skipped['reason']) for skipped in time_budget.skipped_ops] == [('Swarm', 'left out of plan')]
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'a': rng.lognormal(size=500), 'c': rng.choice(['x', 'y'], 500)})
+    auto_eda(df, ignore_errors=False, show_chart=False, time_budget=0.5)
+    assert 'a Swarm' in capsys.readouterr().out
+
+
+def test_run_stats(tmp_path, capsys):
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({'a': rng.normal(size=300), 'c': rng.choice(['x', 'y'], 300)})
+    run_stats = auto_eda(df, save_path=str(tmp_path), ignore_errors=False, show_chart=False, n_jobs=2, trace_memory=True, performance_section=True)
+    stats_df = run_stats.to_dataframe()
+    assert {'Column Profile', 'Histogram', 'Count Plot', 'Page Save', 'a-c', 'Report Template'} <= set(stats_df['op'])
+    assert (stats_df['wall_seconds'] >= 0).all() and stats_df['peak_memory_bytes'].notna().all()
+    assert run_stats.summary('column').loc['a', 'ops'] == stats_df[stats_df['column'] == 'a'].shape[0]
+    run_stats.to_json(str(tmp_path / 'stats.json'))
+    assert json.loads((tmp_path / 'stats.json').read_text())['total_wall_seconds'] == run_stats.total_wall_seconds
+    assert 'Slowest Ops' in (tmp_path / 'html_report' / 'report.html').read_text()
+
+
+def test_synthetic_benchmark():
+    df = make_synthetic_frame(rows=1000, columns=7, dtype_mix={'numeric': 3, 'string': 2, 'bool': 2}, cardinality=5, null_rate=0.1, skew=1.0, random_state=1)
+    assert df.equals(make_synthetic_frame(rows=1000, columns=7, dtype_mix={'numeric': 3, 'string': 2, 'bool': 2}, cardinality=5, null_rate=0.1, skew=1.0, random_state=1))
+    assert list(df.columns) == ['numeric_0', 'numeric_1', 'numeric_2', 'string_0', 'string_1', 'bool_0', 'bool_1']
+    assert df['string_0'].nunique() == 5 and 0.05 < df['numeric_0'].isna().mean() < 0.15
+    assert dict(sst._get_column_type_index(df))['bool_0'] == 'bool'
+    results = run_benchmarks(rows=500, columns=4, repeats=1, max_pairs=1, stages=['type_inference', 'heatmap'])
+    assert list(results['stages']) == ['type_inference', 'heatmap']
+    assert compare_results(results, results) == {'type_inference': 1.0, 'heatmap': 1.0}
+
+
+def test_lazy_imports():
+    check = "import sys, edatk; from edatk import cross_validate_custom; print(sorted(m for m in ('seaborn', 'matplotlib.pyplot', 'scipy.stats', 'jinja2', 'sklearn') if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+    assert eda.auto_eda is auto_eda and 'RunStats' in dir(eda)
+
+
+def test_cv_parallel():
+    df = make_synthetic_frame(rows=2000, columns=3, dtype_mix={'numeric': 1}, random_state=2)
+    y = df.pop('numeric_0') + 2 * df['numeric_1']
+    model = LinearRegression()
+    serial_scores = cross_validate_custom(df, y, LinearRegression(), mean_absolute_error)
+    assert np.allclose(cross_validate_custom(df, y, model, mean_absolute_error, n_jobs=2), serial_scores)
+    assert cross_validate_custom(df, y, model, mean_absolute_error, n_jobs=2, backend='thread') == serial_scores
+    assert not hasattr(model, 'coef_')
+
+
+def test_shared_fold_data(tmp_path):
+    df = make_synthetic_frame(rows=100, columns=3, dtype_mix={'numeric': 1}, random_state=3)
+    df.index = df.index * 2
+    X_handle, y_handle = fold_data._share_data(df, str(tmp_path), 'X'), fold_data._share_data(df['numeric_0'], str(tmp_path), 'y')
+    assert all('path' in block for block in X_handle['blocks']) and 'path' in y_handle
+    fold_data._init_fold_worker(X_handle, y_handle)
+    assert fold_data._worker_data['X'].equals(df) and fold_data._worker_data['y'].equals(df['numeric_0'])
+    rows = fold_data._run_shared_fold(lambda model, X_train, y_train, X_test, y_test: (X_train, y_test), None, np.array([0, 2]), np.array([1]))
+    assert rows[0].equals(df.iloc[[0, 2]]) and rows[1].equals(df['numeric_0'].iloc[[1]])
+
+    # Mixed int, float and text columns map the numeric runs and carry only the text columns
+    mixed_df = pd.DataFrame({'i': np.arange(6), 'f': np.linspace(0, 1, 6), 'g': np.ones(6), 's': list('abcdef'), 'j': np.arange(6) * 2})
+    mixed_handle = fold_data._share_data(mixed_df, str(tmp_path), 'mixed')
+    assert [list(block['columns']) for block in mixed_handle['blocks'] if 'path' in block] == [['i'], ['f', 'g'], ['j']]
+    shared_df = fold_data._load_shared_data(mixed_handle)
+    assert shared_df.equals(mixed_df) and not shared_df['f'].to_numpy().flags.writeable
+    assert fold_data._get_shared_nbytes(mixed_df) == 6 * 8 * 4
+    assert fold_data._get_shared_folder(1 << 60) == tempfile.gettempdir()
+
+
+def test_cv_splitters_and_cache(tmp_path, monkeypatch):
+    df = make_synthetic_frame(rows=300, columns=3, dtype_mix={'numeric': 1}, random_state=4)
+    y = (df.pop('numeric_0') > 0).astype(int)
+    groups = np.arange(300) % 10
+    assert len(cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, splitter='stratified', n_splits=3, n_repeats=2)) == 6
+    assert len(cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, splitter='group', groups=groups)) == 5
+    assert len(cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, splitter='time_series', n_splits=4)) == 4
+    with pytest.raises(AssertionError):
+        cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, splitter='time_series', n_repeats=2)
+
+    # Reruns load every fold from the cache, changed parameters refit
+    scores = cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, cache_dir=str(tmp_path))
+    fit_calls = []
+    monkeypatch.setattr(LinearRegression, 'fit', lambda self, X, y: fit_calls.append(1) or self)
+    assert cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, cache_dir=str(tmp_path)) == scores and not fit_calls
+    with pytest.raises(Exception):
+        cross_validate_custom(df, y, LinearRegression(fit_intercept=False), mean_absolute_error, cache_dir=str(tmp_path))
+    assert fit_calls
+
+
+def test_cv_early_stopping():
+    df = make_synthetic_frame(rows=500, columns=3, dtype_mix={'numeric': 1}, random_state=5)
+    y = df.pop('numeric_0') + 3 * df['numeric_1']
+    models = [DummyRegressor(), LinearRegression(), DummyRegressor(strategy='median')]
+    full_scores = cross_validate_custom(df, y, models, mean_absolute_error, n_splits=10)
+    raced_scores = cross_validate_custom(df, y, models, mean_absolute_error, n_splits=10, early_stopping=True)
+    assert [len(scores) for scores in full_scores] == [10, 10, 10]
+    assert [len(scores) for scores in raced_scores] == [2, 10, 2]
+    assert raced_scores[1] == full_scores[1] and raced_scores[0] == full_scores[0][:2]
+    assert len(cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, n_splits=10, early_stopping=True, threshold=0.01)) == 2
+    assert len(cross_validate_custom(df, y, LinearRegression(), mean_absolute_error, n_splits=10, early_stopping=True, threshold=5.0)) == 10
+
+
+def test_auto_eda_from_path(tmp_path):
+    csv_path = str(tmp_path / 'test.csv')
+    _get_test_df().to_csv(csv_path, index=False)
+    auto_eda_from_path(csv_path, chunksize=2, ignore_errors=False, show_chart=False)
+
+
+def test_streaming_column_retype(tmp_path):
+    csv_path = str(tmp_path / 'mixed.csv')
+    df = _get_test_df()
+    df['late_text'] = [None, None, 1.5, 'x', 'y', 'x']
+    df['number'] = [1, 2, 3, 4, 5, 7]
+    df.to_csv(csv_path, index=False)
+    column_summaries, correlation = streaming._accumulate_path(csv_path, chunksize=2)
+    assert column_summaries['late_text'].kind == 'string' and column_summaries['late_text'].data_type == 'string'
+    assert column_summaries['late_text'].distinct.count == 3 and column_summaries['late_text'].missing_count == 2
+    assert correlation.column_names == ['metric', 'number']
+    auto_eda_from_path(csv_path, chunksize=2, ignore_errors=False, show_chart=False)
+    distinct = sketches.DistinctAccumulator()
+    for chunk in np.array_split(np.arange(5000) % 3000, 7):
+        distinct.update(pd.Series(chunk))
+    assert distinct.count == 3000